@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""오래된 달의 데이터를 월별 아카이브 파일로 이동
+
+사용법:
+    python scripts/archive.py                 # config.yaml의 hot_months 기준
+    python scripts/archive.py --hot-months 1  # 이번 달 + 지난 1개월만 남김
+    python scripts/archive.py --vacuum        # 이동 후 본 DB 파일 축소
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import yaml
+from archiver import Archiver
+from database import Database
+
+
+def main():
+    parser = argparse.ArgumentParser(description='월별 아카이브')
+    parser.add_argument('--hot-months', type=int, default=None, help='본 DB에 남길 지난 달 수')
+    parser.add_argument('--vacuum', action='store_true', help='이동 후 VACUUM (실행 중 수집 쓰기 대기)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    # 설정 로드
+    config_file = Path(__file__).parent.parent / 'config.yaml'
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    db_path = Path(__file__).parent.parent / config['database']['path']
+    db = Database(str(db_path))
+
+    archiver = Archiver(config, db)
+    if args.hot_months is not None:
+        archiver.hot_months = args.hot_months
+    moved = archiver.run_once()
+    print(f"✅ 아카이브 완료: 기사 {moved:,}개 ({archiver.cutoff()} 이전)")
+
+    if args.vacuum:
+        before = db_path.stat().st_size
+        db.vacuum()
+        print(f"🧹 VACUUM: {before / 1e6:,.1f}MB → {db_path.stat().st_size / 1e6:,.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
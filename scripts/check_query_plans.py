@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Database 쿼리 실행 계획 점검
+
+Database의 모든 공개 메서드를 임시 DB에 실행해 나가는 SQL을 모으고,
+EXPLAIN QUERY PLAN에 인덱스 없는 테이블 스캔이나 임시 정렬이 있으면 실패 (종료 코드 1)
+
+사용법:
+    python scripts/check_query_plans.py
+"""
+
+import inspect
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from database import Database
+
+ARTICLE = {
+    'title': 'KF-21 test flight',
+    'url': 'https://example.com/kf21',
+    'source': 'Example',
+    'published_date': '2026-01-01',
+    'summary': 'Summary.',
+    'category': 'korea',
+    'score': 10,
+}
+
+# 아카이브 예시 달 (이 달에 만든 기사를 archive_month가 옮긴 뒤 기간 조회가 아카이브를 포함)
+ARCHIVE_MONTH = '2026-01'
+
+# 메서드별 예시 인자 (새 메서드를 추가하면 여기에도 추가해야 점검 통과)
+SAMPLE_CALLS = {
+    'get_statistics': (),
+    'archive_month': (ARCHIVE_MONTH,),
+    'get_archivable_months': ('2026-04-01',),
+    'get_articles': ('2026-01-01', '2027-01-01', 'Example', 'korea', 100),
+    'vacuum': (),
+    'get_daily_counts': (30,),
+    'rebuild_statistics': (),
+    'rebuild_search_index': (),
+    'get_latest_articles': (10,),
+    'get_wiki_changes': (10, '2026-01-01', '2027-01-01'),
+    'get_top_articles': (20,),
+    'search_articles': ('KF-21 시험 비행', 20, 0, 'Example', 'korea', 5, '2026-01-01', '2027-01-01'),
+    'get_feed_health': (),
+    'save_feed_health': ({
+        'feed_name': 'Example', 'state': 'closed', 'failures': 0, 'opened_at': 0,
+        'skips': 0, 'polls': 1, 'articles': 1, 'last_error': None,
+    },),
+    'get_feed_timestamps': ('Example', 50),
+    'insert_articles': ([dict(ARTICLE)],),
+    'update_articles': ([dict(ARTICLE, title='KF-21 first flight')],),
+    'update_translations': ([(ARTICLE['url'], 'KF-21 시험 비행')],),
+    'get_untranslated_articles': (200, 5),
+    'count_untranslated_articles': (),
+    'update_translations_by_id': ([('KF-21 시험 비행', 1, 'KF-21 first flight')],),
+    'get_untranslated_summaries': (200, 5),
+    'update_summary_translations': ([('요약.', 1, 'Summary.')],),
+    'get_cluster_signatures': (),
+    'get_unclustered_articles': (),
+    'get_existing_ids': ([1, 2],),
+    'get_archived_entries': (f'{ARCHIVE_MONTH}-01',),
+    'set_clusters': ([(123, 1, 1)],),
+    'save_article_text': (1, 'Full text.', 'ok'),
+    'get_translation_memory': (['key'],),
+    'save_translation_memory': ([('key', 'Hello', '안녕', 'EN', 'KO')],),
+    'add_translation_usage': ('2026-01', 100, 500000),
+    'set_translation_usage': ('2026-01', 100, 500000, 0),
+    'get_translation_usage': ('2026-01',),
+    'get_recent_scores': (7,),
+    'get_article_text': (1,),
+    'get_articles_without_text': (1000,),
+    'raise_score': (1, 20),
+    'get_rescore_progress': (),
+    'count_articles_after': (0,),
+    'get_articles_for_rescore': (0, 2000),
+    'apply_rescore_batch': ([(10, 1)], 1, 'hash'),
+    'count_labeled_articles': (0, 48),
+    'get_labeled_articles': (0, 48, 5000),
+    'mark_as_used': (1,),
+    'get_feed_cache': ('https://example.com/feed',),
+    'save_feed_cache': ('https://example.com/feed', None, None, 'hash'),
+}
+
+# 의도적으로 전체를 훑는 쿼리 (시작 시 한 번 재구성 / 피드 수만큼의 작은 테이블)
+FULL_SCAN_ALLOWED = {
+    'get_cluster_signatures',
+    'get_articles_without_text',
+    'get_feed_health',
+    'rebuild_statistics',
+    'rebuild_search_index',
+}
+
+# 세션/연결 관리 메서드
+NOT_QUERIES = {'read', 'write', 'close', 'init_tables', 'conn', 'archive_path'}
+
+
+def plan_problems(db, sql):
+    """인덱스 없는 스캔 / 임시 B-트리 정렬 목록"""
+    with db.read() as cursor:
+        if 'archive.' not in sql:
+            plan = [row[3] for row in cursor.execute(f'EXPLAIN QUERY PLAN {sql}')]
+        else:
+            # 아카이브 쿼리는 예시 달 파일을 붙여서 확인
+            path = db.archive_path(ARCHIVE_MONTH).resolve()
+            cursor.execute('ATTACH DATABASE ? AS archive', (f'{path.as_uri()}?mode=ro',))
+            try:
+                plan = [row[3] for row in cursor.execute(f'EXPLAIN QUERY PLAN {sql}')]
+            finally:
+                cursor.execute('DETACH DATABASE archive')
+    # WITH로 미리 구한 중간 결과(CTE)와 스키마 목록(sqlite_master)은 작아서 스캔 허용
+    allowed = set(re.findall(r'(?:WITH|,)\s+(\w+)\s+AS\b', sql, re.IGNORECASE))
+    allowed |= {'sqlite_master', 'main.sqlite_master', 'archive.sqlite_master'}
+    return [
+        step for step in plan
+        if (step.startswith('SCAN ') and ' INDEX' not in step and step.split()[1] not in allowed)
+        or 'TEMP B-TREE' in step
+    ]
+
+
+def main():
+    methods = [
+        name for name, _ in inspect.getmembers(Database, inspect.isfunction)
+        if not name.startswith('_') and name not in NOT_QUERIES
+    ]
+    missing = [name for name in methods if name not in SAMPLE_CALLS]
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / 'plans.db'))
+        db.insert_articles([dict(ARTICLE, url='https://example.com/old')])
+        with db.write() as cursor:
+            cursor.execute("UPDATE rss_articles SET created_at = ? WHERE url = 'https://example.com/old'",
+                           (f'{ARCHIVE_MONTH}-15 09:00:00',))
+            cursor.execute("INSERT INTO wiki_changes (page_title, detected_at) VALUES ('K2 Black Panther', ?)",
+                           (f'{ARCHIVE_MONTH}-15 09:00:00',))
+        statements = []
+        for session in (db.read, db.write):
+            with session() as cursor:
+                cursor.connection.set_trace_callback(statements.append)
+
+        checked = 0
+        for name in methods:
+            if name not in SAMPLE_CALLS:
+                continue
+            statements.clear()
+            result = getattr(db, name)(*SAMPLE_CALLS[name])
+            if inspect.isgenerator(result) or hasattr(result, 'fetchall'):
+                list(result)
+
+            for sql in list(statements):
+                if not sql.lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE', 'WITH')):
+                    continue
+                # FTS5가 내부 테이블에 보내는 쿼리 ('main'.'..._config' 등)
+                if "'main'." in sql or "'archive'." in sql:
+                    continue
+                checked += 1
+                problems = plan_problems(db, sql)
+                if problems and name not in FULL_SCAN_ALLOWED:
+                    failures.append((name, ' '.join(sql.split()), problems))
+        db.close()
+
+    for name, sql, problems in failures:
+        print(f"❌ {name}: {'; '.join(problems)}\n   {sql[:200]}")
+    for name in missing:
+        print(f"❌ {name}: SAMPLE_CALLS에 예시 호출 없음")
+
+    if failures or missing:
+        return 1
+    print(f"✅ 쿼리 {checked}개 모두 인덱스 사용 ({len(FULL_SCAN_ALLOWED)}개 메서드는 전체 스캔 허용)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
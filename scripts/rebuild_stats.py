@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""기사 집계 테이블(article_stats)과 검색 색인 재계산
+
+트리거 밖에서 데이터가 바뀌어(수동 SQL 등) 통계나 검색 결과가 어긋났을 때 사용
+(2글자 검색 색인은 트리거 없이 Database 쓰기 메서드만 갱신)
+
+사용법:
+    python scripts/rebuild_stats.py
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import yaml
+from database import Database
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    # 설정 로드
+    config_file = Path(__file__).parent.parent / 'config.yaml'
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    db_path = Path(__file__).parent.parent / config['database']['path']
+    db = Database(str(db_path))
+
+    before = db.get_statistics()
+    db.rebuild_statistics()
+    after = db.get_statistics()
+
+    print(f"✅ 집계 재계산 완료: 총 {before['total']:,} → {after['total']:,}개 | "
+          f"오늘 {before['today']:,} → {after['today']:,}개")
+    changed = {
+        key for key in set(before['sources']) | set(after['sources'])
+        if before['sources'].get(key) != after['sources'].get(key)
+    }
+    for source in sorted(changed):
+        print(f"   • {source}: {before['sources'].get(source, 0):,} → {after['sources'].get(source, 0):,}")
+
+    db.rebuild_search_index()
+    print("✅ 검색 색인 재구성 완료")
+
+
+if __name__ == '__main__':
+    main()
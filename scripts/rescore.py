@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""필터 변경 후 기사 점수 일괄 재계산
+
+사용법:
+    python scripts/rescore.py              # 중단된 작업이 있으면 이어서
+    python scripts/rescore.py --restart    # 처음부터
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import yaml
+from database import Database
+from rescorer import Rescorer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 아카이브 재채점')
+    parser.add_argument('--restart', action='store_true', help='진행 상황을 무시하고 처음부터')
+    parser.add_argument('--batch-size', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=None, help='채점 프로세스 수 (기본: CPU 코어 수)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    # 설정 로드
+    config_file = Path(__file__).parent.parent / 'config.yaml'
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    db_path = Path(__file__).parent.parent / config['database']['path']
+    db = Database(str(db_path))
+
+    rescorer = Rescorer(config, db, batch_size=args.batch_size, workers=args.workers)
+    try:
+        status = rescorer.run(restart=args.restart)
+    except KeyboardInterrupt:
+        print("\n⏹️  중단됨 (다시 실행하면 이어서 진행)")
+        return
+
+    print(f"✅ 재채점 완료: {status['processed']:,}개 ({status['rate']:,.0f}개/초)")
+
+
+if __name__ == '__main__':
+    main()
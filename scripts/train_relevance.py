@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""편집자 선택(is_used) 기록으로 관련도 모델 학습
+
+사용법:
+    python scripts/train_relevance.py          # 지난 학습 이후 새로 확정된 라벨로 추가 학습
+    python scripts/train_relevance.py --full   # 처음부터 다시 학습
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import yaml
+from database import Database
+from relevance_model import RelevanceModel, train
+
+
+def main():
+    parser = argparse.ArgumentParser(description='관련도 모델 학습')
+    parser.add_argument('--full', action='store_true', help='기존 모델을 버리고 처음부터')
+    parser.add_argument('--epochs', type=int, default=3)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    # 설정 로드
+    config_file = Path(__file__).parent.parent / 'config.yaml'
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    db_path = Path(__file__).parent.parent / config['database']['path']
+    db = Database(str(db_path))
+
+    scoring = config.get('scoring', {})
+    model_path = Path(__file__).parent.parent / scoring.get('model_path', 'data/relevance_model.npz')
+    if model_path.exists() and not args.full:
+        model = RelevanceModel.load(model_path)
+        print(f"📂 기존 모델: 기사 {model.examples:,}개 학습 (id {model.trained_until}까지)")
+    else:
+        model = RelevanceModel(bits=scoring.get('feature_bits', 18))
+
+    trained = train(
+        model, db,
+        label_delay_hours=scoring.get('label_delay_hours', 48),
+        epochs=args.epochs,
+        batch_size=args.batch_size
+    )
+    if not trained:
+        print("ℹ️  새로 학습할 기사가 없어 모델을 유지합니다")
+        return
+
+    model.save(model_path)
+    print(f"✅ 모델 저장: {model_path} (새 기사 {trained:,}개, 누적 {model.examples:,}개)")
+    print("   반영하려면 config.yaml의 scoring.model_enabled를 true로 (실행 중인 수집기는 설정/모델 파일 변경을 자동 반영)")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ from flask import Flask, jsonify, render_template_string, request
 import yaml
 import sys
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -13,25 +14,56 @@ sys.path.insert(0, str(Path(__file__).parent))
 from database import Database
 from content_generator import ContentGenerator
 from wikidata_client import WikidataClient
+from rescorer import Rescorer
+from translation_budget import TranslationBudget
+from config_watcher import ConfigWatcher
 
 app = Flask(__name__)
 
-# 설정 로드
 config_file = Path(__file__).parent.parent / 'config.yaml'
-with open(config_file, 'r', encoding='utf-8') as f:
-    config = yaml.safe_load(f)
+# 블로그 출력 폴더
+output_dir = Path(__file__).parent.parent / 'blog_posts'
 
-# DB 연결
-db_path = Path(__file__).parent.parent / config['database']['path']
-db = Database(str(db_path))
+# create_app()에서 채움
+config = None
+db_path = None
+db = None
+generator = None
+wikidata = None
+translation_budget = None
 
-# 모듈 초기화
-generator = ContentGenerator(config, db)
-wikidata = WikidataClient()
 
-# 블로그 출력 폴더
-output_dir = Path(__file__).parent.parent / 'blog_posts'
-output_dir.mkdir(exist_ok=True)
+def create_app():
+    """설정 로드, DB 연결, 모듈 초기화 → Flask 앱
+    
+    import 시점에 하지 않음: 재채점 프로세스 풀(spawn)이 작업자마다 이 모듈을 다시 import하므로
+    모듈 수준에서 DB를 열면 작업자마다 마이그레이션/모듈 초기화가 반복됨
+    """
+    global config, db_path, db, generator, wikidata, translation_budget
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    
+    db_path = Path(__file__).parent.parent / config['database']['path']
+    db = Database(str(db_path))
+    
+    generator = ContentGenerator(config, db)
+    wikidata = WikidataClient()
+    translation_budget = TranslationBudget(config, db)
+    output_dir.mkdir(exist_ok=True)
+    return app
+
+
+def apply_config(new_config):
+    """설정 파일 변경 반영 (이후 요청부터 새 설정 사용)"""
+    global config, translation_budget
+    generator.config = new_config
+    translation_budget = TranslationBudget(new_config, db)
+    config = new_config
+
+
+# 재채점 작업 (별도 DB 연결로 백그라운드 실행)
+rescorer = None
+rescore_thread = None
 
 
 @app.route('/')
@@ -41,16 +73,30 @@ def dashboard():
 
 @app.route('/api/articles')
 def get_articles():
-    cursor = db.conn.cursor()
-    cursor.execute('''
-        SELECT id, title, title_ko, url, source, score, created_at 
-        FROM rss_articles 
-        ORDER BY created_at DESC 
-        LIMIT 50
-    ''')
+    # 기간 지정 시 월별 아카이브까지 포함 (?since=2025-01-01&until=2025-02-01)
+    since = request.args.get('since')
+    if since:
+        articles = db.get_articles(
+            since,
+            until=request.args.get('until') or None,
+            source=request.args.get('source') or None,
+            category=request.args.get('category') or None,
+            limit=min(request.args.get('limit', 50, type=int), 500)
+        )
+        return jsonify(articles)
+    
+    with db.read() as cursor:
+        cursor.execute('''
+            SELECT id, title, title_ko, url, source, score, created_at, content, content_ko 
+            FROM rss_articles 
+            WHERE cluster_id IS NULL OR cluster_id = id
+            ORDER BY created_at DESC 
+            LIMIT 50
+        ''')
+        rows = cursor.fetchall()
     
     articles = []
-    for row in cursor.fetchall():
+    for row in rows:
         articles.append({
             'id': row[0],
             'title': row[1],
@@ -58,28 +104,85 @@ def get_articles():
             'url': row[3],
             'source': row[4],
             'score': row[5],
-            'created_at': row[6]
+            'created_at': row[6],
+            'content': row[7],
+            'content_ko': row[8]
         })
     
     return jsonify(articles)
 
 
+@app.route('/api/search')
+def search_articles():
+    """기사 전문 검색 (?q=검색어 &source= &category= &min_score= &since= &until= &limit= &offset=)"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': 'Missing query parameter q'}), 400
+    
+    # type=int는 변환 실패 시 조용히 기본값을 쓰므로 직접 변환
+    try:
+        min_score = int(request.args['min_score']) if request.args.get('min_score') else None
+        limit = min(int(request.args.get('limit', 20)), 100)
+        offset = max(int(request.args.get('offset', 0)), 0)
+    except ValueError:
+        return jsonify({'error': 'Invalid numeric parameter'}), 400
+    
+    results = db.search_articles(
+        query,
+        limit=limit,
+        offset=offset,
+        source=request.args.get('source') or None,
+        category=request.args.get('category') or None,
+        min_score=min_score,
+        since=request.args.get('since') or None,
+        until=request.args.get('until') or None
+    )
+    return jsonify({'query': query, 'count': len(results), 'results': results})
+
+
 @app.route('/api/stats')
 def get_stats():
     stats = db.get_statistics()
+    stats['daily'] = dict(db.get_daily_counts(7))
+    # DeepL 사용량/월말 예측 (수집기가 DB에 누적한 값, API 호출 없음)
+    stats['translation'] = translation_budget.usage()
     return jsonify(stats)
 
 
+@app.route('/api/rescore', methods=['POST'])
+def start_rescore():
+    """현재 필터로 전체 기사 재채점 시작 (?restart=1: 처음부터)"""
+    global rescorer, rescore_thread
+    if rescore_thread and rescore_thread.is_alive():
+        return jsonify({'error': 'Rescore already running', 'status': rescorer.status}), 409
+    
+    restart = request.args.get('restart') == '1'
+    rescorer = Rescorer(config, Database(str(db_path)))
+    rescore_thread = threading.Thread(target=rescorer.run, args=(restart,), daemon=True)
+    rescore_thread.start()
+    return jsonify({'started': True, 'restart': restart}), 202
+
+
+@app.route('/api/rescore/status')
+def rescore_status():
+    """재채점 진행 상황"""
+    progress = db.get_rescore_progress()
+    return jsonify({
+        'status': rescorer.status if rescorer else None,
+        'progress': progress
+    })
+
+
 @app.route('/api/generate/<int:article_id>')
 def generate_content(article_id):
-    cursor = db.conn.cursor()
-    cursor.execute('''
-        SELECT id, title, title_ko, url, source, score 
-        FROM rss_articles 
-        WHERE id = ?
-    ''', (article_id,))
+    with db.read() as cursor:
+        cursor.execute('''
+            SELECT id, title, title_ko, url, source, score, content, content_ko 
+            FROM rss_articles 
+            WHERE id = ?
+        ''', (article_id,))
+        row = cursor.fetchone()
     
-    row = cursor.fetchone()
     if not row:
         return jsonify({'error': 'Article not found'}), 404
     
@@ -89,7 +192,9 @@ def generate_content(article_id):
         'title_ko': row[2],
         'url': row[3],
         'source': row[4],
-        'score': row[5]
+        'score': row[5],
+        'content': row[6],
+        'content_ko': row[7]
     }
     
     content = generator.generate_content(article)
@@ -136,14 +241,14 @@ def search_wikidata(keyword):
 @app.route('/api/export/<int:article_id>')
 def export_markdown(article_id):
     """마크다운 파일로 내보내기"""
-    cursor = db.conn.cursor()
-    cursor.execute('''
-        SELECT id, title, title_ko, url, source, score 
-        FROM rss_articles 
-        WHERE id = ?
-    ''', (article_id,))
+    with db.read() as cursor:
+        cursor.execute('''
+            SELECT id, title, title_ko, url, source, score, content, content_ko 
+            FROM rss_articles 
+            WHERE id = ?
+        ''', (article_id,))
+        row = cursor.fetchone()
     
-    row = cursor.fetchone()
     if not row:
         return jsonify({'error': 'Article not found'}), 404
     
@@ -153,7 +258,9 @@ def export_markdown(article_id):
         'title_ko': row[2],
         'url': row[3],
         'source': row[4],
-        'score': row[5]
+        'score': row[5],
+        'content': row[6],
+        'content_ko': row[7]
     }
     
     content = generator.generate_content(article)
@@ -173,8 +280,7 @@ def export_markdown(article_id):
         f.write(markdown_content)
     
     # 사용됨 표시
-    cursor.execute('UPDATE rss_articles SET is_used = 1 WHERE id = ?', (article_id,))
-    db.conn.commit()
+    db.mark_as_used(article_id)
     
     return jsonify({
         'success': True,
@@ -485,9 +591,13 @@ DASHBOARD_HTML = '''
 
 
 if __name__ == '__main__':
+    create_app()
     print("=" * 50)
     print("🎖️ Military News Dashboard")
     print("http://127.0.0.1:8080")
     print("종료: Ctrl+C")
     print("=" * 50)
+    reload_interval = config['schedule'].get('config_reload_interval', 0)
+    if reload_interval:
+        ConfigWatcher(config_file, apply_config, reload_interval).start()
     app.run(host='127.0.0.1', port=8080, debug=False)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""오래된 달의 데이터를 월별 아카이브 파일로 이동 (본 DB를 작게 유지)"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+def archive_cutoff(hot_months, now=None):
+    """이 날짜(월 첫날) 이전 달이 아카이브 대상 (이번 달 + 지난 hot_months개월 유지)"""
+    now = now or datetime.now()
+    index = now.year * 12 + now.month - 1 - hot_months
+    return f'{index // 12:04d}-{index % 12 + 1:02d}-01'
+
+
+class Archiver:
+    """hot_months보다 오래된 달의 기사/본문/Wikipedia 변경을 data/archive/news-YYYY-MM.db로 이동"""
+
+    def __init__(self, config, db):
+        database = config['database']
+        self.db = db
+        self.hot_months = database.get('hot_months', 3)
+        self.interval = database.get('archive_interval', 86400)
+        logger.info(f"아카이브 초기화: 최근 {self.hot_months}개월 유지")
+
+    def cutoff(self, now=None):
+        return archive_cutoff(self.hot_months, now)
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name='archiver', daemon=True)
+        thread.start()
+        return thread
+
+    def _run(self):
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"아카이브 오류: {e}")
+            time.sleep(self.interval)
+
+    def run_once(self):
+        """대상 달을 오래된 순으로 이동 → 옮긴 기사 수"""
+        total = 0
+        for month in self.db.get_archivable_months(self.cutoff()):
+            moved = self.db.archive_month(month)
+            total += moved
+            if moved:
+                logger.info(f"🗄️ {month} 아카이브: 기사 {moved:,}개 → {self.db.archive_path(month).name}")
+        return total
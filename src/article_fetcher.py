@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""기사 본문 수집/추출 모듈 (백그라운드)"""
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+from feed_fetcher import USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# 본문이 아닌 요소 (추출 전 제거)
+NOISE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'figure', 'iframe']
+
+
+def extract_text(html):
+    """HTML에서 본문 텍스트 추출 (<article> 우선, 없으면 문단이 가장 많은 블록)"""
+    soup = BeautifulSoup(html, 'lxml')
+    for tag in soup(NOISE_TAGS):
+        tag.decompose()
+
+    container = soup.find('article')
+    if container is None:
+        best_length = 0
+        for block in soup.find_all(['main', 'div', 'section']):
+            length = sum(len(p.get_text(strip=True)) for p in block.find_all('p', recursive=False))
+            if length > best_length:
+                container, best_length = block, length
+    if container is None:
+        container = soup.body or soup
+
+    paragraphs = [p.get_text(' ', strip=True) for p in container.find_all('p')]
+    paragraphs = [p for p in paragraphs if len(p) > 40]
+    return '\n\n'.join(paragraphs)
+
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격 유지"""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self.next_allowed = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url):
+        """호스트 차례면 요청 시각을 예약하고 0, 아니면 차례까지 남은 초 (예약하지 않음)"""
+        host = urlsplit(url).netloc.lower()
+        with self.lock:
+            now = time.monotonic()
+            allowed = self.next_allowed.get(host, 0)
+            if allowed > now:
+                return allowed - now
+            self.next_allowed[host] = now + self.min_interval
+            return 0
+
+
+class ArticleFetcher:
+    """새 기사의 원문 페이지를 내려받아 본문 저장 (수집 주기와 분리)"""
+
+    def __init__(self, config, db, content_filter=None):
+        fulltext_config = config.get('fulltext', {})
+        self.db = db
+        self.content_filter = content_filter
+        self.workers = fulltext_config.get('workers', 4)
+        self.timeout = fulltext_config.get('timeout', 20)
+        self.rate_limiter = HostRateLimiter(fulltext_config.get('min_host_interval', 2))
+        self.queue = queue.Queue(maxsize=fulltext_config.get('queue_size', 1000))
+        # 호스트 차례가 아니어서 미룬 기사 (준비 시각, 순번, 기사)
+        self.deferred = []
+        self.deferred_lock = threading.Lock()
+        self.sequence = itertools.count()
+        self.stats = {'fetched': 0, 'failed': 0, 'dropped': 0}
+        self.threads = []
+        logger.info(f"본문 수집기 초기화: 작업자 {self.workers}개")
+
+    def start(self):
+        """작업자 스레드 시작 (밀린 기사 먼저 등록)"""
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._worker, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        self.submit(self.db.get_articles_without_text(self.queue.maxsize))
+
+    def submit(self, articles):
+        """기사 등록 (대기열이 가득 차면 버림 → 다음 재시작 시 재등록)"""
+        for article in articles:
+            try:
+                self.queue.put_nowait((article['id'], article['url'], article['title']))
+            except queue.Full:
+                self.stats['dropped'] += 1
+
+    def _worker(self):
+        """대기열에서 기사를 꺼내 본문 수집
+        
+        호스트 차례가 아니면 기다리지 않고 미뤄 두고 다른 기사를 처리
+        (한 호스트 기사가 몰려도 작업자가 모두 그 호스트 대기에 묶이지 않도록)
+        """
+        while True:
+            article = self._next_article()
+            article_id, url, title = article
+            delay = self.rate_limiter.acquire(url)
+            if delay:
+                with self.deferred_lock:
+                    heapq.heappush(self.deferred, (time.monotonic() + delay, next(self.sequence), article))
+                continue
+            try:
+                self.fetch_article(article_id, url, title)
+            except Exception as e:
+                logger.error(f"본문 수집 오류 ({url}): {e}")
+
+    def _next_article(self):
+        """준비된 미룬 기사 우선, 없으면 가장 이른 준비 시각까지 대기열에서 대기"""
+        while True:
+            with self.deferred_lock:
+                now = time.monotonic()
+                if self.deferred and self.deferred[0][0] <= now:
+                    return heapq.heappop(self.deferred)[2]
+                timeout = self.deferred[0][0] - now if self.deferred else None
+            try:
+                article = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            self.queue.task_done()
+            return article
+
+    def fetch_article(self, article_id, url, title):
+        """단일 기사 본문 다운로드/추출/저장"""
+        try:
+            response = requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=self.timeout)
+            response.raise_for_status()
+            text = extract_text(response.content)
+        except Exception as e:
+            self.stats['failed'] += 1
+            self.db.save_article_text(article_id, None, f"error: {e}"[:200])
+            logger.debug(f"본문 수집 실패 ({url}): {e}")
+            return
+
+        self.db.save_article_text(article_id, text, 'ok')
+        self.stats['fetched'] += 1
+
+        # 본문 기준으로 점수 재계산
+        if self.content_filter and text:
+            score = self.content_filter.calculate_score({'title': title, 'summary': text})
+            self.db.raise_score(article_id, score)
+
+        logger.debug(f"📄 본문 저장: {title[:50]} ({len(text):,}자)")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""config.yaml 변경 감지 및 검증"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+def validate_config(config):
+    """설정 검증 (문제 목록 반환, 비어 있으면 정상)"""
+    errors = []
+    if not isinstance(config, dict):
+        return ['최상위가 매핑이 아님']
+
+    feeds = config.get('rss_feeds')
+    if not isinstance(feeds, list):
+        errors.append('rss_feeds: 목록이어야 함')
+    else:
+        names = set()
+        for i, feed in enumerate(feeds):
+            for key in ('name', 'url', 'category'):
+                if not isinstance(feed, dict) or not feed.get(key):
+                    errors.append(f'rss_feeds[{i}]: {key} 없음')
+            if isinstance(feed, dict) and feed.get('name') in names:
+                errors.append(f"rss_feeds[{i}]: 중복 이름 {feed['name']}")
+            if isinstance(feed, dict):
+                names.add(feed.get('name'))
+
+    filters = config.get('filters')
+    if not isinstance(filters, dict):
+        errors.append('filters: 매핑이어야 함')
+    else:
+        for key in ('high_priority', 'medium_priority', 'exclude'):
+            value = filters.get(key, [])
+            if not isinstance(value, list) or not all(isinstance(k, str) and k for k in value):
+                errors.append(f'filters.{key}: 빈 문자열 없는 목록이어야 함')
+
+    wikipedia = config.get('wikipedia')
+    if not isinstance(wikipedia, dict):
+        errors.append('wikipedia: 매핑이어야 함')
+    elif not isinstance(wikipedia.get('pages'), list):
+        errors.append('wikipedia.pages: 목록이어야 함')
+    else:
+        for i, page in enumerate(wikipedia['pages']):
+            if not isinstance(page, dict) or not page.get('title'):
+                errors.append(f'wikipedia.pages[{i}]: title 없음')
+
+    database = config.get('database')
+    if not isinstance(database, dict) or not database.get('path'):
+        errors.append('database: path가 있는 매핑이어야 함')
+
+    schedule = config.get('schedule')
+    if not isinstance(schedule, dict):
+        errors.append('schedule: 매핑이어야 함')
+    elif not isinstance(schedule.get('rss_collection_interval'), (int, float)):
+        errors.append('schedule.rss_collection_interval: 숫자여야 함')
+
+    return errors
+
+
+class ConfigWatcher:
+    """설정 파일 수정 시각을 주기적으로 확인해 검증된 새 설정을 콜백으로 전달"""
+
+    def __init__(self, path, on_change, interval=5):
+        self.path = Path(path)
+        self.on_change = on_change
+        self.interval = interval
+        self.mtime = self._mtime()
+
+    def _mtime(self):
+        try:
+            return self.path.stat().st_mtime
+        except OSError:
+            return None
+
+    def start(self):
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+        return thread
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"설정 재적용 오류: {e}")
+
+    def check(self):
+        """변경되었으면 로드/검증 후 콜백 호출 (검증 실패 시 기존 설정 유지)"""
+        mtime = self._mtime()
+        if mtime is None or mtime == self.mtime:
+            return False
+        self.mtime = mtime
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f)
+        except (OSError, yaml.YAMLError) as e:
+            logger.error(f"⚠️ 설정 파일 읽기 실패, 기존 설정 유지: {e}")
+            return False
+
+        errors = validate_config(config)
+        if errors:
+            logger.error(f"⚠️ 설정 검증 실패, 기존 설정 유지: {'; '.join(errors)}")
+            return False
+
+        logger.info(f"🔄 설정 변경 감지: {self.path.name}")
+        self.on_change(config)
+        return True
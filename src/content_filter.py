@@ -2,9 +2,19 @@
 """콘텐츠 필터링 모듈"""
 
 import logging
+from pathlib import Path
+
+from keyword_matcher import KeywordMatcher
+from relevance_model import RelevanceModel
 
 logger = logging.getLogger(__name__)
 
+# 키워드 목록별 점수
+SCORES = {
+    'high_priority': 10,
+    'medium_priority': 5,
+}
+
 
 class ContentFilter:
     """밀리터리 키워드 기반 필터링"""
@@ -14,47 +24,99 @@ class ContentFilter:
         self.high_priority = config['filters']['high_priority']
         self.medium_priority = config['filters']['medium_priority']
         self.exclude = config['filters'].get('exclude', [])
-        logger.info("콘텐츠 필터 초기화")
+        self.matcher = self._compile(config['filters'].get('word_boundary', False))
+        scoring = config.get('scoring', {})
+        self.model_path = None
+        if scoring.get('model_enabled'):
+            self.model_path = Path(__file__).parent.parent / scoring.get('model_path', 'data/relevance_model.npz')
+        self.model_weight = scoring.get('model_weight', 20)
+        self.model = None
+        self.model_mtime = -1
+        self._refresh_model()
+        logger.info(f"콘텐츠 필터 초기화: 키워드 {len(self.matcher.patterns)}개")
     
-    def is_military_related(self, text):
-        """밀리터리 관련 여부 판단"""
-        text_lower = text.lower()
+    def _refresh_model(self):
+        """모델 파일이 (다시) 저장되었으면 로드 (비활성/파일 없음이면 키워드 점수만 사용)
         
-        # 제외 키워드 체크
-        for keyword in self.exclude:
-            if keyword.lower() in text_lower:
-                return False
+        학습 스크립트가 파일을 교체하면 실행 중인 수집기도 다음 배치부터 새 모델 사용
+        """
+        if self.model_path is None:
+            return
+        try:
+            mtime = self.model_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        if mtime == self.model_mtime:
+            return
+        self.model_mtime = mtime
         
-        # 고우선순위 키워드
-        for keyword in self.high_priority:
-            if keyword.lower() in text_lower:
-                return True
+        try:
+            model = RelevanceModel.load(self.model_path)
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"⚠️ 관련도 모델 로드 실패, 키워드 점수만 사용: {e}")
+            self.model = None
+            return
+        logger.info(f"관련도 모델 로드: 학습 기사 {model.examples:,}개")
+        self.model = model
+    
+    def _compile(self, word_boundary):
+        """세 키워드 목록을 하나의 오토마톤으로 컴파일"""
+        keywords = {}
+        for list_name in ('exclude', 'high_priority', 'medium_priority'):
+            for keyword in getattr(self, list_name):
+                tags = keywords.setdefault(keyword.lower(), [])
+                if list_name not in tags:
+                    tags.append(list_name)
+        return KeywordMatcher(keywords, word_boundary)
+    
+    def analyze(self, text):
+        """한 번의 스캔으로 제외 여부, 관련 여부, 점수, 매칭 키워드 계산"""
+        excluded = False
+        related = False
+        score = 0
+        matched = []
         
-        # 중간우선순위 키워드
-        for keyword in self.medium_priority:
-            if keyword.lower() in text_lower:
-                return True
+        for keyword, tags in self.matcher.matches(text):
+            matched.append(keyword)
+            for tag in tags:
+                if tag == 'exclude':
+                    excluded = True
+                else:
+                    related = True
+                    score += SCORES[tag]
         
-        return False
+        return {
+            'excluded': excluded,
+            'related': related and not excluded,
+            'score': score,
+            'keywords': matched
+        }
+    
+    def is_military_related(self, text):
+        """밀리터리 관련 여부 판단"""
+        return self.analyze(text)['related']
     
     def calculate_score(self, article):
         """기사 중요도 점수 계산"""
         text = f"{article['title']} {article.get('summary', '')}"
-        text_lower = text.lower()
-        
-        score = 0
-        
-        # 고우선순위 키워드: +10점
-        for keyword in self.high_priority:
-            if keyword.lower() in text_lower:
-                score += 10
-        
-        # 중간우선순위 키워드: +5점
-        for keyword in self.medium_priority:
-            if keyword.lower() in text_lower:
-                score += 5
-        
-        return score
+        return self.analyze(text)['score']
+    
+    def model_bonus(self, texts):
+        """모델 점수 (선택 확률 × 가중치, 정수) 목록, 텍스트 배치 단위로 한 번에 계산"""
+        self._refresh_model()
+        if not self.model or not texts:
+            return [0] * len(texts)
+        return (self.model.predict(texts) * self.model_weight).round().astype(int).tolist()
+    
+    def apply_model(self, articles):
+        """키워드 점수에 모델 점수를 더함 (피드 단위 배치)"""
+        self._refresh_model()
+        if not self.model:
+            return articles
+        texts = [f"{a['title']} {a.get('summary', '')}" for a in articles]
+        for article, bonus in zip(articles, self.model_bonus(texts)):
+            article['score'] = article.get('score', 0) + bonus
+        return articles
     
     def filter_articles(self, articles):
         """기사 필터링 및 점수 부여"""
@@ -62,11 +124,14 @@ class ContentFilter:
         
         for article in articles:
             text = f"{article['title']} {article.get('summary', '')}"
+            result = self.analyze(text)
             
-            if self.is_military_related(text):
-                article['score'] = self.calculate_score(article)
+            if result['related']:
+                article['score'] = result['score']
                 filtered.append(article)
         
+        self.apply_model(filtered)
+        
         # 점수 순으로 정렬
         filtered.sort(key=lambda x: x['score'], reverse=True)
         
@@ -217,8 +217,14 @@ class ContentGenerator:
         title_ko = article.get('title_ko', '')
         url = article.get('url', '')
         source = article.get('source', '')
+        summary = article.get('content_ko') or article.get('content', '')
         
         keyword = self.find_keyword(title)
+        if not keyword and article.get('id'):
+            # 제목에 없으면 저장된 본문에서 검색
+            text = self.db.get_article_text(article['id'])
+            if text:
+                keyword = self.find_keyword(text)
         if not keyword:
             return None
         
@@ -231,6 +237,7 @@ class ContentGenerator:
             title_ko=title_ko,
             url=url,
             source=source,
+            summary=summary,
             keyword=keyword,
             battles=battles,
             weapons=weapons,
@@ -239,7 +246,7 @@ class ContentGenerator:
         
         return content
     
-    def _format_content(self, title, title_ko, url, source, keyword, battles, weapons, stocks):
+    def _format_content(self, title, title_ko, url, source, keyword, battles, weapons, stocks, summary=''):
         """블로그 포스트 포맷"""
         
         post = f"""
@@ -253,6 +260,7 @@ class ContentGenerator:
 - 출처: {source}
 - 링크: {url}
 - 키워드: {keyword}
+- 요약: {summary or '(요약 없음)'}
 
 {'─'*60}
 
@@ -332,24 +340,27 @@ class ContentGenerator:
         return self.generate_content(article)
     
     def process_top_articles(self, limit=5):
-        cursor = self.db.conn.cursor()
-        cursor.execute('''
-            SELECT id, title, title_ko, url, source, score 
-            FROM rss_articles 
-            WHERE is_used = 0
-            ORDER BY score DESC, created_at DESC 
-            LIMIT ?
-        ''', (limit,))
+        with self.db.read() as cursor:
+            cursor.execute('''
+                SELECT id, title, title_ko, url, source, score, content, content_ko 
+                FROM rss_articles 
+                WHERE is_used = 0 AND (cluster_id IS NULL OR cluster_id = id)
+                ORDER BY score DESC, created_at DESC 
+                LIMIT ?
+            ''', (limit,))
+            rows = cursor.fetchall()
         
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             article = {
                 'id': row[0],
                 'title': row[1],
                 'title_ko': row[2],
                 'url': row[3],
                 'source': row[4],
-                'score': row[5]
+                'score': row[5],
+                'content': row[6],
+                'content_ko': row[7]
             }
             
             content = self.generate_content(article)
@@ -2,131 +2,985 @@
 """데이터베이스 관리 모듈"""
 
 import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
 import logging
 
+from migrations import (
+    create_archive_tables, index_bigrams, migrate, rebuild_article_stats, rebuild_bigram_index
+)
+
 logger = logging.getLogger(__name__)
 
 
+def _next_month(month):
+    """'YYYY-MM' → 다음 달 첫날 'YYYY-MM-01'"""
+    year, mon = map(int, month.split('-'))
+    return f'{year + mon // 12:04d}-{mon % 12 + 1:02d}-01'
+
+
+def _compress(text):
+    return zlib.compress(text.encode('utf-8')) if text else text
+
+
+def _decompress(value):
+    """아카이브의 압축 BLOB이면 풀고, 본 DB의 문자열은 그대로"""
+    return zlib.decompress(value).decode('utf-8') if isinstance(value, bytes) else value
+
+
 class Database:
-    def __init__(self, db_path):
+    """SQLite 접근 (WAL, 스레드별 연결, 읽기/쓰기 세션 분리)
+
+    읽기는 스레드별 읽기 전용 연결을 써서 다른 스레드의 쓰기 커밋을 기다리지 않고,
+    쓰기는 스레드별 쓰기 연결에서 BEGIN IMMEDIATE ~ COMMIT 한 트랜잭션으로 처리
+    """
+    
+    def __init__(self, db_path, busy_timeout=5.0, archive_dir=None):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.archive_dir = Path(archive_dir) if archive_dir else Path(db_path).parent / 'archive'
+        self.busy_timeout = busy_timeout
+        self.local = threading.local()
+        self.connections = []  # [(스레드, 연결)] 종료된 스레드의 연결 정리용
+        self.lock = threading.Lock()
+        
+        self.conn.execute('PRAGMA journal_mode = WAL')
         self.init_tables()
         logger.info(f"✅ DB 연결: {db_path}")
     
-    def init_tables(self):
-        """테이블 초기화"""
-        cursor = self.conn.cursor()
-        
-        # RSS 기사 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS rss_articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                title_ko TEXT,
-                url TEXT UNIQUE,
-                source TEXT,
-                published_date TEXT,
-                content TEXT,
-                category TEXT,
-                score INTEGER DEFAULT 0,
-                is_used INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Wikipedia 변경 내역 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS wiki_changes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                page_title TEXT,
-                revision_id INTEGER,
-                timestamp TEXT,
-                editor TEXT,
-                comment TEXT,
-                size_change INTEGER,
-                detected_at TEXT DEFAULT CURRENT_TIMESTAMP
+    def _connect(self, readonly):
+        if readonly:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=self.busy_timeout, check_same_thread=False)
+        else:
+            # 트랜잭션은 write()에서 직접 관리
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False
             )
-        ''')
-        
-        # 기존 테이블에 새 컬럼 추가 (이미 있으면 무시)
-        try:
-            cursor.execute('ALTER TABLE rss_articles ADD COLUMN score INTEGER DEFAULT 0')
-        except:
-            pass
-        
-        try:
-            cursor.execute('ALTER TABLE rss_articles ADD COLUMN is_used INTEGER DEFAULT 0')
-        except:
-            pass
+            conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute(f'PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}')
+        return conn
+    
+    def _connection(self, readonly):
+        """현재 스레드의 연결 (없으면 생성)"""
+        name = 'reader' if readonly else 'writer'
+        conn = getattr(self.local, name, None)
+        if conn is None:
+            conn = self._connect(readonly)
+            setattr(self.local, name, conn)
+            with self.lock:
+                self._close_dead()
+                self.connections.append((threading.current_thread(), conn))
+        return conn
+    
+    def _close_dead(self):
+        """종료된 스레드(Flask 요청 스레드 등)의 연결 닫기"""
+        alive = []
+        for thread, conn in self.connections:
+            if thread.is_alive():
+                alive.append((thread, conn))
+            else:
+                conn.close()
+        self.connections = alive
+    
+    @property
+    def conn(self):
+        """현재 스레드의 쓰기 연결 (자동 커밋, 기존 코드 호환용; 새 코드는 read()/write() 사용)"""
+        return self._connection(readonly=False)
+    
+    @contextmanager
+    def read(self):
+        """읽기 세션 (읽기 전용 연결, WAL이라 진행 중인 쓰기를 기다리지 않음)"""
+        yield self._connection(readonly=True).cursor()
+    
+    @contextmanager
+    def write(self):
+        """쓰기 세션 (한 트랜잭션, 예외 시 롤백), 세션 안에서 다시 열면 바깥 트랜잭션에 합류"""
+        conn = self._connection(readonly=False)
+        if conn.in_transaction:
+            yield conn.cursor()
+            return
         
+        conn.execute('BEGIN IMMEDIATE')
         try:
-            cursor.execute('ALTER TABLE rss_articles ADD COLUMN title_ko TEXT')
-        except:
-            pass
-        
-        self.conn.commit()
-        logger.info("✅ 테이블 초기화 완료")
+            yield conn.cursor()
+            conn.commit()
+        except BaseException:
+            # 커밋이 실패해도(SQLITE_BUSY 등) 트랜잭션을 닫아야 이후 write()가 합류 모드에 빠지지 않음
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+    
+    def close(self):
+        """모든 스레드의 연결 닫기"""
+        with self.lock:
+            for _, conn in self.connections:
+                conn.close()
+            self.connections = []
+        self.local = threading.local()
+    
+    def init_tables(self):
+        """테이블 초기화 (미적용 스키마 마이그레이션 적용)"""
+        version = migrate(self)
+        logger.info(f"✅ 테이블 초기화 완료 (스키마 v{version})")
     
     def get_statistics(self):
-        """통계 조회"""
-        cursor = self.conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM rss_articles")
-        total_rss = cursor.fetchone()[0]
-        
+        """통계 조회 (트리거가 유지하는 집계 테이블에서 키 조회만)"""
         today = datetime.now().strftime('%Y-%m-%d')
-        cursor.execute(
-            "SELECT COUNT(*) FROM rss_articles WHERE DATE(created_at) = ?",
-            (today,)
-        )
-        today_rss = cursor.fetchone()[0]
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT dimension, key, count FROM article_stats 
+                WHERE (dimension = 'total' AND key = '') OR (dimension = 'day' AND key = ?)
+                   OR dimension IN ('source', 'category')
+            ''', (today,))
+            rows = cursor.fetchall()
         
-        return {
-            'total': total_rss,
-            'today': today_rss
-        }
+        stats = {'total': 0, 'today': 0, 'sources': {}, 'categories': {}}
+        for dimension, key, count in rows:
+            if dimension == 'total':
+                stats['total'] = count
+            elif dimension == 'day':
+                stats['today'] = count
+            elif count > 0:
+                stats['sources' if dimension == 'source' else 'categories'][key] = count
+        return stats
+    
+    def get_daily_counts(self, days=30):
+        """최근 N일 일별 기사 수 [(날짜, 수)] (최신순)"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT key, count FROM article_stats 
+                WHERE dimension = 'day' AND key >= DATE('now', ?) 
+                ORDER BY key DESC
+            ''', (f'-{days} days',))
+            return cursor.fetchall()
+    
+    def rebuild_statistics(self):
+        """집계 테이블을 기사 테이블 + 아카이브 파일별 집계로 다시 계산 (어긋남 복구용, 전체 스캔)"""
+        archived = []
+        with self.read() as cursor:
+            for path in self._archives():
+                with self._attached(cursor, path):
+                    archived += cursor.execute(
+                        'SELECT dimension, key, count FROM archive.article_stats'
+                    ).fetchall()
+        
+        with self.write() as cursor:
+            rebuild_article_stats(cursor)
+            cursor.executemany('''
+                INSERT INTO article_stats (dimension, key, count) VALUES (?, ?, ?) 
+                ON CONFLICT (dimension, key) DO UPDATE SET count = count + excluded.count
+            ''', archived)
+    
+    def rebuild_search_index(self):
+        """검색 색인(트라이그램/2글자)을 기사 테이블에서 다시 만듦 (수동 SQL 이후 복구용, 전체 스캔)"""
+        with self.write() as cursor:
+            cursor.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+            rebuild_bigram_index(cursor)
     
     def get_latest_articles(self, limit=10):
         """최신 기사 조회"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT title, title_ko, url, source, created_at 
-            FROM rss_articles 
-            ORDER BY created_at DESC 
-            LIMIT ?
-        ''', (limit,))
-        return cursor.fetchall()
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT title, title_ko, url, source, created_at 
+                FROM rss_articles 
+                ORDER BY created_at DESC 
+                LIMIT ?
+            ''', (limit,))
+            return cursor.fetchall()
     
-    def get_wiki_changes(self, limit=10):
-        """최신 Wikipedia 변경사항 조회"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+    def get_wiki_changes(self, limit=10, since=None, until=None):
+        """최신 Wikipedia 변경사항 조회 (since가 있으면 기간 내, 겹치는 아카이브 포함)"""
+        if since is None:
+            with self.read() as cursor:
+                cursor.execute('''
+                    SELECT page_title, comment, editor, detected_at 
+                    FROM wiki_changes 
+                    ORDER BY detected_at DESC 
+                    LIMIT ?
+                ''', (limit,))
+                return cursor.fetchall()
+        
+        until = until or '9999'
+        query = '''
             SELECT page_title, comment, editor, detected_at 
-            FROM wiki_changes 
+            FROM {}.wiki_changes 
+            WHERE detected_at >= ? AND detected_at < ? 
             ORDER BY detected_at DESC 
             LIMIT ?
-        ''', (limit,))
-        return cursor.fetchall()
+        '''
+        with self.read() as cursor:
+            changes = cursor.execute(query.format('main'), (since, until, limit)).fetchall()
+            for path in self._archives(since, until):
+                if len(changes) >= limit:
+                    break
+                with self._attached(cursor, path):
+                    changes += cursor.execute(query.format('archive'), (since, until, limit)).fetchall()
+        return changes[:limit]
     
     def get_top_articles(self, limit=20):
         """점수 높은 미사용 기사 조회"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT id, title, title_ko, url, source, score, created_at 
-            FROM rss_articles 
-            WHERE is_used = 0
-            ORDER BY score DESC, created_at DESC 
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT id, title, title_ko, url, source, score, created_at 
+                FROM rss_articles 
+                WHERE is_used = 0 AND (cluster_id IS NULL OR cluster_id = id)
+                ORDER BY score DESC, created_at DESC 
+                LIMIT ?
+            ''', (limit,))
+            return cursor.fetchall()
+    
+    def search_articles(self, query, limit=20, offset=0, source=None, category=None,
+                        min_score=None, since=None, until=None):
+        """기사 전문 검색 (제목 가중 BM25 순, 일치 부분 스니펫)
+        
+        3글자 이상 단어는 트라이그램 인덱스, 2글자 단어(북한, 해군 등)는 바이그램 인덱스로 찾음.
+        1글자 단어는 무시. since가 있으면 기간과 겹치는 월별 아카이브도 검색 (스니펫 없음)
+        """
+        terms = query.split()
+        long_terms = [term for term in terms if len(term) >= 3]
+        short_terms = [term for term in terms if len(term) == 2]
+        if not long_terms and not short_terms:
+            return []
+        # 단어마다 따옴표로 감싸 FTS 문법 문자를 그대로 검색 (공백 = AND)
+        match = ' '.join('"' + term.replace('"', '""') + '"' for term in long_terms)
+        bigram_match = ' '.join('"' + term.replace('"', '""') + '"' for term in short_terms)
+        filters = [
+            ('source', '=', source),
+            ('category', '=', category),
+            ('score', '>=', min_score),
+            ('created_at', '>=', since),
+            ('created_at', '<', until),
+        ]
+        
+        with self.read() as cursor:
+            results = self._search_partition(cursor, 'main', match, bigram_match, filters, limit + offset)
+            if since is not None:
+                for path in self._archives(since, until):
+                    with self._attached(cursor, path):
+                        results += self._search_partition(
+                            cursor, 'archive', match, bigram_match, filters, limit + offset
+                        )
+        
+        results.sort(key=lambda row: row['rank'])
+        return results[offset:offset + limit]
+    
+    def _search_partition(self, cursor, schema, match, bigram_match, filters, limit):
+        """본 DB(main) 또는 ATTACH한 아카이브(archive) 한 곳 검색"""
+        if bigram_match and schema == 'archive' and not cursor.execute(
+            "SELECT 1 FROM archive.sqlite_master WHERE name = 'articles_bigram'"
+        ).fetchone():
+            # 바이그램 색인 이전에 만든 아카이브 → 2글자 단어를 찾을 수 없어 건너뜀
+            return []
+        conditions, params = [], []
+        if match and bigram_match:
+            conditions.append(
+                f'a.id IN (SELECT rowid FROM {schema}.articles_bigram WHERE articles_bigram MATCH ?)'
+            )
+            params.append(bigram_match)
+        for column, op, value in filters:
+            if value is not None:
+                conditions.append(f'a.{column} {op} ?')
+                params.append(value)
+        where = ''.join(f' AND {condition}' for condition in conditions)
+        
+        # 트라이그램 색인이 있으면 그쪽으로 순위/스니펫, 2글자 단어만 있으면 바이그램 색인으로
+        table = 'articles_fts' if match else 'articles_bigram'
+        snippet = 'NULL'
+        if match and schema == 'main':
+            snippet = "snippet(articles_fts, -1, '<mark>', '</mark>', '…', 32)"
+        cursor.execute(f'''
+            SELECT a.id, a.title, a.title_ko, a.url, a.source, a.category, a.score, a.created_at, 
+                   {snippet} AS snippet, {table}.rank 
+            FROM {schema}.{table} 
+            JOIN {schema}.rss_articles a ON a.id = {table}.rowid 
+            WHERE {table} MATCH ?{where} 
+            ORDER BY {table}.rank 
             LIMIT ?
-        ''', (limit,))
-        return cursor.fetchall()
+        ''', [match or bigram_match] + params + [limit])
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+    
+    def get_feed_health(self):
+        """피드별 브레이커 상태 전체 조회"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT feed_name, state, failures, opened_at, skips, polls, articles, last_error 
+                FROM feed_health
+            ''')
+            columns = [d[0] for d in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def save_feed_health(self, health):
+        """피드 브레이커 상태 저장"""
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT OR REPLACE INTO feed_health 
+                (feed_name, state, failures, opened_at, skips, polls, articles, last_error)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                health['feed_name'],
+                health['state'],
+                health['failures'],
+                health['opened_at'],
+                health['skips'],
+                health['polls'],
+                health['articles'],
+                health['last_error']
+            ))
+    
+    def get_feed_timestamps(self, source, limit=50):
+        """피드별 최근 기사 시각 조회 (published_date, created_at)"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT published_date, created_at 
+                FROM rss_articles 
+                WHERE source = ?
+                ORDER BY id DESC 
+                LIMIT ?
+            ''', (source, limit))
+            return cursor.fetchall()
+    
+    def _select_by_urls(self, cursor, columns, urls):
+        """URL 목록으로 조회 (SQLite 변수 개수 제한을 고려해 분할)"""
+        urls = list(set(urls))
+        rows = []
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT {columns} FROM rss_articles WHERE url IN ({placeholders})',
+                chunk
+            )
+            rows.extend(cursor.fetchall())
+        return rows
+    
+    def _reindex_bigrams(self, cursor, key, values):
+        """제목/요약/번역이 바뀐 기사를 2글자 검색 색인에 반영 (key: 'url' 또는 'id')"""
+        values = list(set(values))
+        for i in range(0, len(values), 500):
+            chunk = values[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT id, title, title_ko, content, content_ko FROM rss_articles WHERE {key} IN ({placeholders})',
+                chunk
+            )
+            index_bigrams(cursor, cursor.fetchall())
+    
+    def insert_articles(self, articles):
+        """기사 일괄 저장 (단일 트랜잭션), 새로 추가된 기사만 반환"""
+        if not articles:
+            return []
+        
+        with self.write() as cursor:
+            # 이미 저장된 URL 확인
+            existing = {
+                row[0] for row in self._select_by_urls(cursor, 'url', [a['url'] for a in articles])
+            }
+            
+            new_articles = []
+            for article in articles:
+                if article['url'] not in existing:
+                    existing.add(article['url'])
+                    new_articles.append(article)
+            
+            cursor.executemany('''
+                INSERT OR IGNORE INTO rss_articles 
+                (title, title_ko, url, source, published_date, content, category, score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (
+                    a['title'],
+                    a.get('title_ko'),
+                    a['url'],
+                    a['source'],
+                    a['published_date'],
+                    a['summary'],
+                    a['category'],
+                    a.get('score', 0)
+                )
+                for a in new_articles
+            ])
+            
+            # 새 기사 ID 반영
+            ids = dict(
+                (url, article_id) for article_id, url
+                in self._select_by_urls(cursor, 'id, url', [a['url'] for a in new_articles])
+            )
+            for article in new_articles:
+                article['id'] = ids.get(article['url'])
+            self._reindex_bigrams(cursor, 'id', list(ids.values()))
+            
+            return new_articles
+    
+    def update_articles(self, articles):
+        """기존 기사 제목/요약/점수 일괄 업데이트 (제목/요약이 바뀌면 해당 번역 초기화)"""
+        if not articles:
+            return
+        
+        with self.write() as cursor:
+            cursor.executemany('''
+                UPDATE rss_articles 
+                SET title_ko = CASE WHEN title = ? THEN title_ko ELSE NULL END,
+                    content_ko = CASE WHEN content = ? THEN content_ko ELSE NULL END,
+                    title = ?,
+                    content = ?,
+                    published_date = ?,
+                    score = ?
+                WHERE url = ?
+            ''', [
+                (
+                    a['title'],
+                    a['summary'],
+                    a['title'],
+                    a['summary'],
+                    a['published_date'],
+                    a.get('score', 0),
+                    a['url']
+                )
+                for a in articles
+            ])
+            self._reindex_bigrams(cursor, 'url', [a['url'] for a in articles])
+    
+    def update_translations(self, translations):
+        """번역 제목 일괄 저장 (단일 트랜잭션), translations: [(url, title_ko)]"""
+        if not translations:
+            return
+        
+        with self.write() as cursor:
+            cursor.executemany(
+                'UPDATE rss_articles SET title_ko = ? WHERE url = ?',
+                [(title_ko, url) for url, title_ko in translations]
+            )
+            self._reindex_bigrams(cursor, 'url', [url for url, _ in translations])
+    
+    def get_untranslated_articles(self, limit, min_score=0):
+        """번역 안 된 클러스터 대표 기사 (점수 높은 순) → [(id, title)]"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT id, title 
+                FROM rss_articles 
+                WHERE title_ko IS NULL AND (cluster_id IS NULL OR cluster_id = id) AND score >= ?
+                ORDER BY score DESC, id DESC 
+                LIMIT ?
+            ''', (min_score, limit))
+            return cursor.fetchall()
+    
+    def count_untranslated_articles(self):
+        """번역 대기 기사 수"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT COUNT(*) FROM rss_articles 
+                WHERE title_ko IS NULL AND (cluster_id IS NULL OR cluster_id = id)
+            ''')
+            return cursor.fetchone()[0]
+    
+    def update_translations_by_id(self, translations):
+        """번역 제목 일괄 저장, translations: [(title_ko, id, 번역한 원문 제목)]
+        
+        번역 중에 제목이 바뀐 기사는 건너뜀
+        """
+        if not translations:
+            return
+        
+        with self.write() as cursor:
+            cursor.executemany(
+                'UPDATE rss_articles SET title_ko = ? WHERE id = ? AND title = ? AND title_ko IS NULL',
+                translations
+            )
+            self._reindex_bigrams(cursor, 'id', [article_id for _, article_id, _ in translations])
+    
+    def get_untranslated_summaries(self, limit, min_score=0):
+        """제목은 번역됐지만 요약은 아직인 대표 기사 (점수 높은 순) → [(id, content)]"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT id, content 
+                FROM rss_articles 
+                WHERE title_ko IS NOT NULL AND content_ko IS NULL AND content != ''
+                  AND (cluster_id IS NULL OR cluster_id = id) AND score >= ?
+                ORDER BY score DESC, id DESC 
+                LIMIT ?
+            ''', (min_score, limit))
+            return cursor.fetchall()
+    
+    def update_summary_translations(self, translations):
+        """요약 번역 일괄 저장, translations: [(content_ko, id, 번역한 원문 요약)]"""
+        if not translations:
+            return
+        
+        with self.write() as cursor:
+            cursor.executemany(
+                'UPDATE rss_articles SET content_ko = ? WHERE id = ? AND content = ? AND content_ko IS NULL',
+                translations
+            )
+            self._reindex_bigrams(cursor, 'id', [article_id for _, article_id, _ in translations])
+    
+    def get_cluster_signatures(self):
+        """클러스터 서명 전체 조회 (simhash, cluster_id)"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT simhash, cluster_id 
+                FROM rss_articles 
+                WHERE simhash IS NOT NULL AND simhash != 0
+                ORDER BY id
+            ''')
+            return cursor
+    
+    def get_unclustered_articles(self):
+        """클러스터 미지정 기사 조회"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT id, title, content 
+                FROM rss_articles 
+                WHERE cluster_id IS NULL
+                ORDER BY id
+            ''')
+            return cursor.fetchall()
+    
+    def get_existing_ids(self, ids):
+        """본 DB에 남아 있는 기사 id 집합 (아카이브로 옮겨진 id 제외)"""
+        ids = list(set(ids))
+        found = set()
+        with self.read() as cursor:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                cursor.execute(
+                    f"SELECT id FROM rss_articles WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                )
+                found.update(row[0] for row in cursor.fetchall())
+        return found
+    
+    def set_clusters(self, updates):
+        """클러스터 일괄 저장, updates: [(simhash, cluster_id, id)]"""
+        if not updates:
+            return
+        
+        with self.write() as cursor:
+            cursor.executemany(
+                'UPDATE rss_articles SET simhash = ?, cluster_id = ? WHERE id = ?',
+                updates
+            )
+    
+    def save_article_text(self, article_id, text, status):
+        """기사 본문 압축 저장"""
+        blob = zlib.compress(text.encode('utf-8')) if text else None
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT OR REPLACE INTO article_texts 
+                (article_id, text, length, status, fetched_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (article_id, blob, len(text) if text else 0, status))
+    
+    def get_translation_memory(self, keys):
+        """번역 메모리 조회 → {key: 번역문} (변수 개수 제한을 고려해 분할)"""
+        keys = list(set(keys))
+        with self.read() as cursor:
+            found = {}
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f'SELECT key, translated_text FROM translation_memory WHERE key IN ({placeholders})',
+                    chunk
+                )
+                found.update(cursor.fetchall())
+            return found
+    
+    def save_translation_memory(self, entries):
+        """번역 메모리 일괄 저장, entries: [(key, 원문, 번역문, 원문 언어, 번역 언어)]"""
+        if not entries:
+            return
+        with self.write() as cursor:
+            cursor.executemany('''
+                INSERT OR REPLACE INTO translation_memory 
+                (key, source_text, translated_text, source_lang, target_lang)
+                VALUES (?, ?, ?, ?, ?)
+            ''', entries)
+    
+    def add_translation_usage(self, month, chars, default_limit):
+        """월별 번역 문자 수 누적"""
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT INTO translation_usage (month, used, char_limit) VALUES (?, ?, ?)
+                ON CONFLICT(month) DO UPDATE SET used = used + excluded.used
+            ''', (month, chars, default_limit))
+    
+    def set_translation_usage(self, month, used, limit, synced_at):
+        """DeepL 사용량 API 값으로 보정"""
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT OR REPLACE INTO translation_usage (month, used, char_limit, synced_at)
+                VALUES (?, ?, ?, ?)
+            ''', (month, used, limit, synced_at))
+    
+    def get_translation_usage(self, month):
+        """월별 사용량 → (used, char_limit, synced_at) 또는 None"""
+        with self.read() as cursor:
+            cursor.execute(
+                'SELECT used, char_limit, synced_at FROM translation_usage WHERE month = ?',
+                (month,)
+            )
+            return cursor.fetchone()
+    
+    def get_recent_scores(self, days):
+        """최근 N일 클러스터 대표 기사 점수 목록"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT score FROM rss_articles 
+                WHERE created_at >= datetime('now', ?) AND (cluster_id IS NULL OR cluster_id = id)
+            ''', (f'-{days} days',))
+            return [row[0] for row in cursor.fetchall()]
+    
+    def get_article_text(self, article_id):
+        """기사 본문 조회 (없으면 None)"""
+        with self.read() as cursor:
+            cursor.execute(
+                'SELECT text FROM article_texts WHERE article_id = ?',
+                (article_id,)
+            )
+            row = cursor.fetchone()
+            if not row or row[0] is None:
+                return None
+            return zlib.decompress(row[0]).decode('utf-8')
+    
+    def get_articles_without_text(self, limit=1000):
+        """본문 수집 시도가 없는 최신 기사 조회"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT a.id, a.url, a.title 
+                FROM rss_articles a
+                LEFT JOIN article_texts t ON t.article_id = a.id
+                WHERE t.article_id IS NULL
+                ORDER BY a.id DESC 
+                LIMIT ?
+            ''', (limit,))
+            return [
+                {'id': row[0], 'url': row[1], 'title': row[2]}
+                for row in cursor.fetchall()
+            ]
+    
+    def raise_score(self, article_id, score):
+        """점수 갱신 (기존보다 높을 때만)"""
+        with self.write() as cursor:
+            cursor.execute(
+                'UPDATE rss_articles SET score = MAX(score, ?) WHERE id = ?',
+                (score, article_id)
+            )
+    
+    def get_rescore_progress(self):
+        """재채점 진행 상황 조회"""
+        with self.read() as cursor:
+            cursor.execute('SELECT last_id, filters_hash, updated_at FROM rescore_progress WHERE id = 1')
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {'last_id': row[0], 'filters_hash': row[1], 'updated_at': row[2]}
+    
+    def count_articles_after(self, last_id):
+        """id 이후 기사 수"""
+        with self.read() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM rss_articles WHERE id > ?', (last_id,))
+            return cursor.fetchone()[0]
+    
+    def get_articles_for_rescore(self, last_id, limit):
+        """재채점 배치 조회 (id, title, content, 압축 본문)"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT a.id, a.title, a.content, t.text 
+                FROM rss_articles a
+                LEFT JOIN article_texts t ON t.article_id = a.id
+                WHERE a.id > ?
+                ORDER BY a.id 
+                LIMIT ?
+            ''', (last_id, limit))
+            return cursor.fetchall()
+    
+    def apply_rescore_batch(self, updates, last_id, filters_hash):
+        """점수 일괄 업데이트 + 진행 상황 저장 (단일 트랜잭션), updates: [(score, id)]"""
+        with self.write() as cursor:
+            cursor.executemany('UPDATE rss_articles SET score = ? WHERE id = ?', updates)
+            cursor.execute('''
+                INSERT OR REPLACE INTO rescore_progress (id, last_id, filters_hash, updated_at)
+                VALUES (1, ?, ?, CURRENT_TIMESTAMP)
+            ''', (last_id, filters_hash))
+    
+    def count_labeled_articles(self, after_id, delay_hours):
+        """라벨이 확정된(작성 후 delay_hours 경과) 클러스터 대표 기사 수 → (전체, 사용됨)"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT COUNT(*), COALESCE(SUM(is_used), 0) 
+                FROM rss_articles 
+                WHERE id > ? AND created_at <= datetime('now', ?) AND (cluster_id IS NULL OR cluster_id = id)
+            ''', (after_id, f'-{delay_hours} hours'))
+            return cursor.fetchone()
+    
+    def get_labeled_articles(self, after_id, delay_hours, limit):
+        """모델 학습 배치 조회 (id, title, content, is_used), 편집자에게 안 보이는 클러스터 구성원 제외"""
+        with self.read() as cursor:
+            cursor.execute('''
+                SELECT id, title, content, is_used 
+                FROM rss_articles 
+                WHERE id > ? AND created_at <= datetime('now', ?) AND (cluster_id IS NULL OR cluster_id = id)
+                ORDER BY id 
+                LIMIT ?
+            ''', (after_id, f'-{delay_hours} hours', limit))
+            return cursor.fetchall()
     
     def mark_as_used(self, article_id):
         """기사를 '사용됨'으로 표시"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            'UPDATE rss_articles SET is_used = 1 WHERE id = ?',
-            (article_id,)
-        )
-        self.conn.commit()
+        with self.write() as cursor:
+            cursor.execute(
+                'UPDATE rss_articles SET is_used = 1 WHERE id = ?',
+                (article_id,)
+            )
+    
+    def get_feed_cache(self, url):
+        """피드 캐시 검증값 조회"""
+        with self.read() as cursor:
+            cursor.execute(
+                'SELECT etag, last_modified, content_hash FROM feed_cache WHERE url = ?',
+                (url,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {
+                'etag': row[0],
+                'last_modified': row[1],
+                'content_hash': row[2]
+            }
+    
+    def save_feed_cache(self, url, etag, last_modified, content_hash):
+        """피드 캐시 검증값 저장"""
+        with self.write() as cursor:
+            cursor.execute('''
+                INSERT OR REPLACE INTO feed_cache 
+                (url, etag, last_modified, content_hash, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (url, etag, last_modified, content_hash))
+    
+    # ---------- 월별 아카이브 (data/archive/news-YYYY-MM.db) ----------
+    
+    def archive_path(self, month):
+        return self.archive_dir / f'news-{month}.db'
+    
+    def _archives(self, since=None, until=None):
+        """기간 [since, until)과 겹치는 아카이브 파일 목록 (최신 달부터)"""
+        if not self.archive_dir.exists():
+            return []
+        paths = []
+        for path in sorted(self.archive_dir.glob('news-*.db'), reverse=True):
+            month = path.stem[len('news-'):]
+            if since is not None and _next_month(month) <= since:
+                continue
+            if until is not None and f'{month}-01' >= until:
+                continue
+            paths.append(path)
+        return paths
+    
+    @contextmanager
+    def _attached(self, cursor, path):
+        """아카이브 파일을 읽기 연결에 잠시 읽기 전용으로 ATTACH (스키마 이름 archive)"""
+        cursor.execute('ATTACH DATABASE ? AS archive', (f"{path.resolve().as_uri()}?mode=ro",))
+        try:
+            yield
+        finally:
+            cursor.execute('DETACH DATABASE archive')
+    
+    def get_archived_entries(self, since):
+        """since 이후 아카이브된 기사 [(url, 제목, 요약)] (수집 인덱스 재구성용)"""
+        entries = []
+        with self.read() as cursor:
+            for path in self._archives(since):
+                with self._attached(cursor, path):
+                    cursor.execute(
+                        'SELECT url, title, content FROM archive.rss_articles WHERE created_at >= ?', (since,)
+                    )
+                    entries += [(url, title, _decompress(content)) for url, title, content in cursor]
+        return entries
+    
+    def get_articles(self, since, until=None, source=None, category=None, limit=100):
+        """기간 내 기사 최신순 (본 DB + 겹치는 아카이브, 본문/요약은 압축 해제해 반환)
+        
+        같은 사건 묶음은 대표 기사만 (최신 기사 목록과 같은 기준)
+        """
+        # 출처/카테고리는 +로 인덱스 사용을 막아 created_at 인덱스를 최신순으로 훑게 함
+        conditions, params = ['created_at >= ?', '(cluster_id IS NULL OR cluster_id = id)'], [since]
+        for column, value in (('created_at <', until), ('+source =', source), ('+category =', category)):
+            if value is not None:
+                conditions.append(f'{column} ?')
+                params.append(value)
+        where = ' AND '.join(conditions)
+        
+        def select(cursor, schema):
+            cursor.execute(f'''
+                SELECT id, title, title_ko, url, source, category, score, created_at, content, content_ko 
+                FROM {schema}.rss_articles 
+                WHERE {where} 
+                ORDER BY created_at DESC 
+                LIMIT ?
+            ''', params + [limit])
+            names = [d[0] for d in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+        
+        with self.read() as cursor:
+            articles = select(cursor, 'main')
+            for path in self._archives(since, until):
+                if len(articles) >= limit:
+                    break
+                with self._attached(cursor, path):
+                    articles += select(cursor, 'archive')
+        
+        for article in articles:
+            article['content'] = _decompress(article['content'])
+            article['content_ko'] = _decompress(article['content_ko'])
+        return articles[:limit]
+    
+    def get_archivable_months(self, before):
+        """before(월 첫날) 이전에 기사나 Wikipedia 변경이 있는 달 목록 ['YYYY-MM']"""
+        with self.read() as cursor:
+            oldest = [
+                cursor.execute('SELECT MIN(created_at) FROM rss_articles').fetchone()[0],
+                cursor.execute('SELECT MIN(detected_at) FROM wiki_changes').fetchone()[0],
+            ]
+        oldest = [value for value in oldest if value]
+        if not oldest:
+            return []
+        
+        months, month = [], min(oldest)[:7]
+        while f'{month}-01' < before:
+            months.append(month)
+            month = _next_month(month)[:7]
+        return months
+    
+    def archive_month(self, month):
+        """한 달치 기사/본문/Wikipedia 변경을 아카이브 파일로 이동 → 옮긴 기사 수
+        
+        ATTACH한 두 파일에 걸친 커밋은 WAL에서 원자적이지 않아
+        1) 아카이브에 복사(압축) 후 커밋 → 2) 개수 확인 후 본 DB에서 삭제 순으로 나눔
+        (도중에 멈춰도 다시 실행하면 이어서 완료)
+        """
+        start, end = f'{month}-01', _next_month(month)
+        with self.read() as cursor:
+            articles = cursor.execute(
+                'SELECT COUNT(*) FROM rss_articles WHERE created_at >= ? AND created_at < ?', (start, end)
+            ).fetchone()[0]
+            changes = cursor.execute(
+                'SELECT COUNT(*) FROM wiki_changes WHERE detected_at >= ? AND detected_at < ?', (start, end)
+            ).fetchone()[0]
+        if not articles and not changes:
+            return 0
+        
+        path = self.archive_path(month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection(readonly=False)
+        conn.create_function('zcompress', 1, _compress, deterministic=True)
+        conn.execute('ATTACH DATABASE ? AS archive', (str(path),))
+        try:
+            with self.write() as cursor:
+                create_archive_tables(cursor)
+                if articles:
+                    self._copy_articles(cursor, start, end)
+                cursor.execute('''
+                    INSERT OR REPLACE INTO archive.wiki_changes 
+                    SELECT id, page_title, revision_id, timestamp, editor, comment, size_change, detected_at 
+                    FROM main.wiki_changes 
+                    WHERE detected_at >= ? AND detected_at < ?
+                ''', (start, end))
+            
+            with self.write() as cursor:
+                if articles:
+                    self._delete_articles(cursor, start, end)
+                cursor.execute('''
+                    DELETE FROM main.wiki_changes 
+                    WHERE detected_at >= ? AND detected_at < ? 
+                      AND id IN (SELECT id FROM archive.wiki_changes)
+                ''', (start, end))
+        finally:
+            conn.execute('DETACH DATABASE archive')
+        return articles
+    
+    def _copy_articles(self, cursor, start, end):
+        """1단계: 기사/본문 복사, 아카이브 검색 인덱스와 집계 재계산
+        
+        지난 달은 더 바뀌지 않고 2단계가 한 달치를 한 번에 지우므로,
+        본 DB에 기사가 남아 있으면 그 달 전체가 남아 있는 것 → 색인을 통째로 다시 만듦
+        """
+        cursor.execute('''
+            INSERT OR REPLACE INTO archive.rss_articles 
+            SELECT id, title, title_ko, url, source, published_date, 
+                   zcompress(content), zcompress(content_ko), category, score, is_used, cluster_id, created_at 
+            FROM main.rss_articles 
+            WHERE created_at >= ? AND created_at < ?
+        ''', (start, end))
+        cursor.execute('''
+            INSERT OR REPLACE INTO archive.article_texts 
+            SELECT t.article_id, t.text, t.length, t.status, t.fetched_at 
+            FROM main.rss_articles a 
+            JOIN main.article_texts t ON t.article_id = a.id 
+            WHERE a.created_at >= ? AND a.created_at < ?
+        ''', (start, end))
+        cursor.execute("INSERT INTO archive.articles_fts (articles_fts) VALUES ('delete-all')")
+        cursor.execute('''
+            INSERT INTO archive.articles_fts (rowid, title, title_ko, content, content_ko) 
+            SELECT id, title, title_ko, content, content_ko 
+            FROM main.rss_articles 
+            WHERE created_at >= ? AND created_at < ?
+        ''', (start, end))
+        cursor.execute("INSERT INTO archive.articles_bigram (articles_bigram) VALUES ('delete-all')")
+        rows = cursor.connection.execute('''
+            SELECT id, title, title_ko, content, content_ko 
+            FROM main.rss_articles 
+            WHERE created_at >= ? AND created_at < ?
+        ''', (start, end))
+        index_bigrams(cursor, rows, 'archive')
+        rebuild_article_stats(cursor, 'archive')
+    
+    def _delete_articles(self, cursor, start, end):
+        """2단계: 복사가 확인되면 본 DB에서 삭제 (집계는 유지)"""
+        hot, archived = cursor.execute('''
+            SELECT COUNT(*), COUNT(b.id) 
+            FROM main.rss_articles a 
+            LEFT JOIN archive.rss_articles b ON b.id = a.id 
+            WHERE a.created_at >= ? AND a.created_at < ?
+        ''', (start, end)).fetchone()
+        if hot != archived:
+            raise RuntimeError(f'아카이브 복사 누락: {archived}/{hot}')
+        
+        # 삭제 트리거가 집계를 줄이므로 아카이브 몫을 먼저 더해 둠 (총계/일별 수 유지)
+        cursor.execute('''
+            INSERT INTO main.article_stats (dimension, key, count) 
+            SELECT dimension, key, count FROM archive.article_stats WHERE true 
+            ON CONFLICT (dimension, key) DO UPDATE SET count = count + excluded.count
+        ''')
+        # 아카이브로 가는 기사를 대표로 둔 클러스터는 남는 기사 중 가장 오래된 것으로
+        # (행별 상관 서브쿼리는 먼저 바뀐 행을 보게 되므로 새 대표를 먼저 구해 둠)
+        cursor.execute('''
+            WITH representatives AS MATERIALIZED (
+                SELECT cluster_id AS old_id, MIN(id) AS new_id 
+                FROM main.rss_articles 
+                WHERE created_at >= ? AND cluster_id IN (
+                    SELECT id FROM main.rss_articles WHERE created_at >= ? AND created_at < ?
+                ) 
+                GROUP BY cluster_id
+            ) 
+            UPDATE main.rss_articles 
+            SET cluster_id = representatives.new_id 
+            FROM representatives 
+            WHERE rss_articles.cluster_id = representatives.old_id AND rss_articles.created_at >= ?
+        ''', (end, start, end, end))
+        cursor.execute('''
+            DELETE FROM main.article_texts 
+            WHERE article_id IN (SELECT id FROM main.rss_articles WHERE created_at >= ? AND created_at < ?)
+        ''', (start, end))
+        cursor.execute('''
+            DELETE FROM main.articles_bigram 
+            WHERE rowid IN (SELECT id FROM main.rss_articles WHERE created_at >= ? AND created_at < ?)
+        ''', (start, end))
+        cursor.execute('DELETE FROM main.rss_articles WHERE created_at >= ? AND created_at < ?', (start, end))
+    
+    def vacuum(self):
+        """아카이브 후 빈 페이지를 반환해 파일 축소 (실행 중에는 다른 쓰기가 대기)"""
+        self.conn.execute('VACUUM')
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""RSS 피드 다운로드 모듈 (동기 / 비동기)"""
+
+import asyncio
+import logging
+import time
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "MilitaryNewsAggregator/0.1 (+https://github.com/hugh79757-cmyk/mil)"
+
+
+class FeedFetcher:
+    """피드 원문 다운로드 (타임아웃, 동시성 제한)"""
+
+    def __init__(self, config):
+        rss_config = config.get('rss', {})
+        self.timeout = rss_config.get('fetch_timeout', 15)
+        self.max_concurrency = rss_config.get('max_concurrency', 20)
+        self.per_host_limit = rss_config.get('per_host_limit', 4)
+        logger.info(
+            f"피드 다운로더 초기화: 타임아웃 {self.timeout}초, "
+            f"동시 {self.max_concurrency}개 (호스트당 {self.per_host_limit}개)"
+        )
+
+    def fetch(self, feed_config, cache=None, timeout=None):
+        """단일 피드 다운로드 (동기, timeout: 남은 주기 시간으로 단축 가능)
+        
+        requests의 timeout은 소켓 읽기마다 새로 재므로 조금씩 보내는 서버는 끝없이 붙잡음
+        → aiohttp 전체 시간 제한(연결~본문 끝)으로 받음
+        """
+        total = min(self.timeout, timeout) if timeout else self.timeout
+        return asyncio.run(self._fetch_single(feed_config, cache, total))
+
+    def fetch_all(self, feed_configs, caches=None, deadline=None):
+        """여러 피드 동시 다운로드 (URL → 결과 또는 예외, deadline: time.monotonic 기준)"""
+        return asyncio.run(self._fetch_all_async(feed_configs, caches or {}, deadline))
+
+    def _conditional_headers(self, cache):
+        """저장된 검증값으로 조건부 요청 헤더 생성"""
+        headers = {'User-Agent': USER_AGENT}
+        if cache:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+        return headers
+
+    def _result(self, status, body, headers):
+        """다운로드 결과 (304면 본문 없음)"""
+        return {
+            'status': status,
+            'body': body if status != 304 else None,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified')
+        }
+
+    async def _fetch_all_async(self, feed_configs, caches, deadline=None):
+        """aiohttp 세션 하나로 모든 피드 다운로드"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.per_host_limit
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout
+        ) as session:
+            tasks = [
+                asyncio.create_task(
+                    self._fetch_one(session, semaphore, feed_config, caches.get(feed_config['url']))
+                )
+                for feed_config in feed_configs
+            ]
+            if not tasks:
+                return {}
+
+            # 주기 마감까지 끝나지 않은 다운로드는 취소
+            budget = max(0, deadline - time.monotonic()) if deadline else None
+            done, pending = await asyncio.wait(tasks, timeout=budget)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        results = {}
+        for feed_config, task in zip(feed_configs, tasks):
+            if task in pending:
+                results[feed_config['url']] = TimeoutError("주기 마감 시간 초과")
+            elif task.exception() is not None:
+                results[feed_config['url']] = task.exception()
+            else:
+                results[feed_config['url']] = task.result()
+        return results
+
+    async def _fetch_single(self, feed_config, cache, total):
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=total)) as session:
+            return await self._fetch_one(session, asyncio.Semaphore(1), feed_config, cache, total)
+
+    async def _fetch_one(self, session, semaphore, feed_config, cache=None, total=None):
+        """단일 피드 다운로드 (비동기)"""
+        headers = self._conditional_headers(cache)
+        async with semaphore:
+            try:
+                async with session.get(feed_config['url'], headers=headers) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                    return self._result(response.status, body, response.headers)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"{total or self.timeout:g}초 내 응답 없음")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""피드별 서킷 브레이커 (상태는 DB에 저장)"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class FeedCircuitBreaker:
+    """연속 실패한 피드를 일정 시간 차단 (closed → open → half_open → closed)"""
+
+    def __init__(self, config, db):
+        rss_config = config.get('rss', {})
+        self.db = db
+        self.threshold = rss_config.get('breaker_threshold', 3)
+        self.cooldown = rss_config.get('breaker_cooldown', 1800)
+        self.lock = threading.Lock()
+        self.health = {row['feed_name']: row for row in db.get_feed_health()}
+        opened = [name for name, h in self.health.items() if h['state'] != CLOSED]
+        if opened:
+            logger.info(f"서킷 브레이커 복원: 차단 중 {', '.join(opened)}")
+
+    def _get(self, name):
+        """피드 상태 (없으면 기본값 생성)"""
+        if name not in self.health:
+            self.health[name] = {
+                'feed_name': name,
+                'state': CLOSED,
+                'failures': 0,
+                'opened_at': 0,
+                'skips': 0,
+                'polls': 0,
+                'articles': 0,
+                'last_error': None,
+            }
+        return self.health[name]
+
+    def _save(self, health):
+        try:
+            self.db.save_feed_health(health)
+        except Exception as e:
+            logger.error(f"브레이커 상태 저장 오류: {e}")
+
+    def allow(self, name):
+        """이번 주기 수집 허용 여부 (open 상태는 대기 시간이 지나면 시험 1회 허용)"""
+        with self.lock:
+            health = self._get(name)
+            if health['state'] == OPEN:
+                if time.time() - health['opened_at'] < self.cooldown:
+                    health['skips'] += 1
+                    self._save(health)
+                    return False
+                health['state'] = HALF_OPEN
+                logger.info(f"🟡 {name}: 시험 수집 (half-open)")
+                self._save(health)
+            return True
+
+    def reopens_at(self, name):
+        """차단 해제(시험 수집 허용) 시각 (epoch 초)"""
+        return self._get(name)['opened_at'] + self.cooldown
+
+    def record_success(self, name, articles):
+        """수집 성공"""
+        with self.lock:
+            health = self._get(name)
+            if health['state'] != CLOSED:
+                logger.info(f"🟢 {name}: 정상 복구")
+            health['state'] = CLOSED
+            health['failures'] = 0
+            health['polls'] += 1
+            health['articles'] += articles
+            self._save(health)
+
+    def record_failure(self, name, error):
+        """수집 실패 (half-open 실패 또는 연속 실패 임계치 도달 시 차단)"""
+        with self.lock:
+            health = self._get(name)
+            health['failures'] += 1
+            health['polls'] += 1
+            health['last_error'] = str(error)[:200]
+            if health['state'] == HALF_OPEN or health['failures'] >= self.threshold:
+                health['state'] = OPEN
+                health['opened_at'] = time.time()
+                logger.warning(f"🔴 {name}: {health['failures']}회 연속 실패, {self.cooldown}초 차단")
+            self._save(health)
+
+    def record_skip(self, name):
+        """주기 시간 초과로 건너뜀"""
+        with self.lock:
+            health = self._get(name)
+            health['skips'] += 1
+            self._save(health)
+
+    def productivity(self, name):
+        """수집당 평균 신규 기사 수"""
+        health = self._get(name)
+        if not health['polls']:
+            return float('inf')
+        return health['articles'] / health['polls']
+
+    def status(self):
+        """상태 요약 목록"""
+        with self.lock:
+            return [dict(h) for h in self.health.values()]
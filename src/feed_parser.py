@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""스트리밍 RSS/Atom 파서 (lxml.iterparse)"""
+
+import io
+import logging
+
+from feedparser.sanitizer import _sanitize_html
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+CONTENT = '{http://purl.org/rss/1.0/modules/content/}'
+DC = '{http://purl.org/dc/elements/1.1/}'
+RDF_ITEM = '{http://purl.org/rss/1.0/}item'
+
+ENTRY_TAGS = ('item', RDF_ITEM, f'{ATOM}entry')
+
+
+class FeedParseError(Exception):
+    """스트리밍 파싱 실패 (feedparser로 대체 필요)"""
+
+
+def _text(elem):
+    """하위 요소 포함 전체 텍스트"""
+    if elem is None:
+        return ''
+    return ''.join(elem.itertext()).strip()
+
+
+def _find_text(elem, *tags):
+    """여러 후보 태그 중 처음 값이 있는 텍스트"""
+    for tag in tags:
+        text = _text(elem.find(tag))
+        if text:
+            return text
+    return ''
+
+
+def _summary(text):
+    """feedparser와 같은 HTML 정리 (script/iframe/위험 속성 제거, 스타일 정규화)
+
+    두 파서의 요약이 같아야 내용 해시가 같아져 파서가 바뀌어도 '변경'으로 보지 않음
+    (feedparser에 공개 API가 없어 내부 함수 사용, requirements에서 버전 고정)
+    """
+    if '<' not in text:
+        return text
+    return _sanitize_html(text, 'utf-8', 'text/html').strip()
+
+
+def _atom_link(elem):
+    """Atom 항목의 대표 링크 (rel=alternate 우선)"""
+    fallback = ''
+    for link in elem.iterfind(f'{ATOM}link'):
+        href = link.get('href', '')
+        if link.get('rel', 'alternate') == 'alternate':
+            return href
+        fallback = fallback or href
+    return fallback
+
+
+def _entry(elem):
+    """항목 요소 → feedparser 항목과 같은 키의 dict"""
+    if elem.tag == f'{ATOM}entry':
+        return {
+            'title': _find_text(elem, f'{ATOM}title'),
+            'link': _atom_link(elem),
+            'summary': _summary(_find_text(elem, f'{ATOM}summary', f'{ATOM}content')),
+            'published': _find_text(elem, f'{ATOM}published', f'{ATOM}updated'),
+        }
+
+    ns = '{http://purl.org/rss/1.0/}' if elem.tag == RDF_ITEM else ''
+    return {
+        'title': _find_text(elem, f'{ns}title'),
+        'link': _find_text(elem, f'{ns}link', 'guid'),
+        'summary': _summary(_find_text(elem, f'{ns}description', f'{CONTENT}encoded')),
+        'published': _find_text(elem, 'pubDate', f'{DC}date'),
+    }
+
+
+def iter_entries(body):
+    """피드 본문에서 항목을 하나씩 생성 (읽은 만큼만 파싱)"""
+    context = etree.iterparse(
+        io.BytesIO(body),
+        events=('end',),
+        tag=ENTRY_TAGS,
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True
+    )
+    try:
+        for _, elem in context:
+            entry = _entry(elem)
+
+            # 처리한 요소 메모리 해제
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+            yield {key: value for key, value in entry.items() if value}
+    except etree.XMLSyntaxError as e:
+        raise FeedParseError(str(e)) from e
+    finally:
+        del context
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""피드별 적응형 수집 주기 스케줄러"""
+
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_timestamp(published_date, created_at):
+    """published_date(RFC 822) 우선, 실패 시 created_at(UTC) → epoch 초"""
+    if published_date:
+        try:
+            dt = parsedate_to_datetime(published_date)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return dt.timestamp()
+        except (TypeError, ValueError):
+            pass
+
+    if created_at:
+        try:
+            dt = datetime.strptime(created_at, '%Y-%m-%d %H:%M:%S')
+            return dt.replace(tzinfo=timezone.utc).timestamp()
+        except ValueError:
+            pass
+
+    return None
+
+
+class FeedScheduler:
+    """피드별 게시 주기를 학습해 개별 수집 주기 결정 (오류 시 지수 백오프 + 지터)"""
+
+    def __init__(self, config, db):
+        self.db = db
+        schedule = config['schedule']
+        self.default_interval = schedule['rss_collection_interval']
+        self.min_interval = schedule.get('rss_min_interval', 60)
+        self.max_interval = schedule.get('rss_max_interval', 3600)
+        self.max_backoff = schedule.get('rss_max_backoff', 21600)
+        self.cadence_factor = schedule.get('rss_cadence_factor', 0.5)
+        self.jitter = schedule.get('rss_jitter', 0.1)
+        self.relearn_interval = schedule.get('rss_relearn_interval', 3600)
+        self.history_size = 50
+
+        self.feeds = config['rss_feeds']
+        self.state = {}
+        self.last_learned = 0
+        self.learn()
+
+        # 첫 주기는 모든 피드를 바로 수집 (지터로 분산)
+        now = time.time()
+        for feed_config in self.feeds:
+            self._state(feed_config)['next_poll'] = now + random.uniform(0, self.jitter * self.min_interval)
+
+    def _state(self, feed_config):
+        """피드 상태 (없으면 기본값 생성)"""
+        name = feed_config['name']
+        if name not in self.state:
+            self.state[name] = {
+                'interval': self.default_interval,
+                'failures': 0,
+                'next_poll': 0,
+            }
+        return self.state[name]
+
+    def learn(self):
+        """DB 이력에서 피드별 평균 게시 간격 학습"""
+        for feed_config in self.feeds:
+            rows = self.db.get_feed_timestamps(feed_config['name'], self.history_size)
+            timestamps = sorted(
+                ts for ts in (_parse_timestamp(p, c) for p, c in rows) if ts is not None
+            )
+
+            state = self._state(feed_config)
+            if len(timestamps) < 2 or timestamps[-1] <= timestamps[0]:
+                state['interval'] = self.default_interval
+                continue
+
+            mean_gap = (timestamps[-1] - timestamps[0]) / (len(timestamps) - 1)
+            state['interval'] = max(
+                self.min_interval,
+                min(self.max_interval, mean_gap * self.cadence_factor)
+            )
+            logger.debug(f"⏱️ {feed_config['name']}: 평균 간격 {mean_gap:.0f}초 → 주기 {state['interval']:.0f}초")
+
+        self.last_learned = time.time()
+
+    def set_feeds(self, feeds):
+        """피드 목록 교체 (기존 피드 상태 유지, 신규 피드는 바로 수집)"""
+        names = {feed_config['name'] for feed_config in feeds}
+        self.state = {name: st for name, st in self.state.items() if name in names}
+        self.feeds = list(feeds)
+        self.learn()
+
+    def due_feeds(self, now=None):
+        """지금 수집할 피드 목록"""
+        now = now or time.time()
+        if now - self.last_learned >= self.relearn_interval:
+            self.learn()
+        return [fc for fc in self.feeds if self._state(fc)['next_poll'] <= now]
+
+    def seconds_until_next(self, now=None):
+        """다음 수집까지 남은 시간 (초)"""
+        now = now or time.time()
+        if not self.feeds:
+            return self.default_interval
+        next_poll = min(self._state(fc)['next_poll'] for fc in self.feeds)
+        return max(0, next_poll - now)
+
+    def _schedule_next(self, state, delay):
+        """지터를 적용해 다음 수집 시각 설정"""
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        state['next_poll'] = time.time() + delay
+
+    def defer(self, feed_config, until=None):
+        """이번에 수집하지 못한 피드 미루기 (until: epoch 초, 없으면 학습된 주기 뒤)
+
+        브레이커 차단/주기 시간 초과로 건너뛴 피드가 계속 due 상태로 남아
+        수집 루프가 쉬지 않고 도는 것을 막음
+        """
+        state = self._state(feed_config)
+        if until is None:
+            self._schedule_next(state, state['interval'])
+        else:
+            state['next_poll'] = max(until, time.time() + self.min_interval * self.jitter)
+
+    def record_success(self, feed_config):
+        """수집 성공 → 학습된 주기로 복귀"""
+        state = self._state(feed_config)
+        state['failures'] = 0
+        self._schedule_next(state, state['interval'])
+
+    def record_failure(self, feed_config):
+        """수집 실패 → 지수 백오프"""
+        state = self._state(feed_config)
+        state['failures'] += 1
+        delay = min(self.max_backoff, state['interval'] * (2 ** state['failures']))
+        self._schedule_next(state, delay)
+        logger.warning(f"⏳ {feed_config['name']}: {state['failures']}회 연속 실패, {delay:.0f}초 후 재시도")
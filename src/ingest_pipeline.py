@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""단계별 수집 파이프라인 (fetch → parse → filter → persist → translate)"""
+
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Stage:
+    """제한된 대기열 + 작업자 스레드로 구성된 파이프라인 단계
+
+    handler가 반환한 작업은 다음 단계 대기열에 넣는다. 다음 대기열이 가득 차면
+    put이 막히므로 느린 단계가 앞 단계 속도를 자연스럽게 제한한다 (backpressure).
+    """
+
+    def __init__(self, name, handler, workers=1, queue_size=100, on_error=None):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.on_error = on_error
+        self.next = None
+        self.processed = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+        self.threads = []
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def put(self, job):
+        """작업 추가 (대기열이 가득 차면 대기)"""
+        self.queue.put(job)
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            try:
+                result = self.handler(job)
+                with self.lock:
+                    self.processed += 1
+                if result is not None and self.next:
+                    self.next.put(result)
+            except Exception as e:
+                with self.lock:
+                    self.errors += 1
+                if self.on_error:
+                    self.on_error(self.name, job, e)
+                else:
+                    logger.error(f"[{self.name}] 처리 오류: {e}")
+            finally:
+                self.queue.task_done()
+
+    def status(self):
+        return {
+            'stage': self.name,
+            'workers': self.workers,
+            'queue': self.queue.qsize(),
+            'capacity': self.queue.maxsize,
+            'processed': self.processed,
+            'errors': self.errors,
+        }
+
+
+class IngestPipeline:
+    """RSSCollector 처리 단계를 대기열로 연결해 동시에 실행"""
+
+    def __init__(self, config, collector):
+        self.collector = collector
+        pipeline_config = config.get('pipeline', {})
+        queue_size = pipeline_config.get('queue_size', 100)
+        workers = pipeline_config.get('workers', {})
+
+        self.stages = [
+            Stage('fetch', self._fetch, workers.get('fetch', 8), queue_size, self._on_error),
+            Stage('parse', self._parse, workers.get('parse', 2), queue_size, self._on_error),
+            Stage('filter', self._filter, workers.get('filter', 2), queue_size, self._on_error),
+            Stage('persist', self._persist, workers.get('persist', 1), queue_size, self._on_error),
+        ]
+        if collector.translator:
+            self.stages.append(
+                Stage('translate', self._translate, workers.get('translate', 1), queue_size, self._on_error)
+            )
+        for stage, next_stage in zip(self.stages, self.stages[1:]):
+            stage.next = next_stage
+
+        self.translate_batch = pipeline_config.get('translate_batch', 50)
+        self.in_flight = set()
+        self.lock = threading.Lock()
+        logger.info(
+            "수집 파이프라인 초기화: "
+            + " → ".join(f"{s.name}({s.workers})" for s in self.stages)
+        )
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def submit(self, feeds):
+        """피드 투입 (처리 중인 피드와 차단된 피드는 제외), 투입한 피드 수 반환"""
+        submitted = 0
+        for feed_config in feeds:
+            with self.lock:
+                if feed_config['name'] in self.in_flight:
+                    continue
+                self.in_flight.add(feed_config['name'])
+            if not self.collector.allowed_feeds([feed_config]):
+                self._done(feed_config)
+                continue
+            self.stages[0].put({'feed': feed_config})
+            submitted += 1
+        return submitted
+
+    def status(self):
+        """단계별 대기열 깊이/처리량"""
+        return [stage.status() for stage in self.stages]
+
+    def _done(self, feed_config):
+        with self.lock:
+            self.in_flight.discard(feed_config['name'])
+
+    def _finish(self, feed_config, articles):
+        """피드 처리 완료"""
+        self._done(feed_config)
+        self.collector.breaker.record_success(feed_config['name'], articles)
+        if self.collector.scheduler:
+            self.collector.scheduler.record_success(feed_config)
+
+    def _on_error(self, stage_name, job, error):
+        feed_config = job.get('feed')
+        if feed_config is None:
+            logger.error(f"[{stage_name}] 처리 오류: {error}")
+            return
+        logger.error(f"❌ [{stage_name}] {feed_config['name']} 오류: {error}")
+        self._done(feed_config)
+        self.collector.breaker.record_failure(feed_config['name'], error)
+        if self.collector.scheduler:
+            self.collector.scheduler.record_failure(feed_config)
+
+    # 단계별 처리
+
+    def _fetch(self, job):
+        feed_config = job['feed']
+        cache = self.collector.db.get_feed_cache(feed_config['url'])
+        fetched = self.collector.fetcher.fetch(feed_config, cache)
+        body_hash = self.collector.changed_body_hash(feed_config, fetched, cache)
+        if body_hash is None:
+            self._finish(feed_config, 0)
+            return None
+        job['fetched'] = fetched
+        job['body_hash'] = body_hash
+        return job
+
+    def _parse(self, job):
+        job['articles'], job['changed'] = self.collector.parse_entries(
+            job['feed'], job['fetched']['body']
+        )
+        return job
+
+    def _filter(self, job):
+        job['candidates'], job['filtered'] = self.collector.filter_articles(
+            job['feed'], job['articles'], job['changed']
+        )
+        return job
+
+    def _persist(self, job):
+        feed_config = job['feed']
+        saved = self.collector.persist_articles(job['candidates'], job['changed'])
+        self.collector.save_feed_cache(feed_config, job['fetched'], job['body_hash'])
+        logger.info(f"✅ {feed_config['name']}: {len(saved)}개 저장 ({job['filtered']}개 필터링됨)")
+        self._finish(feed_config, len(saved))
+        if saved and self.collector.translator:
+            return {'articles': saved}
+        return None
+
+    def _translate(self, job):
+        # 대기 중인 번역 작업을 모아 한 번에 요청
+        articles = list(job['articles'])
+        while len(articles) < self.translate_batch:
+            try:
+                articles.extend(self.stages[-1].queue.get_nowait()['articles'])
+                self.stages[-1].queue.task_done()
+            except queue.Empty:
+                break
+        self.collector._translate_articles(articles)
+        return None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Aho-Corasick 다중 키워드 매칭"""
+
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+def _is_word_char(ch):
+    return ch.isascii() and ch.isalnum()
+
+
+class KeywordMatcher:
+    """키워드 목록을 오토마톤으로 컴파일해 텍스트를 한 번만 훑어 매칭
+
+    keywords: {키워드: 태그 목록} (같은 키워드가 여러 목록에 있으면 태그도 여러 개)
+    word_boundary: True면 앞뒤가 영문/숫자가 아닌 위치에서만 매칭
+        (한글은 조사가 바로 붙으므로 경계로 보지 않음: "KAI의", "북한이"도 매칭)
+    """
+
+    def __init__(self, keywords, word_boundary=False):
+        self.word_boundary = word_boundary
+        self.patterns = []
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+
+        for keyword, tags in keywords.items():
+            self._insert(keyword.lower(), tuple(tags))
+        self._build_failure_links()
+
+    def _insert(self, pattern, tags):
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            next_state = self.goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][ch] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+            state = next_state
+        self.output[state] += (len(self.patterns),)
+        self.patterns.append((pattern, tags))
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크 구성, 출력은 실패 링크를 따라 미리 병합"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(ch, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def find(self, text):
+        """텍스트에 나타난 키워드 id 집합 (중복 제거)"""
+        text = text.lower()
+        goto, fail, output = self.goto, self.fail, self.output
+        found = set()
+        state = 0
+
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+            for pattern_id in output[state]:
+                if pattern_id in found:
+                    continue
+                if self.word_boundary and not self._at_boundary(text, i, len(self.patterns[pattern_id][0])):
+                    continue
+                found.add(pattern_id)
+
+        return found
+
+    @staticmethod
+    def _at_boundary(text, end, length):
+        start = end - length + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            return False
+        return True
+
+    def matches(self, text):
+        """[(키워드, 태그 목록)]"""
+        return [self.patterns[pattern_id] for pattern_id in sorted(self.find(text))]
@@ -11,6 +11,14 @@ from rss_collector import RSSCollector
 from wiki_monitor import WikipediaMonitor
 from content_filter import ContentFilter
 from translator import Translator
+from translation_worker import TranslationWorker
+from feed_scheduler import FeedScheduler
+from story_cluster import StoryClusterer
+from article_fetcher import ArticleFetcher
+from ingest_pipeline import IngestPipeline
+from sharded_collector import ShardedCollector
+from config_watcher import ConfigWatcher
+from archiver import Archiver
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,8 +32,8 @@ class MilitaryNewsAggregator:
         logger.info("🚀 Military News Aggregator 시작...")
         
         # 설정 로드
-        config_file = Path(__file__).parent.parent / 'config.yaml'
-        with open(config_file, 'r', encoding='utf-8') as f:
+        self.config_file = Path(__file__).parent.parent / 'config.yaml'
+        with open(self.config_file, 'r', encoding='utf-8') as f:
             self.config = yaml.safe_load(f)
         
         # 데이터베이스 초기화
@@ -35,14 +43,40 @@ class MilitaryNewsAggregator:
         
         # 모듈 초기화
         self.content_filter = ContentFilter(self.config)
-        self.translator = Translator(self.config)
+        self.translator = Translator(self.config, self.db)
+        self.translation_worker = None
+        # API 키가 없으면 번역할 수 없으니 작업자도 만들지 않음
+        if self.translator.translator and self.config.get('translation', {}).get('background_worker', False):
+            self.translation_worker = TranslationWorker(self.config, self.db, self.translator)
+        self.scheduler = None
+        if self.config['schedule'].get('adaptive_rss', False):
+            self.scheduler = FeedScheduler(self.config, self.db)
+        self.clusterer = None
+        if self.config.get('dedup', {}).get('enabled', False):
+            self.clusterer = StoryClusterer(self.config, self.db)
+        self.article_fetcher = None
+        if self.config.get('fulltext', {}).get('enabled', False):
+            self.article_fetcher = ArticleFetcher(self.config, self.db, self.content_filter)
         self.rss_collector = RSSCollector(
             self.config, 
             self.db, 
             self.content_filter,
-            self.translator
+            # 백그라운드 번역 중이면 수집 주기에서는 번역하지 않음
+            None if self.translation_worker else self.translator,
+            self.scheduler,
+            self.clusterer,
+            self.article_fetcher
         )
+        self.pipeline = None
+        self.sharded = None
+        if self.config.get('pipeline', {}).get('enabled', False):
+            self.pipeline = IngestPipeline(self.config, self.rss_collector)
+        elif self.config.get('sharding', {}).get('enabled', False):
+            self.sharded = ShardedCollector(self.config, self.rss_collector)
         self.wiki_monitor = WikipediaMonitor(self.config, self.db)
+        self.archiver = None
+        if self.config['database'].get('archive_enabled', False):
+            self.archiver = Archiver(self.config, self.db)
         
         logger.info("✅ 초기화 완료")
     
@@ -50,8 +84,12 @@ class MilitaryNewsAggregator:
         """모든 수집 모듈 시작"""
         threads = []
         
-        # 1. RSS 수집 스레드
+        # 1. RSS 수집 스레드 (파이프라인 모드면 단계별 작업자도 시작)
         logger.info("📡 RSS 수집 시작...")
+        if self.pipeline:
+            self.pipeline.start()
+        if self.sharded:
+            self.sharded.start()
         rss_thread = threading.Thread(
             target=self._run_rss_collector,
             daemon=True
@@ -59,7 +97,28 @@ class MilitaryNewsAggregator:
         threads.append(rss_thread)
         rss_thread.start()
         
-        # 2. Wikipedia 실시간 모니터링 스레드
+        # 2. 기사 본문 수집 작업자
+        if self.article_fetcher:
+            logger.info("📄 기사 본문 수집 시작...")
+            self.article_fetcher.start()
+        
+        # 3. 백그라운드 번역 작업자
+        if self.translation_worker:
+            logger.info("🌐 백그라운드 번역 시작...")
+            self.translation_worker.start()
+        
+        # 4. 설정 파일 변경 감시
+        reload_interval = self.config['schedule'].get('config_reload_interval', 0)
+        if reload_interval:
+            logger.info("🔄 설정 파일 변경 감시 시작...")
+            ConfigWatcher(self.config_file, self._apply_config, reload_interval).start()
+        
+        # 5. 월별 아카이브
+        if self.archiver:
+            logger.info("🗄️ 월별 아카이브 시작...")
+            self.archiver.start()
+        
+        # 6. Wikipedia 실시간 모니터링 스레드
         if self.config['wikipedia']['enabled']:
             logger.info("📚 Wikipedia 실시간 모니터링 시작...")
             wiki_thread = threading.Thread(
@@ -80,6 +139,44 @@ class MilitaryNewsAggregator:
                 self._print_status()
         except KeyboardInterrupt:
             logger.info("\n⏹️  종료 중...")
+            if self.sharded:
+                self.sharded.stop()
+    
+    def _apply_config(self, new_config):
+        """변경된 설정 부분만 다시 구성 (새 객체를 만든 뒤 참조만 교체)
+        
+        새 객체를 모두 만든 다음에 교체 → 중간에 실패하면 아무것도 바뀌지 않고 기존 설정 유지
+        """
+        old_config = self.config
+        
+        # 모델 사용 여부/가중치도 필터에 포함 (모델 파일 교체는 필터가 직접 감지)
+        content_filter = None
+        if (new_config['filters'] != old_config['filters']
+                or new_config.get('scoring') != old_config.get('scoring')):
+            content_filter = ContentFilter(new_config)
+        feeds_changed = new_config['rss_feeds'] != old_config['rss_feeds']
+        pages = new_config['wikipedia']['pages']
+        pages_changed = pages != old_config['wikipedia']['pages']
+        
+        if content_filter:
+            self.content_filter = content_filter
+            self.rss_collector.content_filter = content_filter
+            if self.article_fetcher:
+                self.article_fetcher.content_filter = content_filter
+            logger.info("🔄 키워드 필터/점수 모델 재구성")
+        
+        if feeds_changed:
+            self.rss_collector.set_feeds(new_config['rss_feeds'])
+            if self.scheduler:
+                self.scheduler.set_feeds(new_config['rss_feeds'])
+        
+        if pages_changed:
+            self.wiki_monitor.set_pages(pages)
+        
+        if new_config['database'] != old_config['database']:
+            logger.warning("⚠️ database 설정 변경은 재시작 후 적용됩니다")
+        
+        self.config = new_config
     
     def _run_rss_collector(self):
         """RSS 수집기 주기 실행"""
@@ -87,7 +184,23 @@ class MilitaryNewsAggregator:
         
         while True:
             try:
-                articles = self.rss_collector.collect_all()
+                if self.pipeline:
+                    # 파이프라인 모드: 피드만 투입하고 처리는 단계별 작업자가 담당
+                    due = self.scheduler.due_feeds() if self.scheduler else self.rss_collector.feeds
+                    self.pipeline.submit(due)
+                    articles = []
+                elif self.sharded:
+                    # 분산 모드: 작업자 프로세스가 다운로드/파싱, 이 스레드가 DB 작성
+                    due = self.scheduler.due_feeds() if self.scheduler else self.rss_collector.feeds
+                    articles = self.sharded.collect_all(due) if due else []
+                elif self.scheduler:
+                    due = self.scheduler.due_feeds()
+                    articles = self.rss_collector.collect_all(due) if due else []
+                else:
+                    articles = self.rss_collector.collect_all()
+                
+                if articles and self.translation_worker:
+                    self.translation_worker.notify()
                 
                 if articles:
                     sorted_articles = sorted(articles, key=lambda x: x.get('score', 0), reverse=True)
@@ -98,18 +211,59 @@ class MilitaryNewsAggregator:
             except Exception as e:
                 logger.error(f"RSS 수집 오류: {e}")
             
-            time.sleep(interval)
+            if self.scheduler:
+                # 가장 이른 피드 수집 시각까지 대기
+                time.sleep(max(1, self.scheduler.seconds_until_next()))
+            else:
+                time.sleep(interval)
     
     def _print_status(self):
         """시스템 상태 출력"""
         stats = self.db.get_statistics()
         logger.info(f"📊 통계: 총 {stats['total']}개 | 오늘 {stats['today']}개")
         
-        # DeepL 사용량 출력
+        # 피드 서킷 브레이커 상태
+        for health in self.rss_collector.breaker.status():
+            if health['state'] != 'closed' or health['skips']:
+                logger.info(
+                    f"🚦 {health['feed_name']}: {health['state']} "
+                    f"(연속 실패 {health['failures']}회, 건너뜀 {health['skips']}회)"
+                )
+        
+        # 파이프라인 단계별 대기열
+        if self.pipeline:
+            logger.info("🔀 파이프라인: " + " | ".join(
+                f"{s['stage']} {s['queue']}/{s['capacity']} (처리 {s['processed']}, 오류 {s['errors']})"
+                for s in self.pipeline.status()
+            ))
+        
+        # 백그라운드 번역 진행
+        if self.translation_worker:
+            worker = self.translation_worker.stats
+            logger.info(
+                f"🌐 번역 대기 {self.db.count_untranslated_articles():,}개 "
+                f"(완료 {worker['translated']:,}, 실패 {worker['failed']:,}"
+                f"{', 할당량 부족으로 중지' if worker['paused'] else ''})"
+            )
+        
+        # 번역 메모리 적중률
+        memory = self.translator.get_memory_stats()
+        if memory and memory['hits'] + memory['misses']:
+            logger.info(
+                f"🧠 번역 메모리: 적중 {memory['hits']:,} / 미적중 {memory['misses']:,} "
+                f"({memory['hit_rate']:.0%}), 절약 {memory['chars_saved']:,}자"
+            )
+        
+        # DeepL 사용량 출력 (로컬 집계)
         usage = self.translator.get_usage()
         if usage:
             percent = (usage['used'] / usage['limit']) * 100
             logger.info(f"🌐 DeepL: {usage['used']:,} / {usage['limit']:,} ({percent:.1f}%)")
+            if usage.get('exhausts_at'):
+                logger.info(
+                    f"   ⚠️ 예상 소진: {usage['exhausts_at']} (UTC), "
+                    f"점수 {usage['score_cutoff']} 이상만 번역"
+                )
 
 
 if __name__ == '__main__':
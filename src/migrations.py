@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""스키마 마이그레이션 (버전은 PRAGMA user_version에 기록)"""
+
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+
+def _columns(cursor, table):
+    return {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+
+
+def _add_column(cursor, table, column, definition):
+    """컬럼이 없을 때만 추가"""
+    if column not in _columns(cursor, table):
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
+
+def bigrams(text):
+    """'북한 해군' → '북한 해군', '잠수함' → '잠수 수함' (바이그램 색인용, SQL 함수로 등록해 씀)"""
+    if not text:
+        return text
+    return ' '.join(
+        word[i:i + 2]
+        for word in re.findall(r'\w{2,}', text.lower())
+        for i in range(len(word) - 1)
+    )
+
+
+def _v1_base_tables(cursor):
+    """기본 테이블 (버전 기록 이전에 만들어진 DB도 그대로 통과하도록 IF NOT EXISTS)"""
+    # RSS 기사 테이블
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rss_articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT,
+            title_ko TEXT,
+            url TEXT UNIQUE,
+            source TEXT,
+            published_date TEXT,
+            content TEXT,
+            category TEXT,
+            score INTEGER DEFAULT 0,
+            is_used INTEGER DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Wikipedia 변경 내역 테이블
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS wiki_changes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            page_title TEXT,
+            revision_id INTEGER,
+            timestamp TEXT,
+            editor TEXT,
+            comment TEXT,
+            size_change INTEGER,
+            detected_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # RSS 피드 조건부 요청 캐시 (ETag / Last-Modified / 본문 해시)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feed_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_hash TEXT,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # 피드별 서킷 브레이커 상태
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feed_health (
+            feed_name TEXT PRIMARY KEY,
+            state TEXT DEFAULT 'closed',
+            failures INTEGER DEFAULT 0,
+            opened_at REAL DEFAULT 0,
+            skips INTEGER DEFAULT 0,
+            polls INTEGER DEFAULT 0,
+            articles INTEGER DEFAULT 0,
+            last_error TEXT
+        )
+    ''')
+    
+    # 재채점 진행 상황 (단일 행)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rescore_progress (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            last_id INTEGER DEFAULT 0,
+            filters_hash TEXT,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # 기사 본문 (zlib 압축, 수집 실패 시 text NULL + status에 오류)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS article_texts (
+            article_id INTEGER PRIMARY KEY,
+            text BLOB,
+            length INTEGER DEFAULT 0,
+            status TEXT,
+            fetched_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # 번역 메모리 (key = 원문/언어쌍 해시)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS translation_memory (
+            key TEXT PRIMARY KEY,
+            source_text TEXT,
+            translated_text TEXT,
+            source_lang TEXT,
+            target_lang TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # DeepL 월별 문자 사용량 (로컬 집계, 가끔 API 값으로 보정)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS translation_usage (
+            month TEXT PRIMARY KEY,
+            used INTEGER DEFAULT 0,
+            char_limit INTEGER,
+            synced_at REAL
+        )
+    ''')
+
+    # 초기 스키마 이후 추가된 컬럼
+    _add_column(cursor, 'rss_articles', 'score', 'INTEGER DEFAULT 0')
+    _add_column(cursor, 'rss_articles', 'is_used', 'INTEGER DEFAULT 0')
+    _add_column(cursor, 'rss_articles', 'title_ko', 'TEXT')
+    _add_column(cursor, 'rss_articles', 'cluster_id', 'INTEGER')
+    _add_column(cursor, 'rss_articles', 'simhash', 'INTEGER')
+    _add_column(cursor, 'rss_articles', 'content_ko', 'TEXT')
+
+
+def _v2_hot_path_indexes(cursor):
+    """대시보드/수집 주기에서 반복되는 조회용 인덱스"""
+    # 최신 기사 / 최근 N일 (get_latest_articles, get_recent_scores)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_created ON rss_articles(created_at)')
+    # 오늘 기사 수 (DATE(created_at) = ? 그대로 인덱스 사용)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_created_date ON rss_articles(DATE(created_at))')
+    # 미사용 상위 기사: 부분 인덱스가 정렬까지 처리, cluster_id로 대표 기사 판정
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_articles_top 
+        ON rss_articles(score DESC, created_at DESC, cluster_id) WHERE is_used = 0
+    ''')
+    # 번역 대기 (점수순, 같은 점수는 rowid 역순)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_articles_untranslated 
+        ON rss_articles(score) WHERE title_ko IS NULL
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_articles_summary_pending 
+        ON rss_articles(score) WHERE content_ko IS NULL AND title_ko IS NOT NULL
+    ''')
+    # 피드별 최근 기사 (적응형 스케줄러 학습), 클러스터 미지정 기사
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_source ON rss_articles(source)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_cluster ON rss_articles(cluster_id)')
+    # Wikipedia 변경 최신순
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_wiki_detected ON wiki_changes(detected_at)')
+
+
+def rebuild_article_stats(cursor, schema='main'):
+    """기사 집계 전체 재계산 (트리거 밖에서 바뀐 데이터 등 어긋남 복구, 아카이브 파일 집계)"""
+    cursor.execute(f'DELETE FROM {schema}.article_stats')
+    cursor.execute(f'''
+        INSERT INTO {schema}.article_stats (dimension, key, count)
+        SELECT 'total', '', COUNT(*) FROM {schema}.rss_articles
+        UNION ALL
+        SELECT 'day', COALESCE(DATE(created_at), ''), COUNT(*) FROM {schema}.rss_articles GROUP BY 1, 2
+        UNION ALL
+        SELECT 'source', COALESCE(source, ''), COUNT(*) FROM {schema}.rss_articles GROUP BY 1, 2
+        UNION ALL
+        SELECT 'category', COALESCE(category, ''), COUNT(*) FROM {schema}.rss_articles GROUP BY 1, 2
+    ''')
+
+
+def _v3_article_stats(cursor):
+    """일별/출처별/카테고리별 기사 수 집계 (트리거로 쓰기와 같은 트랜잭션에서 갱신)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS article_stats (
+            dimension TEXT,
+            key TEXT,
+            count INTEGER DEFAULT 0,
+            PRIMARY KEY (dimension, key)
+        )
+    ''')
+    
+    # 행마다 집계 4칸 (total / day / source / category)에 delta 반영
+    def upsert(row, delta):
+        return f'''
+            INSERT INTO article_stats (dimension, key, count) VALUES
+                ('day', COALESCE(DATE({row}.created_at), ''), {delta}),
+                ('source', COALESCE({row}.source, ''), {delta}),
+                ('category', COALESCE({row}.category, ''), {delta})
+            ON CONFLICT (dimension, key) DO UPDATE SET count = count + excluded.count;
+        '''
+    
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_article_stats_insert AFTER INSERT ON rss_articles
+        BEGIN
+            INSERT INTO article_stats (dimension, key, count) VALUES ('total', '', 1)
+            ON CONFLICT (dimension, key) DO UPDATE SET count = count + 1;
+            {upsert('NEW', 1)}
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_article_stats_delete AFTER DELETE ON rss_articles
+        BEGIN
+            UPDATE article_stats SET count = count - 1 WHERE dimension = 'total' AND key = '';
+            {upsert('OLD', -1)}
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_article_stats_update 
+        AFTER UPDATE OF created_at, source, category ON rss_articles
+        WHEN DATE(OLD.created_at) IS NOT DATE(NEW.created_at) 
+            OR OLD.source IS NOT NEW.source OR OLD.category IS NOT NEW.category
+        BEGIN
+            {upsert('OLD', -1)}
+            {upsert('NEW', 1)}
+        END
+    ''')
+    
+    rebuild_article_stats(cursor)
+
+
+def _v4_article_search(cursor):
+    """기사 전문 검색 (FTS5 트라이그램 = 띄어쓰기 없는 한국어도 부분 일치)"""
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+            title, title_ko, content, content_ko,
+            content = 'rss_articles', content_rowid = 'id', tokenize = 'trigram'
+        )
+    ''')
+    # 제목 일치를 본문보다 우선
+    cursor.execute("INSERT INTO articles_fts (articles_fts, rank) VALUES ('rank', 'bm25(10.0, 10.0, 1.0, 1.0)')")
+    
+    # 외부 콘텐츠 테이블이라 삭제/수정 시 이전 값으로 지워야 함
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_insert AFTER INSERT ON rss_articles
+        BEGIN
+            INSERT INTO articles_fts (rowid, title, title_ko, content, content_ko)
+            VALUES (NEW.id, NEW.title, NEW.title_ko, NEW.content, NEW.content_ko);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_delete AFTER DELETE ON rss_articles
+        BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, title, title_ko, content, content_ko)
+            VALUES ('delete', OLD.id, OLD.title, OLD.title_ko, OLD.content, OLD.content_ko);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_update 
+        AFTER UPDATE OF title, title_ko, content, content_ko ON rss_articles
+        BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, title, title_ko, content, content_ko)
+            VALUES ('delete', OLD.id, OLD.title, OLD.title_ko, OLD.content, OLD.content_ko);
+            INSERT INTO articles_fts (rowid, title, title_ko, content, content_ko)
+            VALUES (NEW.id, NEW.title, NEW.title_ko, NEW.content, NEW.content_ko);
+        END
+    ''')
+    
+    cursor.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+
+def index_bigrams(cursor, rows, schema='main'):
+    """(id, title, title_ko, content, content_ko) 행을 바이그램 색인에 넣음 (같은 id는 교체)
+    
+    bigrams()는 Python 함수라 트리거 대신 Database 쓰기 메서드가 직접 호출
+    (트리거에서 쓰면 sqlite3 CLI 등 다른 연결의 수정/삭제가 실패)
+    """
+    cursor.executemany(f'''
+        INSERT OR REPLACE INTO {schema}.articles_bigram (rowid, title, title_ko, content, content_ko) 
+        VALUES (?, ?, ?, ?, ?)
+    ''', ((row[0], *map(bigrams, row[1:])) for row in rows))
+
+
+def rebuild_bigram_index(cursor):
+    """바이그램 색인을 기사 테이블에서 다시 만듦 (수동 SQL로 기사가 바뀌었을 때)"""
+    cursor.execute('DELETE FROM articles_bigram')
+    rows = cursor.connection.execute('SELECT id, title, title_ko, content, content_ko FROM rss_articles')
+    index_bigrams(cursor, rows)
+
+
+def _create_bigram_table(cursor):
+    # 색인할 바이그램 문자열도 저장 → rowid만으로 삭제/교체 가능 (원문 없는 색인은 이전 값이 필요)
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_bigram USING fts5(
+            title, title_ko, content, content_ko, tokenize = 'unicode61'
+        )
+    ''')
+    cursor.execute("INSERT INTO articles_bigram (articles_bigram, rank) VALUES ('rank', 'bm25(10.0, 10.0, 1.0, 1.0)')")
+
+
+def _v5_bigram_search(cursor):
+    """2글자 단어 검색 (트라이그램은 3글자 미만을 색인하지 못함)
+    
+    글자 둘씩 끊은 토큰을 unicode61로 색인 → 2글자 단어는 토큰 하나와 정확히 일치.
+    트리거 없이 Database 쓰기 메서드가 유지 (어긋나면 scripts/rebuild_stats.py)
+    """
+    _create_bigram_table(cursor)
+    rebuild_bigram_index(cursor)
+
+
+def _v6_drop_bigram_triggers(cursor):
+    """v5 초기 버전의 bigrams() 트리거/원문 없는 색인 → 현재 방식으로 교체"""
+    triggers = [row[0] for row in cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_articles_bigram_%'"
+    )]
+    if not triggers:
+        return
+    for name in triggers:
+        cursor.execute(f'DROP TRIGGER {name}')
+    cursor.execute('DROP TABLE articles_bigram')
+    _create_bigram_table(cursor)
+    rebuild_bigram_index(cursor)
+
+
+def create_archive_tables(cursor, schema='archive'):
+    """월별 아카이브 파일 스키마 (본문/요약은 zlib 압축 BLOB, 검색 인덱스는 원문 없는 FTS)"""
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {schema}.rss_articles (
+            id INTEGER PRIMARY KEY,
+            title TEXT,
+            title_ko TEXT,
+            url TEXT,
+            source TEXT,
+            published_date TEXT,
+            content BLOB,
+            content_ko BLOB,
+            category TEXT,
+            score INTEGER,
+            is_used INTEGER,
+            cluster_id INTEGER,
+            created_at TEXT
+        )
+    ''')
+    cursor.execute(f'CREATE INDEX IF NOT EXISTS {schema}.idx_articles_created ON rss_articles(created_at)')
+    
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {schema}.article_texts (
+            article_id INTEGER PRIMARY KEY,
+            text BLOB,
+            length INTEGER,
+            status TEXT,
+            fetched_at TEXT
+        )
+    ''')
+    
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {schema}.wiki_changes (
+            id INTEGER PRIMARY KEY,
+            page_title TEXT,
+            revision_id INTEGER,
+            timestamp TEXT,
+            editor TEXT,
+            comment TEXT,
+            size_change INTEGER,
+            detected_at TEXT
+        )
+    ''')
+    cursor.execute(f'CREATE INDEX IF NOT EXISTS {schema}.idx_wiki_detected ON wiki_changes(detected_at)')
+    
+    # 이 파일에 든 기사 집계 (본 DB 집계를 다시 계산할 때 더함)
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {schema}.article_stats (
+            dimension TEXT,
+            key TEXT,
+            count INTEGER DEFAULT 0,
+            PRIMARY KEY (dimension, key)
+        )
+    ''')
+    
+    # 원문은 압축해 두므로 색인만 저장 (스니펫 없음, BM25 순위는 가능)
+    cursor.execute(f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS {schema}.articles_fts USING fts5(
+            title, title_ko, content, content_ko, content = '', tokenize = 'trigram'
+        )
+    ''')
+    cursor.execute(
+        f"INSERT INTO {schema}.articles_fts (articles_fts, rank) VALUES ('rank', 'bm25(10.0, 10.0, 1.0, 1.0)')"
+    )
+    cursor.execute(f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS {schema}.articles_bigram USING fts5(
+            title, title_ko, content, content_ko, content = '', tokenize = 'unicode61'
+        )
+    ''')
+    cursor.execute(
+        f"INSERT INTO {schema}.articles_bigram (articles_bigram, rank) VALUES ('rank', 'bm25(10.0, 10.0, 1.0, 1.0)')"
+    )
+
+
+MIGRATIONS = [
+    (1, '기본 테이블', _v1_base_tables),
+    (2, '조회 인덱스', _v2_hot_path_indexes),
+    (3, '기사 집계 테이블', _v3_article_stats),
+    (4, '기사 전문 검색', _v4_article_search),
+    (5, '두 글자 검색', _v5_bigram_search),
+    (6, '두 글자 검색 트리거 제거', _v6_drop_bigram_triggers),
+]
+
+
+def migrate(db):
+    """미적용 마이그레이션을 버전 순으로 하나씩 (각각 한 트랜잭션) 적용 → 현재 버전"""
+    for version, description, apply in MIGRATIONS:
+        with db.write() as cursor:
+            # 다른 프로세스가 먼저 적용했을 수 있어 쓰기 잠금을 잡은 뒤 다시 확인
+            current = cursor.execute('PRAGMA user_version').fetchone()[0]
+            if version <= current:
+                continue
+            apply(cursor)
+            cursor.execute(f'PRAGMA user_version = {version}')
+        logger.info(f"🗄️ 스키마 v{version}: {description}")
+    return MIGRATIONS[-1][0]
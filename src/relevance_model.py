@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""편집자 선택(is_used) 학습 기반 관련도 모델 (해시 n-gram 선형 모델)"""
+
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 4
+MAX_TEXT_BYTES = 1000
+SEPARATOR = b'\x00' * NGRAM_SIZE
+
+
+def hash_features(texts, bits):
+    """텍스트 목록 → (특징 해시 id, 문서 번호, 문서별 특징 수) 배열
+
+    모든 텍스트를 구분자로 이어 붙인 한 버퍼에서 UTF-8 바이트 4-gram을 벡터 연산으로
+    해싱, 구분자에 걸친 창은 가중치가 항상 0인 마지막 칸(1 << bits)으로 보냄
+    """
+    encoded = [text.lower().encode('utf-8')[:MAX_TEXT_BYTES] for text in texts]
+    sizes = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+    buf = np.frombuffer(SEPARATOR.join(encoded) + SEPARATOR, dtype=np.uint8)
+
+    # 4바이트를 정수 하나로 묶은 뒤 곱셈-시프트 해싱
+    windows = len(buf) - NGRAM_SIZE + 1
+    grams = buf[:windows].astype(np.uint32)
+    for k in range(1, NGRAM_SIZE):
+        grams |= buf[k:k + windows].astype(np.uint32) << np.uint32(8 * k)
+    grams *= np.uint32(2654435761)
+    grams >>= np.uint32(32 - bits)
+
+    # 문서별 [유효 창 … | 구분자에 걸친 창 …] 패턴
+    counts = np.maximum(sizes - NGRAM_SIZE + 1, 0)
+    spans = sizes + len(SEPARATOR)
+    runs = np.column_stack((counts, spans - counts)).ravel()
+    valid = np.repeat(np.tile([True, False], len(encoded)), runs)[:windows]
+
+    ids = np.where(valid, grams, np.uint32(1 << bits))
+    docs = np.repeat(np.arange(len(encoded)), spans)[:windows]
+    return ids, docs, counts
+
+
+class RelevanceModel:
+    """해시 특징 로지스틱 회귀 (가중치 벡터 + 편향), 배치 단위로만 계산"""
+
+    def __init__(self, bits=18, weights=None, bias=0.0, trained_until=0, examples=0):
+        self.bits = bits
+        # 마지막 칸은 무효 창용 (항상 0)
+        self.weights = np.zeros((1 << bits) + 1) if weights is None else weights
+        self.bias = bias
+        self.trained_until = trained_until
+        self.examples = examples
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(
+                bits=int(data['bits']),
+                weights=data['weights'],
+                bias=float(data['bias']),
+                trained_until=int(data['trained_until']),
+                examples=int(data['examples'])
+            )
+
+    def save(self, path):
+        """임시 파일에 쓴 뒤 교체 (실행 중인 수집기가 반쯤 쓴 파일을 읽지 않도록)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                bits=self.bits,
+                weights=self.weights,
+                bias=self.bias,
+                trained_until=self.trained_until,
+                examples=self.examples
+            )
+        os.replace(tmp_path, path)
+
+    def _logits(self, ids, docs, counts):
+        sums = np.bincount(docs, weights=self.weights[ids], minlength=len(counts))
+        norms = 1.0 / np.sqrt(np.maximum(counts, 1))
+        return self.bias + sums * norms, norms
+
+    def predict(self, texts):
+        """텍스트 목록 → 선택 확률 배열 (0~1)"""
+        if not texts:
+            return np.zeros(0)
+        logits, _ = self._logits(*hash_features(texts, self.bits))
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    def train_batch(self, texts, labels, learning_rate=5.0, l2=1e-6, positive_weight=1.0):
+        """미니배치 경사 하강 1회 (양성 가중치로 클래스 불균형 보정), 로그 손실 반환"""
+        labels = np.asarray(labels, dtype=np.float64)
+        ids, docs, counts = hash_features(texts, self.bits)
+        logits, norms = self._logits(ids, docs, counts)
+        probs = 1.0 / (1.0 + np.exp(-logits))
+
+        sample_weights = np.where(labels > 0, positive_weight, 1.0)
+        errors = (probs - labels) * sample_weights / sample_weights.sum()
+        gradient = np.bincount(ids, weights=(errors * norms)[docs], minlength=len(self.weights))
+
+        gradient[-1] = 0.0
+        self.weights -= learning_rate * (gradient + l2 * self.weights)
+        self.bias -= learning_rate * errors.sum()
+
+        eps = 1e-12
+        losses = -(labels * np.log(probs + eps) + (1 - labels) * np.log(1 - probs + eps))
+        return float((losses * sample_weights).sum() / sample_weights.sum())
+
+
+def train(model, db, label_delay_hours=48, epochs=3, batch_size=5000):
+    """model.trained_until 이후의 라벨 확정 기사로 추가 학습 (편집자가 고를 시간이 지난 기사만)"""
+    total, positives = db.count_labeled_articles(model.trained_until, label_delay_hours)
+    if not total:
+        logger.info("학습할 새 기사 없음")
+        return 0
+    if not positives:
+        logger.warning(f"⚠️ 새 기사 {total:,}개 중 사용된 기사가 없어 학습 생략")
+        return 0
+
+    # 사용된 기사가 드물어 양성 가중치로 균형 보정
+    positive_weight = (total - positives) / positives
+    logger.info(f"🧠 학습: {total:,}개 (사용됨 {positives:,}개), {epochs} epoch")
+
+    last_id = model.trained_until
+    for epoch in range(epochs):
+        after_id, losses = model.trained_until, []
+        while True:
+            rows = db.get_labeled_articles(after_id, label_delay_hours, batch_size)
+            if not rows:
+                break
+            texts = [f"{title} {content or ''}" for _, title, content, _ in rows]
+            labels = [is_used for _, _, _, is_used in rows]
+            losses.append(model.train_batch(texts, labels, positive_weight=positive_weight))
+            after_id = rows[-1][0]
+        last_id = after_id
+        logger.info(f"   epoch {epoch + 1}: 손실 {np.mean(losses):.4f}")
+
+    model.trained_until = last_id
+    model.examples += total
+    return total
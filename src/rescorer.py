@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""기사 아카이브 일괄 재채점 (필터 변경 후)"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from content_filter import ContentFilter
+
+logger = logging.getLogger(__name__)
+
+_filter = None
+
+
+def _init_worker(config):
+    """작업자 프로세스별 필터 1회 컴파일"""
+    global _filter
+    _filter = ContentFilter(config)
+
+
+def _score_rows(rows):
+    """[(id, title, content, 압축 본문)] → [(점수, id)] (본문이 있으면 더 높은 점수)"""
+    scores = []
+    for _, title, content, text_blob in rows:
+        score = _filter.analyze(f"{title} {content or ''}")['score']
+        if text_blob:
+            text = zlib.decompress(text_blob).decode('utf-8')
+            score = max(score, _filter.analyze(f"{title} {text}")['score'])
+        scores.append(score)
+
+    # 모델 점수는 배치 전체를 한 번에
+    bonuses = _filter.model_bonus([f"{title} {content or ''}" for _, title, content, _ in rows])
+    return [(score + bonus, row[0]) for score, bonus, row in zip(scores, bonuses, rows)]
+
+
+def filters_hash(config):
+    """필터/모델 설정 해시 (설정이 바뀌면 처음부터 재채점)"""
+    data = json.dumps([config['filters'], config.get('scoring')], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+class Rescorer:
+    """rowid 순으로 배치를 읽어 프로세스 풀에서 채점 후 배치 UPDATE (중단 후 재개 가능)"""
+
+    def __init__(self, config, db, batch_size=2000, workers=None, pause=0.05):
+        self.config = config
+        self.db = db
+        self.batch_size = batch_size
+        self.workers = workers or multiprocessing.cpu_count()
+        self.pause = pause
+        self.filters_hash = filters_hash(config)
+        self.status = {'running': False, 'processed': 0, 'total': 0, 'last_id': 0, 'rate': 0.0}
+        self.stop_requested = threading.Event()
+
+    def run(self, restart=False):
+        """재채점 실행 (같은 필터로 중단된 작업이 있으면 이어서)"""
+        progress = self.db.get_rescore_progress()
+        last_id = 0
+        if progress and progress['filters_hash'] == self.filters_hash and not restart:
+            last_id = progress['last_id']
+            logger.info(f"🔁 재채점 재개: id {last_id} 이후")
+
+        self.status.update({
+            'running': True,
+            'processed': 0,
+            'total': self.db.count_articles_after(last_id),
+            'last_id': last_id,
+        })
+        self.stop_requested.clear()
+        started = time.time()
+
+        context = multiprocessing.get_context('spawn')
+        chunk = max(1, self.batch_size // self.workers)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.config,)
+            ) as pool:
+                rows = self.db.get_articles_for_rescore(last_id, self.batch_size)
+                while rows and not self.stop_requested.is_set():
+                    futures = [
+                        pool.submit(_score_rows, rows[i:i + chunk])
+                        for i in range(0, len(rows), chunk)
+                    ]
+                    last_id = rows[-1][0]
+
+                    # 채점하는 동안 다음 배치 미리 읽기
+                    next_rows = self.db.get_articles_for_rescore(last_id, self.batch_size)
+
+                    updates = [update for future in futures for update in future.result()]
+                    self.db.apply_rescore_batch(updates, last_id, self.filters_hash)
+
+                    self.status['processed'] += len(rows)
+                    self.status['last_id'] = last_id
+                    self.status['rate'] = self.status['processed'] / max(time.time() - started, 1e-6)
+                    rows = next_rows
+
+                    # 실시간 수집 쓰기가 끼어들 수 있도록 잠시 양보
+                    if self.pause:
+                        time.sleep(self.pause)
+        finally:
+            self.status['running'] = False
+
+        logger.info(
+            f"✅ 재채점 {'중단' if self.stop_requested.is_set() else '완료'}: "
+            f"{self.status['processed']:,}개 ({self.status['rate']:,.0f}개/초)"
+        )
+        return self.status
+
+    def stop(self):
+        self.stop_requested.set()
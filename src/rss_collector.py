@@ -2,8 +2,15 @@
 """RSS 피드 수집 모듈"""
 
 import feedparser
+import hashlib
 import logging
+import time
+from itertools import islice
 from datetime import datetime
+from feed_fetcher import FeedFetcher
+from feed_health import FeedCircuitBreaker
+from feed_parser import FeedParseError, iter_entries
+from seen_index import SeenIndex, content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -11,27 +18,70 @@ logger = logging.getLogger(__name__)
 class RSSCollector:
     """RSS 피드 수집 및 처리"""
     
-    def __init__(self, config, db, content_filter=None, translator=None):
+    def __init__(self, config, db, content_filter=None, translator=None, scheduler=None,
+                 clusterer=None, article_fetcher=None):
         self.config = config
         self.db = db
         self.feeds = config['rss_feeds']
         self.content_filter = content_filter
         self.translator = translator
+        self.scheduler = scheduler
+        self.clusterer = clusterer
+        self.article_fetcher = article_fetcher
+        self.fetcher = FeedFetcher(config)
+        self.seen_index = SeenIndex(db, config.get('database', {}).get('hot_months', 3))
+        self.breaker = FeedCircuitBreaker(config, db)
+        self.async_fetch = config.get('rss', {}).get('async_fetch', False)
+        self.streaming_parse = config.get('rss', {}).get('streaming_parse', False)
+        self.cycle_budget = config.get('rss', {}).get('cycle_budget', 120)
         logger.info(f"RSS 수집기 초기화: {len(self.feeds)}개 피드")
     
-    def collect_all(self):
-        """모든 RSS 피드 수집"""
+    def collect_all(self, feeds=None):
+        """RSS 피드 수집 (feeds 미지정 시 전체)"""
+        feeds = self.feeds if feeds is None else feeds
         all_articles = []
         total_filtered = 0
         
-        for feed_config in self.feeds:
+        started = time.monotonic()
+        deadline = started + self.cycle_budget
+        
+        # 차단된 피드 제외, 생산성 높은 피드부터 (시간 초과 시 덜 생산적인 피드가 밀려남)
+        feeds = self.allowed_feeds(feeds)
+        feeds.sort(key=lambda fc: self.breaker.productivity(fc['name']), reverse=True)
+        
+        # 비동기 모드: 모든 피드를 먼저 동시에 다운로드 (주기 시간의 1/4은 처리용으로 남김)
+        fetched = None
+        if self.async_fetch:
+            caches = {fc['url']: self.db.get_feed_cache(fc['url']) for fc in feeds}
+            fetched = self.fetcher.fetch_all(feeds, caches, started + self.cycle_budget * 0.75)
+        
+        for i, feed_config in enumerate(feeds):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                skipped = feeds[i:]
+                for fc in skipped:
+                    self.breaker.record_skip(fc['name'])
+                    if self.scheduler:
+                        self.scheduler.defer(fc)
+                logger.warning(f"⏱️ 주기 시간 초과: {', '.join(fc['name'] for fc in skipped)} 건너뜀")
+                break
+            
             try:
-                articles, filtered = self.collect_feed(feed_config)
+                if fetched is not None:
+                    articles, filtered = self.collect_feed(feed_config, fetched[feed_config['url']])
+                else:
+                    articles, filtered = self.collect_feed(feed_config, timeout=remaining)
                 all_articles.extend(articles)
                 total_filtered += filtered
                 logger.info(f"✅ {feed_config['name']}: {len(articles)}개 저장 ({filtered}개 필터링됨)")
+                self.breaker.record_success(feed_config['name'], len(articles))
+                if self.scheduler:
+                    self.scheduler.record_success(feed_config)
             except Exception as e:
                 logger.error(f"❌ {feed_config['name']} 오류: {e}")
+                self.breaker.record_failure(feed_config['name'], e)
+                if self.scheduler:
+                    self.scheduler.record_failure(feed_config)
         
         # 번역 처리 (배치로 한 번에)
         if self.translator and all_articles:
@@ -40,97 +90,235 @@ class RSSCollector:
         logger.info(f"📊 총계: {len(all_articles)}개 저장, {total_filtered}개 필터링됨")
         return all_articles
     
+    def allowed_feeds(self, feeds):
+        """브레이커가 허용한 피드만 (차단된 피드는 스케줄러에서 차단 해제 시각까지 미룸)"""
+        allowed = []
+        for feed_config in feeds:
+            if self.breaker.allow(feed_config['name']):
+                allowed.append(feed_config)
+            elif self.scheduler:
+                self.scheduler.defer(feed_config, self.breaker.reopens_at(feed_config['name']))
+        return allowed
+    
+    def set_feeds(self, feeds):
+        """피드 목록 교체 (진행 중인 주기는 기존 목록으로 끝남)"""
+        self.feeds = list(feeds)
+        logger.info(f"🔄 RSS 피드 목록 갱신: {len(self.feeds)}개")
+    
     def _translate_articles(self, articles):
         """기사 제목 번역"""
-        # 번역 안 된 기사만 필터링
-        to_translate = [a for a in articles if not a.get('title_ko')]
+        # 번역 안 된 클러스터 대표 기사만 필터링 (중복 기사는 대표만, 할당량이 빠듯하면 기준 점수 이상만)
+        min_score = self.translator.score_cutoff()
+        to_translate = [
+            a for a in articles
+            if not a.get('title_ko') and a.get('cluster_id') in (None, a.get('id'))
+            and a.get('score', 0) >= min_score
+        ]
         
         if not to_translate:
             return articles
         
         logger.info(f"🌐 {len(to_translate)}개 제목 번역 중...")
         
-        titles = [a['title'] for a in to_translate]
-        translated = self.translator.translate_batch(titles)
+        translated = self.translator.translate_many([a['title'] for a in to_translate])
         
-        # 번역 결과 적용
-        for article, title_ko in zip(to_translate, translated):
-            article['title_ko'] = title_ko
-            self._update_translation(article['url'], title_ko)
+        # 번역 결과 적용 (실패한 제목은 title_ko NULL로 남겨 다음에 재시도, DB는 한 번에 업데이트)
+        done = [a for a in to_translate if a['title'] in translated]
+        for article in done:
+            article['title_ko'] = translated[article['title']]
         
-        logger.info(f"✅ 번역 완료")
-        return articles
-    
-    def _update_translation(self, url, title_ko):
-        """DB에 번역 저장"""
         try:
-            cursor = self.db.conn.cursor()
-            cursor.execute(
-                'UPDATE rss_articles SET title_ko = ? WHERE url = ?',
-                (title_ko, url)
+            self.db.update_translations(
+                [(a['url'], a['title_ko']) for a in done]
             )
-            self.db.conn.commit()
         except Exception as e:
             logger.error(f"번역 저장 오류: {e}")
+        
+        logger.info(f"✅ 번역 완료: {len(done)}/{len(to_translate)}개")
+        return articles
     
-    def collect_feed(self, feed_config):
-        """단일 RSS 피드 수집"""
-        feed_name = feed_config['name']
-        feed_url = feed_config['url']
-        skip_filter = feed_config.get('skip_filter', False)
+    def collect_feed(self, feed_config, fetched=None, timeout=None):
+        """단일 RSS 피드 수집 (fetched: 미리 받아둔 다운로드 결과)"""
+        cache = self.db.get_feed_cache(feed_config['url'])
+        
+        if fetched is None:
+            fetched = self.fetcher.fetch(feed_config, cache, timeout)
+        elif isinstance(fetched, Exception):
+            raise fetched
+        
+        body_hash = self.changed_body_hash(feed_config, fetched, cache)
+        if body_hash is None:
+            return [], 0
         
-        feed = feedparser.parse(feed_url)
+        result = self.parse_and_process(feed_config, fetched['body'])
+        
+        # 처리 완료 후 검증값 저장 (실패 시 다음 주기에 재시도)
+        self.save_feed_cache(feed_config, fetched, body_hash)
+        return result
+    
+    def changed_body_hash(self, feed_config, fetched, cache):
+        """변경된 본문의 해시 (304 또는 본문 동일 시 None → 이후 작업 생략)"""
+        if fetched['status'] == 304:
+            logger.debug(f"⏭️ {feed_config['name']}: 변경 없음 (304)")
+            return None
+        
+        body_hash = hashlib.sha256(fetched['body']).hexdigest()
+        if cache and cache['content_hash'] == body_hash:
+            logger.debug(f"⏭️ {feed_config['name']}: 변경 없음 (동일 본문)")
+            # 서버가 ETag/Last-Modified만 바꿨으면 새 값으로 (다음부터 304를 받도록)
+            if (fetched['etag'], fetched['last_modified']) != (cache['etag'], cache['last_modified']):
+                self.save_feed_cache(feed_config, fetched, body_hash)
+            return None
+        return body_hash
+    
+    def save_feed_cache(self, feed_config, fetched, body_hash):
+        """피드 검증값 저장"""
+        self.db.save_feed_cache(
+            feed_config['url'],
+            fetched['etag'],
+            fetched['last_modified'],
+            body_hash
+        )
+    
+    def parse_and_process(self, feed_config, body):
+        """피드 본문 파싱 후 처리"""
+        articles, changed = self.parse_entries(feed_config, body)
+        return self.process_articles(feed_config, articles, changed)
+    
+    def process_entries(self, feed_config, entries, stop_at_seen=False):
+        """피드 항목 필터링/점수/저장 (stop_at_seen: 변경 없는 기존 항목에서 중단)"""
+        articles, changed = self.select_entries(feed_config, entries, stop_at_seen)
+        return self.process_articles(feed_config, articles, changed)
+    
+    def process_articles(self, feed_config, articles, changed):
+        """새 기사 필터링 후 저장, 변경 기사 업데이트"""
+        candidates, filtered_count = self.filter_articles(feed_config, articles, changed)
+        return self.persist_articles(candidates, changed), filtered_count
+    
+    def parse_entries(self, feed_config, body):
+        """피드 본문 파싱 → (새 기사, 변경 기사) (스트리밍 우선, 오류 시 feedparser)"""
+        if self.streaming_parse:
+            try:
+                return self.select_entries(feed_config, iter_entries(body), stop_at_seen=True)
+            except FeedParseError as e:
+                logger.warning(f"⚠️ {feed_config['name']}: 스트리밍 파싱 실패, feedparser로 재시도 ({e})")
+        
+        feed = feedparser.parse(body)
+        if feed.bozo and not feed.entries:
+            raise ValueError(f"피드 파싱 불가: {feed.get('bozo_exception')}")
+        return self.select_entries(feed_config, feed.entries)
+    
+    def select_entries(self, feed_config, entries, stop_at_seen=False):
+        """처리할 항목 선별 → (새 기사, 내용이 바뀐 기존 기사)"""
         articles = []
-        filtered_count = 0
+        changed = []
         
-        for entry in feed.entries[:20]:
+        for entry in islice(entries, 20):
+            url = entry.get('link', '')
+            title = entry.get('title', 'No title')
+            summary = entry.get('summary', '')[:500]
+            
+            # 이미 처리한 항목: 내용이 같으면 필터/점수 계산 없이 건너뜀
+            seen = self.seen_index.lookup(url)
+            if seen and seen[1] == content_hash(title, summary):
+                # 최신순 피드: 이후 항목도 이미 처리됨 → 나머지 읽기 생략
+                if stop_at_seen and seen[0]:
+                    break
+                continue
+            
             article = {
-                'title': entry.get('title', 'No title'),
-                'url': entry.get('link', ''),
-                'source': feed_name,
+                'title': title,
+                'url': url,
+                'source': feed_config['name'],
                 'published_date': entry.get('published', ''),
-                'summary': entry.get('summary', '')[:500],
+                'summary': summary,
                 'category': feed_config['category'],
                 'score': 0,
                 'title_ko': None
             }
             
-            # 필터링 적용
-            if self.content_filter and not skip_filter:
-                text = f"{article['title']} {article['summary']}"
-                if not self.content_filter.is_military_related(text):
+            # 저장된 기사의 제목/요약 변경 → 제자리 업데이트 대상
+            if seen and seen[0]:
+                article['url'] = seen[0]
+                changed.append(article)
+            else:
+                articles.append(article)
+        
+        return articles, changed
+    
+    def filter_articles(self, feed_config, articles, changed=()):
+        """키워드 필터링/점수 부여 → (저장할 기사, 필터링 수)"""
+        skip_filter = feed_config.get('skip_filter', False)
+        
+        candidates = []
+        filtered_count = 0
+        
+        # 설정 재적용 중에도 한 피드는 같은 필터로 처리
+        content_filter = self.content_filter
+        
+        if content_filter:
+            for article in changed:
+                article['score'] = content_filter.calculate_score(article)
+        
+        for article in articles:
+            # 필터링 + 점수를 한 번의 스캔으로
+            if content_filter:
+                result = content_filter.analyze(f"{article['title']} {article['summary']}")
+                if not skip_filter and not result['related']:
                     filtered_count += 1
+                    self.seen_index.add(article['url'], article['title'], article['summary'], stored=False)
                     logger.debug(f"🚫 필터링: {article['title'][:50]}...")
                     continue
-                article['score'] = self.content_filter.calculate_score(article)
-            elif self.content_filter and skip_filter:
-                article['score'] = self.content_filter.calculate_score(article)
+                article['score'] = result['score']
             
-            if self.save_article(article):
-                articles.append(article)
+            candidates.append(article)
+        
+        if content_filter:
+            content_filter.apply_model(candidates)
+            content_filter.apply_model(changed)
+        
+        return candidates, filtered_count
+    
+    def persist_articles(self, candidates, changed=()):
+        """피드 단위 일괄 저장 (한 트랜잭션), 새로 저장된 기사 반환
+        
+        DB 오류는 호출자로 전달 → 피드 실패로 처리되어 검증값을 저장하지 않고 다음 주기에 재시도
+        """
+        articles = self.save_articles(candidates)
+        if changed:
+            self.update_articles(changed)
+        return articles
+    
+    def save_articles(self, articles):
+        """기사 목록을 한 트랜잭션으로 저장, 새로 저장된 기사 반환 (DB 오류는 그대로 전달)"""
+        saved = self.db.insert_articles(articles)
+        
+        for article in articles:
+            self.seen_index.add(article['url'], article['title'], article['summary'])
+        
+        if self.clusterer and saved:
+            try:
+                self.clusterer.assign(saved)
+            except Exception as e:
+                logger.error(f"클러스터 지정 오류: {e}")
+        
+        # 본문 수집은 백그라운드 대기열로 (수집 주기를 막지 않음)
+        if self.article_fetcher and saved:
+            self.article_fetcher.submit(saved)
+        return saved
+    
+    def update_articles(self, articles):
+        """내용이 바뀐 기존 기사 업데이트 (DB 오류는 그대로 전달)"""
+        self.db.update_articles(articles)
         
-        return articles, filtered_count
+        for article in articles:
+            self.seen_index.add(article['url'], article['title'], article['summary'])
+        logger.info(f"✏️ {len(articles)}개 기사 내용 변경 반영")
     
     def save_article(self, article):
         """기사를 데이터베이스에 저장"""
         try:
-            cursor = self.db.conn.cursor()
-            cursor.execute('''
-                INSERT OR IGNORE INTO rss_articles 
-                (title, title_ko, url, source, published_date, content, category, score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                article['title'],
-                article.get('title_ko'),
-                article['url'],
-                article['source'],
-                article['published_date'],
-                article['summary'],
-                article['category'],
-                article.get('score', 0)
-            ))
-            self.db.conn.commit()
-            return cursor.rowcount > 0
+            return len(self.save_articles([article])) > 0
         except Exception as e:
             logger.error(f"저장 오류: {e}")
             return False
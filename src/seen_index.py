@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""수집 완료 항목 인덱스 (URL 정규화 + 내용 해시)"""
+
+import hashlib
+import logging
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from archiver import archive_cutoff
+
+logger = logging.getLogger(__name__)
+
+# 추적용 쿼리 파라미터 (정규화 시 제거)
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+    'cmpid', 'ref', 'ref_src', 'igshid', 'ocid', 'spm', 'sr_share',
+}
+
+# 피드에 아직 남아 있을 수 있는 아카이브 기사 범위 (가장 최근에 아카이브된 달부터 몇 개월)
+ARCHIVE_LOOKBACK_MONTHS = 1
+
+
+def canonicalize_url(url):
+    """URL 정규화 (스킴/www/추적 파라미터/프래그먼트/끝 슬래시 제거)"""
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if host.endswith(':80') or host.endswith(':443'):
+        host = host.rsplit(':', 1)[0]
+
+    path = parts.path.rstrip('/') or '/'
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ]
+    query.sort()
+
+    canonical = host + path
+    if query:
+        canonical += '?' + urlencode(query)
+    return canonical
+
+
+def content_hash(title, summary):
+    """제목 + 요약 해시"""
+    text = f"{title or ''}\n{summary or ''}"
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class SeenIndex:
+    """이미 처리한 항목의 메모리 인덱스
+
+    정규화 URL → (DB에 저장된 URL 또는 None, 내용 해시).
+    필터링으로 저장되지 않은 항목은 URL 자리에 None을 둔다 (재시작 시 재필터링).
+    """
+
+    def __init__(self, db, hot_months=3):
+        self.db = db
+        self.hot_months = hot_months
+        self.entries = {}
+        self.rebuild()
+
+    def rebuild(self):
+        """rss_articles(+ 최근 아카이브)에서 인덱스 재구성"""
+        entries = {}
+        with self.db.read() as cursor:
+            cursor.execute('SELECT url, title, content FROM rss_articles')
+            for url, title, content in cursor:
+                entries[canonicalize_url(url)] = (url, content_hash(title, content))
+        
+        # 아카이브로 옮긴 기사를 피드가 아직 보여주면 다시 저장하지 않도록
+        # (아카이브는 hot_months보다 오래된 달만 있으므로 그 기준에서 거슬러 올라감)
+        since = archive_cutoff(self.hot_months + ARCHIVE_LOOKBACK_MONTHS)
+        for url, title, content in self.db.get_archived_entries(since):
+            entries.setdefault(canonicalize_url(url), (url, content_hash(title, content)))
+        self.entries = entries
+        logger.info(f"수집 인덱스 구성: {len(entries):,}개 URL")
+
+    def lookup(self, url):
+        """(저장 URL, 내용 해시) 또는 None"""
+        return self.entries.get(canonicalize_url(url))
+
+    def __contains__(self, url):
+        return canonicalize_url(url) in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, url, title, summary, stored=True):
+        """처리 완료 항목 등록 (stored=False: 필터링되어 저장 안 됨)"""
+        self.entries[canonicalize_url(url)] = (
+            url if stored else None,
+            content_hash(title, summary)
+        )
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""멀티 프로세스 분산 수집 (피드 샤딩 + 단일 DB 작성자)"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import queue
+import time
+from itertools import islice
+
+import feedparser
+
+from feed_fetcher import FeedFetcher
+from feed_parser import FeedParseError, iter_entries
+
+logger = logging.getLogger(__name__)
+
+ENTRY_KEYS = ('title', 'link', 'summary', 'published')
+
+
+def shard_for(url, shards):
+    """피드 URL → 샤드 번호 (프로세스 재시작과 무관하게 고정)"""
+    digest = hashlib.md5(url.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % shards
+
+
+def parse_feed(body, limit=20):
+    """피드 본문 → 정규화된 항목 dict 목록 (스트리밍 우선, 오류 시 feedparser)"""
+    try:
+        return list(islice(iter_entries(body), limit))
+    except FeedParseError:
+        pass
+
+    feed = feedparser.parse(body)
+    if feed.bozo and not feed.entries:
+        raise ValueError(f"피드 파싱 불가: {feed.get('bozo_exception')}")
+    return [
+        {key: entry.get(key) for key in ENTRY_KEYS if entry.get(key)}
+        for entry in feed.entries[:limit]
+    ]
+
+
+def _worker_main(shard, config, tasks, results, caches):
+    """작업자 프로세스: 담당 피드 다운로드/파싱 후 결과 전송 (DB 접근 없음)
+
+    검증값 캐시는 작성자가 DB 커밋 후 보내는 ('cache', url, 값) 메시지로만 갱신
+    (저장 전에 갱신하면 저장 실패/종료 시 그 본문을 다시 받지 않음)
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f'%(asctime)s - shard{shard} - %(levelname)s - %(message)s'
+    )
+    fetcher = FeedFetcher(config)
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        if task[0] == 'cache':
+            _, url, cache = task
+            caches[url] = cache
+            continue
+        _, cycle, feed_config = task
+
+        url = feed_config['url']
+        try:
+            cache = caches.get(url)
+            fetched = fetcher.fetch(feed_config, cache)
+            if fetched['status'] == 304:
+                results.put((cycle, 'unchanged', feed_config, None))
+                continue
+
+            validators = {
+                'etag': fetched['etag'],
+                'last_modified': fetched['last_modified'],
+                'body_hash': hashlib.sha256(fetched['body']).hexdigest(),
+            }
+            if cache and cache['content_hash'] == validators['body_hash']:
+                # 본문은 같고 ETag/Last-Modified만 바뀌었으면 작성자가 저장하도록 전달
+                changed = (cache['etag'], cache['last_modified']) != (fetched['etag'], fetched['last_modified'])
+                results.put((cycle, 'unchanged', feed_config, validators if changed else None))
+                continue
+
+            results.put((cycle, 'entries', feed_config, dict(validators, entries=parse_feed(fetched['body']))))
+        except Exception as e:
+            results.put((cycle, 'error', feed_config, str(e)))
+
+
+class ShardedCollector:
+    """피드를 N개 프로세스에 나눠 다운로드/파싱, 현재 프로세스가 유일한 DB 작성자"""
+
+    def __init__(self, config, collector):
+        sharding_config = config.get('sharding', {})
+        self.config = config
+        self.collector = collector
+        self.shards = sharding_config.get('workers') or os.cpu_count() or 1
+        self.budget = config.get('rss', {}).get('cycle_budget', 120)
+        self.context = multiprocessing.get_context('spawn')
+        self.tasks = []
+        self.results = None
+        self.processes = []
+        self.cycle = 0
+        logger.info(f"분산 수집기 초기화: {self.shards}개 프로세스")
+
+    def start(self):
+        """작업자 프로세스 시작 (샤드별 캐시 검증값 전달)"""
+        self.results = self.context.Queue(maxsize=self.shards * 100)
+        caches = [{} for _ in range(self.shards)]
+        for feed_config in self.collector.feeds:
+            cache = self.collector.db.get_feed_cache(feed_config['url'])
+            if cache:
+                caches[shard_for(feed_config['url'], self.shards)][feed_config['url']] = cache
+
+        for shard in range(self.shards):
+            tasks = self.context.Queue()
+            process = self.context.Process(
+                target=_worker_main,
+                args=(shard, self.config, tasks, self.results, caches[shard]),
+                name=f"rss-shard-{shard}",
+                daemon=True
+            )
+            process.start()
+            self.tasks.append(tasks)
+            self.processes.append(process)
+
+    def stop(self):
+        for tasks in self.tasks:
+            tasks.put(None)
+        for process in self.processes:
+            process.join(timeout=5)
+
+    def collect_all(self, feeds=None):
+        """피드 분배 후 결과를 받아 필터링/저장 (주기 제한 시간 내)"""
+        feeds = self.collector.feeds if feeds is None else feeds
+        feeds = self.collector.allowed_feeds(feeds)
+        deadline = time.monotonic() + self.budget
+        self.cycle += 1
+
+        for feed_config in feeds:
+            self.tasks[shard_for(feed_config['url'], self.shards)].put(('fetch', self.cycle, feed_config))
+
+        all_articles = []
+        total_filtered = 0
+        pending = {feed_config['name']: feed_config for feed_config in feeds}
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"⏱️ 주기 시간 초과: {len(pending)}개 피드 응답 대기 중단")
+                # 응답은 늦게라도 저장되므로 다음 주기에 다시 투입하지 않도록 미룸
+                if self.collector.scheduler:
+                    for feed_config in pending.values():
+                        self.collector.scheduler.defer(feed_config)
+                break
+            try:
+                cycle, kind, feed_config, payload = self.results.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            # 이전 주기에 늦게 도착한 결과도 저장하되 이번 주기 대기 수에서는 제외
+            if cycle == self.cycle:
+                pending.pop(feed_config['name'], None)
+
+            try:
+                articles, filtered = self._write(kind, feed_config, payload)
+                all_articles.extend(articles)
+                total_filtered += filtered
+            except Exception as e:
+                self._record_failure(feed_config, e)
+
+        if self.collector.translator and all_articles:
+            all_articles = self.collector._translate_articles(all_articles)
+
+        logger.info(f"📊 총계: {len(all_articles)}개 저장, {total_filtered}개 필터링됨")
+        return all_articles
+
+    def _write(self, kind, feed_config, payload):
+        """작업자 결과 반영 (DB 작성은 이 프로세스에서만)"""
+        if kind == 'error':
+            raise RuntimeError(payload)
+
+        articles, filtered = [], 0
+        if kind == 'entries':
+            new, changed = self.collector.select_entries(feed_config, payload['entries'])
+            articles, filtered = self.collector.process_articles(feed_config, new, changed)
+            logger.info(f"✅ {feed_config['name']}: {len(articles)}개 저장 ({filtered}개 필터링됨)")
+        if payload:
+            self._save_cache(feed_config, payload)
+
+        self.collector.breaker.record_success(feed_config['name'], len(articles))
+        if self.collector.scheduler:
+            self.collector.scheduler.record_success(feed_config)
+        return articles, filtered
+
+    def _save_cache(self, feed_config, validators):
+        """저장이 끝난 뒤 검증값을 DB에 쓰고 담당 작업자 캐시에도 반영"""
+        self.collector.save_feed_cache(feed_config, validators, validators['body_hash'])
+        url = feed_config['url']
+        self.tasks[shard_for(url, self.shards)].put(('cache', url, {
+            'etag': validators['etag'],
+            'last_modified': validators['last_modified'],
+            'content_hash': validators['body_hash'],
+        }))
+
+    def _record_failure(self, feed_config, error):
+        logger.error(f"❌ {feed_config['name']} 오류: {error}")
+        self.collector.breaker.record_failure(feed_config['name'], error)
+        if self.collector.scheduler:
+            self.collector.scheduler.record_failure(feed_config)
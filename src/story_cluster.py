@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""매체 간 중복 기사 클러스터링 (SimHash)"""
+
+import hashlib
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+MASK64 = (1 << 64) - 1
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has',
+    'have', 'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this',
+    'to', 'was', 'were', 'will', 'with',
+}
+
+TAG_RE = re.compile(r'<[^>]+>')
+WORD_RE = re.compile(r'\w+')
+
+
+def normalize(title, summary):
+    """제목 + 요약 정규화 → 단어 목록 (HTML/대소문자/불용어 제거)"""
+    text = TAG_RE.sub(' ', f"{title or ''} {summary or ''}").lower()
+    return [w for w in WORD_RE.findall(text) if w not in STOPWORDS]
+
+
+def simhash(title, summary):
+    """단어 + 2-gram 기반 64비트 SimHash"""
+    words = normalize(title, summary)
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    if not features:
+        return 0
+
+    votes = [0] * 64
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            votes[bit] += 1 if (h >> bit) & 1 else -1
+
+    return sum(1 << bit for bit in range(64) if votes[bit] > 0)
+
+
+def to_signed(value):
+    """SQLite INTEGER 저장용 부호 있는 64비트 변환"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+class SimHashIndex:
+    """밴드 분할 SimHash 인덱스
+
+    해밍 거리 max_distance 이하인 서명은 (max_distance + 1)개 밴드 중
+    적어도 하나가 정확히 일치하므로, 밴드별 해시 테이블만 조회하면 된다.
+    """
+
+    def __init__(self, max_distance=3):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = 64 // self.bands
+        self.band_mask = (1 << self.band_bits) - 1
+        self.tables = [{} for _ in range(self.bands)]
+        self.size = 0
+
+    def _keys(self, signature):
+        return [
+            (signature >> (i * self.band_bits)) & self.band_mask
+            for i in range(self.bands)
+        ]
+
+    def add(self, signature, cluster_id):
+        """서명 등록"""
+        entry = (signature, cluster_id)
+        for table, key in zip(self.tables, self._keys(signature)):
+            table.setdefault(key, []).append(entry)
+        self.size += 1
+
+    def find(self, signature):
+        """가장 가까운 클러스터 ID (없으면 None)"""
+        best = None
+        best_distance = self.max_distance + 1
+        for table, key in zip(self.tables, self._keys(signature)):
+            for candidate, cluster_id in table.get(key, ()):
+                distance = (candidate ^ signature).bit_count()
+                if distance < best_distance:
+                    best, best_distance = cluster_id, distance
+        return best
+
+    def __len__(self):
+        return self.size
+
+
+class StoryClusterer:
+    """기사별 cluster_id 부여 (대표 기사: cluster_id == id)"""
+
+    def __init__(self, config, db):
+        self.db = db
+        dedup_config = config.get('dedup', {})
+        self.max_distance = dedup_config.get('max_distance', 3)
+        self.rebuild()
+
+    def _load(self):
+        """DB 서명으로 인덱스 새로 구성"""
+        self.index = SimHashIndex(self.max_distance)
+        for signature, cluster_id in self.db.get_cluster_signatures():
+            self.index.add(signature & MASK64, cluster_id)
+
+    def rebuild(self):
+        """DB 서명으로 인덱스 재구성 (서명 없는 기존 기사는 보충)"""
+        self._load()
+
+        missing = [
+            {'id': row[0], 'title': row[1], 'summary': row[2]}
+            for row in self.db.get_unclustered_articles()
+        ]
+        if missing:
+            self.assign(missing)
+            logger.info(f"클러스터 보충: {len(missing):,}개 기사")
+
+        logger.info(f"클러스터 인덱스 구성: {len(self.index):,}개 서명")
+
+    def assign(self, articles):
+        """새로 저장된 기사(id 포함)에 cluster_id 부여 후 DB 반영"""
+        signatures = {
+            article['id']: simhash(article['title'], article.get('summary', ''))
+            for article in articles
+        }
+
+        # 대표 기사가 아카이브로 옮겨졌으면 (다른 프로세스의 아카이브 포함) 인덱스를 DB에서 다시 구성
+        found = {self.index.find(s) for s in signatures.values() if s} - {None}
+        if found and self.db.get_existing_ids(found) != found:
+            logger.info("🗄️ 아카이브된 클러스터 대표 발견, 클러스터 인덱스 재구성")
+            self._load()
+
+        updates = []
+        for article in sorted(articles, key=lambda a: a['id']):
+            signature = signatures[article['id']]
+            cluster_id = self.index.find(signature) if signature else None
+            if cluster_id is None:
+                cluster_id = article['id']
+            article['cluster_id'] = cluster_id
+            if signature:
+                self.index.add(signature, cluster_id)
+            updates.append((to_signed(signature), cluster_id, article['id']))
+
+        self.db.set_clusters(updates)
+        return articles
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""월별 아카이브 테스트 (옮긴 뒤에도 조회/검색/집계/중복 판정이 그대로인지)"""
+
+import sqlite3
+import sys
+import tempfile
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from archiver import archive_cutoff
+from database import Database
+from seen_index import SeenIndex
+
+HOT_MONTHS = 3
+# hot_months 기준으로 가장 최근에 아카이브되는 달 (기본 설정에서 실제로 옮겨지는 달)
+MONTH = archive_cutoff(HOT_MONTHS + 1)[:7]
+SINCE = f'{MONTH}-01'
+OLD = f'{MONTH}-15 09:00:00'
+NEW = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def article(n, title, summary):
+    return {
+        'title': title, 'url': f'https://example.com/news/{n}', 'source': 'Example',
+        'published_date': '', 'summary': summary, 'category': 'korea',
+    }
+
+
+def main():
+    print("=" * 60)
+    print("🗃️ 월별 아카이브 테스트")
+    print("=" * 60)
+    failures = 0
+
+    def check(name, ok, detail=''):
+        nonlocal failures
+        if ok:
+            print(f"   ✅ {name}")
+        else:
+            failures += 1
+            print(f"   ❌ {name} {detail}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / 'news.db'))
+        old, member, recent = db.insert_articles([
+            article(1, 'KF-21 시험 비행 성공', 'Korea Aerospace Industries said the flight went well. ' * 5),
+            article(2, 'KF-21 시험 비행 성공 (종합)', 'Follow-up report.'),
+            article(3, '해군 잠수함 진수', 'A new submarine was launched.'),
+        ])
+        db.save_article_text(old['id'], '본문 ' * 200, 'ok')
+        # 1번은 아카이브될 달의 기사이면서 최근 기사(2번)가 속한 클러스터의 대표
+        with db.write() as cursor:
+            cursor.execute('UPDATE rss_articles SET created_at = ? WHERE id = ?', (OLD, old['id']))
+            cursor.execute('UPDATE rss_articles SET created_at = ? WHERE id IN (?, ?)',
+                           (NEW, member['id'], recent['id']))
+            cursor.execute('UPDATE rss_articles SET cluster_id = ? WHERE id IN (?, ?)',
+                           (old['id'], old['id'], member['id']))
+            cursor.execute("INSERT INTO wiki_changes (page_title, detected_at) VALUES ('K2 Black Panther', ?)", (OLD,))
+        before = db.get_statistics()
+
+        # 1. 이동
+        print(f"\n📦 [1/4] {MONTH} 이동")
+        moved = db.archive_month(MONTH)
+        check("옮긴 기사 수", moved == 1, f"→ {moved}")
+        with db.read() as cursor:
+            remaining = cursor.execute('SELECT id, cluster_id FROM rss_articles ORDER BY id').fetchall()
+        check("본 DB에서 삭제", [row[0] for row in remaining] == [member['id'], recent['id']], f"→ {remaining}")
+        check("남은 구성원이 새 대표", dict(remaining)[member['id']] == member['id'], f"→ {remaining}")
+        check("다시 실행해도 그대로", db.archive_month(MONTH) == 0)
+
+        # 2. 아카이브 파일 (압축 저장, 원문 복원)
+        print("\n🗜️ [2/4] 아카이브 파일")
+        conn = sqlite3.connect(db.archive_path(MONTH))
+        content, text = conn.execute('''
+            SELECT a.content, t.text FROM rss_articles a JOIN article_texts t ON t.article_id = a.id
+        ''').fetchone()
+        wiki = conn.execute('SELECT COUNT(*) FROM wiki_changes').fetchone()[0]
+        conn.close()
+        check("요약 압축 → 원문 복원", zlib.decompress(content).decode('utf-8') == old['summary'])
+        check("본문 함께 이동", zlib.decompress(text).decode('utf-8') == '본문 ' * 200)
+        check("Wikipedia 변경 함께 이동", wiki == 1)
+
+        # 3. 조회/검색/집계
+        print("\n🔎 [3/4] 조회/검색/집계")
+        articles = db.get_articles(SINCE, limit=10)
+        ids = [a['id'] for a in articles]
+        check("기간 조회에 아카이브 포함", ids == [recent['id'], member['id'], old['id']], f"→ {ids}")
+        check("기간 조회는 요약 압축 해제", articles[-1]['content'] == old['summary'])
+        check("트라이그램 검색 (아카이브)",
+              old['id'] in [r['id'] for r in db.search_articles('Aerospace', since=SINCE)])
+        check("2글자 검색 (아카이브)",
+              old['id'] in [r['id'] for r in db.search_articles('시험 비행', since=SINCE)])
+        check("since 없으면 본 DB만", old['id'] not in [r['id'] for r in db.search_articles('시험 비행')])
+        check("집계 유지", db.get_statistics() == before)
+        db.rebuild_statistics()
+        check("집계 재계산 = 아카이브 포함", db.get_statistics() == before)
+        check("Wikipedia 기간 조회", len(db.get_wiki_changes(10, SINCE, archive_cutoff(HOT_MONTHS))) == 1)
+
+        # 4. 수집 인덱스 (피드가 아직 보여주는 아카이브 기사는 다시 저장하지 않음)
+        print("\n📇 [4/4] 수집 인덱스")
+        entries = db.get_archived_entries(SINCE)
+        check("아카이브 항목 조회", [url for url, _, _ in entries] == [old['url']], f"→ {entries}")
+        index = SeenIndex(db, HOT_MONTHS)
+        check(f"hot_months={HOT_MONTHS} 재구성에 아카이브 URL 포함", old['url'] in index)
+        db.close()
+
+    print("\n" + ("✅ 모두 통과" if not failures else f"❌ {failures}개 실패"))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""키워드 매칭 테스트 (Aho-Corasick 결과 = 키워드별 부분 문자열 검사 결과)"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from content_filter import ContentFilter
+from keyword_matcher import KeywordMatcher
+
+
+def reference_analyze(filters, text):
+    """이전 방식: 키워드마다 `in` 검사 (word_boundary면 영문/숫자 경계 정규식)"""
+    text = text.lower()
+
+    def found(keyword):
+        keyword = keyword.lower()
+        if not filters.get('word_boundary'):
+            return keyword in text
+        return re.search(r'(?<![a-z0-9])' + re.escape(keyword) + r'(?![a-z0-9])', text) is not None
+
+    excluded = any(found(k) for k in filters.get('exclude', []))
+    high = {k.lower() for k in filters['high_priority'] if found(k)}
+    medium = {k.lower() for k in filters['medium_priority'] if found(k)}
+    exclude = {k.lower() for k in filters.get('exclude', []) if found(k)}
+    return {
+        'excluded': excluded,
+        'related': bool(high or medium) and not excluded,
+        'score': 10 * len(high) + 5 * len(medium),
+        'keywords': sorted(high | medium | exclude),
+    }
+
+
+def compare(filters, texts):
+    """불일치 목록 [(텍스트, 기대값, 결과)]"""
+    content_filter = ContentFilter({'filters': filters})
+    mismatches = []
+    for text in texts:
+        expected = reference_analyze(filters, text)
+        result = content_filter.analyze(text)
+        result['keywords'] = sorted(result['keywords'])
+        if result != expected:
+            mismatches.append((text, expected, result))
+    return mismatches
+
+
+def main():
+    print("=" * 60)
+    print("🔎 키워드 매칭 테스트")
+    print("=" * 60)
+    failures = 0
+
+    def check(name, mismatches):
+        nonlocal failures
+        if mismatches:
+            failures += 1
+            print(f"   ❌ {name}: {len(mismatches)}건 불일치")
+            for text, expected, result in mismatches[:3]:
+                print(f"      {text!r}\n      기대 {expected}\n      결과 {result}")
+        else:
+            print(f"   ✅ {name}")
+
+    # 1. 실제 설정 키워드
+    print("\n📁 [1/4] config.yaml 키워드")
+    config_file = Path(__file__).parent.parent / 'config.yaml'
+    with open(config_file, 'r', encoding='utf-8') as f:
+        filters = yaml.safe_load(f)['filters']
+    texts = [
+        "Hanwha wins K9 thunder export deal with Poland",
+        "KAI의 KF-21 시험 비행 성공",
+        "Kaiser Permanente opens new clinic",
+        "NUCLEAR submarine drills near the peninsula",
+        "",
+    ]
+    for boundary in (False, True):
+        check(f"word_boundary={boundary}", compare(dict(filters, word_boundary=boundary), texts))
+
+    # 2. 겹치는 키워드 (접두/접미/포함 관계, 여러 목록에 같은 키워드)
+    print("\n🧩 [2/4] 겹치는 키워드")
+    overlapping = {
+        'high_priority': ['nuclear submarine', 'submarine', '북한군', 'abab'],
+        'medium_priority': ['sub', 'marine', 'submarine', '북한', '한군', 'bab', 'ab'],
+        'exclude': ['marine corps band'],
+    }
+    texts = [
+        "Nuclear Submarine launched", "submarine", "marine corps band concert",
+        "북한군 훈련", "남북한 군사 회담", "ababab", "babab", "a b ab",
+    ]
+    for boundary in (False, True):
+        check(f"word_boundary={boundary}", compare(dict(overlapping, word_boundary=boundary), texts))
+
+    # 3. 한글 + 단어 경계 (한글 조사는 경계로 보지 않음, 영문은 단어 단위)
+    print("\n🇰🇷 [3/4] 한글 단어 경계")
+    matcher = KeywordMatcher({'kai': ['high'], '북한': ['high'], 'f-35': ['high']}, word_boundary=True)
+    cases = [
+        ("KAI의 수출", ['kai']),
+        ("Kaiser", []),
+        ("북한이 발사", ['북한']),
+        ("F-35A 도입", []),
+        ("F-35, F-22", ['f-35']),
+    ]
+    wrong = [
+        (text, expected, [keyword for keyword, _ in matcher.matches(text)])
+        for text, expected in cases
+        if sorted(keyword for keyword, _ in matcher.matches(text)) != expected
+    ]
+    check("조사/영문 경계", wrong)
+
+    # 4. 무작위 키워드/텍스트 (작은 문자 집합 → 겹침이 많음)
+    print("\n🎲 [4/4] 무작위 비교")
+    rng = random.Random(12)
+    alphabet = 'ab 북한-1'
+    mismatches = []
+    for _ in range(500):
+        words = lambda n: [
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip() or 'a' for _ in range(n)
+        ]
+        filters = {
+            'high_priority': words(rng.randint(1, 5)),
+            'medium_priority': words(rng.randint(1, 5)),
+            'exclude': words(rng.randint(0, 2)),
+            'word_boundary': rng.random() < 0.5,
+        }
+        texts = [''.join(rng.choice(alphabet + 'AB') for _ in range(rng.randint(0, 30))) for _ in range(5)]
+        mismatches += compare(filters, texts)
+    check("500개 키워드 조합", mismatches)
+
+    print("\n" + ("✅ 모두 통과" if not failures else f"❌ {failures}개 실패"))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""스키마 마이그레이션 테스트 (새 DB, 버전 기록 이전 DB, 재실행)"""
+
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database import Database
+from migrations import MIGRATIONS
+
+LATEST = MIGRATIONS[-1][0]
+# 버전 기록 이전(user_version = 0)에 만들어진 DB
+LEGACY_DB = Path(__file__).parent.parent / 'data' / 'news.db.backup'
+
+EXPECTED_TABLES = {
+    'rss_articles', 'wiki_changes', 'feed_cache', 'article_texts', 'article_stats',
+    'articles_fts', 'articles_bigram',
+}
+
+
+def schema(path):
+    """(user_version, 테이블 이름 집합, 트리거 이름 집합)"""
+    conn = sqlite3.connect(path)
+    try:
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        triggers = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    finally:
+        conn.close()
+    return version, tables, triggers
+
+
+def main():
+    print("=" * 60)
+    print("🗄️ 스키마 마이그레이션 테스트")
+    print("=" * 60)
+    failures = 0
+
+    def check(name, ok, detail=''):
+        nonlocal failures
+        if ok:
+            print(f"   ✅ {name}")
+        else:
+            failures += 1
+            print(f"   ❌ {name} {detail}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1. 새 DB
+        print(f"\n🆕 [1/3] 새 DB → v{LATEST}")
+        path = str(Path(tmp) / 'new.db')
+        Database(path).close()
+        version, tables, triggers = schema(path)
+        check("최신 버전 기록", version == LATEST, f"→ v{version}")
+        check("테이블 생성", EXPECTED_TABLES <= tables, f"→ 없음: {EXPECTED_TABLES - tables}")
+        check("bigrams() 트리거 없음 (다른 연결에서도 수정 가능)",
+              not any(name.startswith('trg_articles_bigram') for name in triggers))
+        Database(path).close()
+        check("다시 열어도 그대로", schema(path) == (version, tables, triggers))
+
+        # 2. 버전 기록 이전 DB (기사 보존, 집계/검색 색인 채움)
+        print("\n📦 [2/3] 버전 기록 이전 DB")
+        if not LEGACY_DB.exists():
+            print(f"   ⏭️ {LEGACY_DB.name} 없음, 건너뜀")
+        else:
+            path = str(Path(tmp) / 'legacy.db')
+            shutil.copy(LEGACY_DB, path)
+            conn = sqlite3.connect(path)
+            before_version = conn.execute('PRAGMA user_version').fetchone()[0]
+            before = conn.execute('SELECT COUNT(*) FROM rss_articles').fetchone()[0]
+            title = conn.execute('SELECT title FROM rss_articles ORDER BY id LIMIT 1').fetchone()
+            conn.close()
+            check("시작 버전 0", before_version == 0, f"→ v{before_version}")
+
+            db = Database(path)
+            version, _, _ = schema(path)
+            check("최신 버전으로", version == LATEST, f"→ v{version}")
+            stats = db.get_statistics()
+            check("기사 수 보존 = 집계", stats['total'] == before, f"→ {stats['total']} / {before}")
+            if title:
+                word = max(title[0].split(), key=len)
+                found = db.search_articles(word, limit=100)
+                check(f"검색 색인 채움 ({word!r})", any(r['title'] == title[0] for r in found))
+            db.close()
+
+        # 3. 초기 v5 (bigrams() 트리거) DB → 트리거 제거, 색인 재구성
+        print("\n🧹 [3/3] bigrams() 트리거가 남은 v5 DB")
+        path = str(Path(tmp) / 'v5.db')
+        db = Database(path)
+        db.insert_articles([{
+            'title': '북한 해군 훈련', 'url': 'https://example.com/1', 'source': 'Example',
+            'published_date': '', 'summary': '잠수함 발사', 'category': 'korea',
+        }])
+        db.close()
+        conn = sqlite3.connect(path)
+        conn.execute("DELETE FROM articles_bigram")
+        conn.execute('''
+            CREATE TRIGGER trg_articles_bigram_insert AFTER INSERT ON rss_articles
+            BEGIN SELECT bigrams(NEW.title); END
+        ''')
+        conn.execute('PRAGMA user_version = 5')
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        version, _, triggers = schema(path)
+        check("v5 → 최신 버전", version == LATEST, f"→ v{version}")
+        check("트리거 제거", 'trg_articles_bigram_insert' not in triggers)
+        check("2글자 검색 색인 재구성", len(db.search_articles('해군')) == 1)
+        db.close()
+        conn = sqlite3.connect(path)
+        try:
+            conn.execute("UPDATE rss_articles SET title = '수정'")
+            conn.execute('DELETE FROM rss_articles')
+            conn.commit()
+            check("Python 밖 연결에서 수정/삭제", True)
+        except sqlite3.Error as e:
+            check("Python 밖 연결에서 수정/삭제", False, f"→ {e}")
+        finally:
+            conn.close()
+
+    print("\n" + ("✅ 모두 통과" if not failures else f"❌ {failures}개 실패"))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""수집 인덱스 테스트 (URL 정규화, 내용 해시)"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database import Database
+from seen_index import SeenIndex, canonicalize_url, content_hash
+
+# (원래 URL, 정규화 결과)
+CANONICAL_CASES = [
+    ('https://www.Example.com/a/?utm_source=x&b=2&a=1#frag', 'example.com/a?a=1&b=2'),
+    ('http://example.com/a', 'example.com/a'),
+    ('http://example.com:80/a', 'example.com/a'),
+    ('https://example.com:443/', 'example.com/'),
+    ('https://example.com', 'example.com/'),
+    ('https://example.com:8080/a', 'example.com:8080/a'),
+    ('HTTPS://EXAMPLE.COM/Path', 'example.com/Path'),              # 경로 대소문자는 유지
+    ('https://example.com/a?fbclid=1&gclid=2', 'example.com/a'),
+    ('https://example.com/a?UTM_Campaign=1&Ref=x', 'example.com/a'),
+    ('https://example.com/a?id=7&x=', 'example.com/a?id=7&x='),    # 빈 값도 의미 있는 파라미터
+    ('https://example.com/a?b=1&a=2', 'example.com/a?a=2&b=1'),
+    ('  https://example.com/a  ', 'example.com/a'),
+    ('', ''),
+    (None, ''),
+]
+
+
+def main():
+    print("=" * 60)
+    print("🔗 수집 인덱스 테스트")
+    print("=" * 60)
+    failures = 0
+
+    def check(name, ok, detail=''):
+        nonlocal failures
+        if ok:
+            print(f"   ✅ {name}")
+        else:
+            failures += 1
+            print(f"   ❌ {name} {detail}")
+
+    # 1. URL 정규화
+    print("\n🔗 [1/3] URL 정규화")
+    for url, expected in CANONICAL_CASES:
+        result = canonicalize_url(url)
+        check(repr(url), result == expected, f"→ {result!r} (기대 {expected!r})")
+
+    # 2. 내용 해시
+    print("\n#️⃣ [2/3] 내용 해시")
+    check("같은 제목/요약 → 같은 해시", content_hash('제목', '요약') == content_hash('제목', '요약'))
+    check("요약이 바뀌면 다른 해시", content_hash('제목', '요약') != content_hash('제목', '요약 수정'))
+    check("제목/요약 경계 구분", content_hash('ab', 'c') != content_hash('a', 'bc'))
+    check("None = 빈 문자열", content_hash(None, None) == content_hash('', ''))
+
+    # 3. 인덱스 (DB 재구성 + 추가)
+    print("\n📇 [3/3] 인덱스")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / 'seen.db'))
+        db.insert_articles([{
+            'title': 'KF-21 first flight', 'url': 'https://www.example.com/news/1?utm_source=rss',
+            'source': 'Example', 'published_date': '', 'summary': 'Summary.', 'category': 'korea',
+        }])
+        index = SeenIndex(db)
+        entry = index.lookup('http://example.com/news/1/')
+        check("저장된 기사를 다른 표기 URL로 찾음", entry is not None)
+        check("저장 URL과 해시 유지", entry == (
+            'https://www.example.com/news/1?utm_source=rss', content_hash('KF-21 first flight', 'Summary.')
+        ), f"→ {entry}")
+        index.add('https://example.com/filtered', 'Recipe', 'Cooking', stored=False)
+        check("필터링된 항목은 URL 없이 등록", index.lookup('https://example.com/filtered')[0] is None)
+        check("없는 URL", 'https://example.com/news/2' not in index)
+        db.close()
+
+    print("\n" + ("✅ 모두 통과" if not failures else f"❌ {failures}개 실패"))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
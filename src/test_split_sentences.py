@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""요약 문장 분할 테스트 (문장 단위 번역 캐시의 키)"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from translator import split_sentences
+
+# (요약, 기대 문장 목록)
+CASES = [
+    ('First sentence. Second one!  Third?', ['First sentence.', 'Second one!', 'Third?']),
+    ('The U.S. Navy said. It works.', ['The U.S. Navy said.', 'It works.']),
+    ('Gen. Kim met Dr. Lee. They talked.', ['Gen. Kim met Dr. Lee.', 'They talked.']),
+    ('The U.S. Army and No. 5 unit.', ['The U.S. Army and No. 5 unit.']),
+    ('He said "Go." Then left.', ['He said "Go."', 'Then left.']),
+    ('Version 2.5 was released. 3 ships sailed.', ['Version 2.5 was released.', '3 ships sailed.']),
+    ('It ended (finally.) Next.', ['It ended (finally.)', 'Next.']),
+    ('North Korea fired a missile.\nSouth Korea responded.',
+     ['North Korea fired a missile.', 'South Korea responded.']),
+    ('Seoul (Yonhap) -- The KF-21 flew. It was fast.', ['Seoul (Yonhap) -- The KF-21 flew.', 'It was fast.']),
+    ('lowercase after a period. does not split', ['lowercase after a period. does not split']),
+    ('No final punctuation', ['No final punctuation']),
+    ('   ', []),
+    ('', []),
+]
+
+
+def main():
+    print("=" * 60)
+    print("✂️ 문장 분할 테스트")
+    print("=" * 60)
+    failures = 0
+
+    def check(name, ok, detail=''):
+        nonlocal failures
+        if ok:
+            print(f"   ✅ {name}")
+        else:
+            failures += 1
+            print(f"   ❌ {name} {detail}")
+
+    print("\n✂️ [1/2] 분할 결과")
+    for text, expected in CASES:
+        result = split_sentences(text)
+        check(repr(text), result == expected, f"→ {result}")
+
+    # 번역문은 문장을 공백으로 이어 붙이므로 원문도 그렇게 복원되어야 함
+    print("\n🔁 [2/2] 다시 이어 붙이면 원문 (공백 차이만)")
+    for text, _ in CASES:
+        result = ' '.join(split_sentences(text))
+        check(repr(text), result == ' '.join(text.split()), f"→ {result!r}")
+
+    print("\n" + ("✅ 모두 통과" if not failures else f"❌ {failures}개 실패"))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
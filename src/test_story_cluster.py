@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""중복 기사 클러스터링 테스트 (SimHash, 밴드 인덱스 = 전수 비교)"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database import Database
+from story_cluster import MASK64, SimHashIndex, StoryClusterer, simhash, to_signed
+
+TITLE = 'South Korea KF-21 fighter completes first supersonic flight test'
+SUMMARY = ('The KF-21 Boramae prototype broke the sound barrier during a test flight over the Yellow Sea, '
+           'Korea Aerospace Industries said on Tuesday, calling it a milestone for the program.')
+
+
+def distance(a, b):
+    return (a ^ b).bit_count()
+
+
+def brute_force(entries, signature, max_distance):
+    """가장 가까운 거리 (max_distance 초과면 None)"""
+    best = min((distance(s, signature) for s, _ in entries), default=None)
+    return best if best is not None and best <= max_distance else None
+
+
+def main():
+    print("=" * 60)
+    print("🧬 중복 기사 클러스터링 테스트")
+    print("=" * 60)
+    failures = 0
+
+    def check(name, ok, detail=''):
+        nonlocal failures
+        if ok:
+            print(f"   ✅ {name}")
+        else:
+            failures += 1
+            print(f"   ❌ {name} {detail}")
+
+    # 1. SimHash
+    print("\n🧬 [1/4] SimHash")
+    base = simhash(TITLE, SUMMARY)
+    check("HTML/대소문자 무시", simhash(TITLE, f'<p>{SUMMARY.upper()}</p>') == base)
+    check("불용어 무시", simhash(TITLE, SUMMARY.replace(' on Tuesday', ' Tuesday')) == base)
+    suffixed = distance(base, simhash(TITLE, SUMMARY + ' (Yonhap)'))
+    check("출처 꼬리표만 붙은 기사는 가까움 (≤3)", suffixed <= 3, f"→ {suffixed}")
+    other = distance(base, simhash('Poland signs contract for K2 tanks',
+                                   'Warsaw ordered another batch of K2 Black Panther tanks from Hyundai Rotem.'))
+    check("다른 기사는 멂 (>10)", other > 10, f"→ {other}")
+    check("빈 기사는 0", simhash('', None) == 0)
+
+    # 2. SQLite 저장용 부호 변환
+    print("\n🔢 [2/4] 부호 있는 64비트 변환")
+    values = [0, 1, (1 << 63) - 1, 1 << 63, MASK64, base]
+    check("원래 값 복원", all(to_signed(v) & MASK64 == v for v in values))
+    check("INTEGER 범위", all(-(1 << 63) <= to_signed(v) < (1 << 63) for v in values))
+
+    # 3. 밴드 인덱스 = 전수 비교 (거리 경계 전후로 비트를 뒤집은 서명)
+    print("\n🗂️ [3/4] 밴드 인덱스")
+    rng = random.Random(7)
+    for max_distance in (3, 4, 5, 7):
+        index = SimHashIndex(max_distance)
+        entries = [(rng.getrandbits(64), i) for i in range(300)]
+        for signature, cluster_id in entries:
+            index.add(signature, cluster_id)
+        clusters = dict((cluster_id, signature) for signature, cluster_id in entries)
+        wrong = 0
+        for _ in range(2000):
+            signature, _ = rng.choice(entries)
+            for bit in rng.sample(range(64), rng.randint(0, max_distance + 2)):
+                signature ^= 1 << bit
+            expected = brute_force(entries, signature, max_distance)
+            found = index.find(signature)
+            got = None if found is None else distance(clusters[found], signature)
+            if got != expected:
+                wrong += 1
+        check(f"max_distance={max_distance}: 2000개 조회", not wrong, f"→ {wrong}개 불일치")
+
+    # 4. 클러스터 부여 (DB)
+    print("\n🗞️ [4/4] 클러스터 부여")
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / 'cluster.db'))
+        clusterer = StoryClusterer({}, db)
+        articles = db.insert_articles([
+            {'title': TITLE, 'url': 'https://a.example/1', 'source': 'A', 'published_date': '',
+             'summary': SUMMARY, 'category': 'korea'},
+            {'title': TITLE, 'url': 'https://b.example/1', 'source': 'B', 'published_date': '',
+             'summary': SUMMARY + ' (Yonhap)', 'category': 'korea'},
+            {'title': 'Poland signs contract for K2 tanks', 'url': 'https://c.example/1', 'source': 'C',
+             'published_date': '', 'summary': 'Warsaw ordered more K2 tanks.', 'category': 'world'},
+        ])
+        first, second, third = clusterer.assign(articles)
+        check("첫 기사가 대표", first['cluster_id'] == first['id'])
+        check("중복 기사는 대표 클러스터로", second['cluster_id'] == first['id'], f"→ {second['cluster_id']}")
+        check("다른 기사는 자기 클러스터", third['cluster_id'] == third['id'])
+        check("재시작 후 같은 인덱스", StoryClusterer({}, db).index.find(simhash(TITLE, SUMMARY)) == first['id'])
+        db.close()
+
+    print("\n" + ("✅ 모두 통과" if not failures else f"❌ {failures}개 실패"))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""DeepL 문자 할당량 로컬 집계 / 월말 소진 예측 / 점수 기준 번역 제한"""
+
+import calendar
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+def _month_bounds(now):
+    """이번 달 (시작, 끝) epoch 초 (UTC)"""
+    start = datetime(now.year, now.month, 1, tzinfo=timezone.utc)
+    days = calendar.monthrange(now.year, now.month)[1]
+    return start.timestamp(), start.timestamp() + days * 86400
+
+
+class TranslationBudget:
+    """번역할 때마다 문자 수를 DB에 누적하고 DeepL 사용량 API와는 가끔만 동기화
+
+    예상 월 사용량이 한도 × budget_threshold를 넘으면 초과 비율만큼 점수가 낮은 기사를
+    번역 대상에서 제외 (최근 기사 점수 분포의 분위수를 기준 점수로 사용)
+    """
+
+    def __init__(self, config, db, client=None):
+        translation_config = config.get('translation', {})
+        self.db = db
+        self.client = client
+        self.sync_interval = translation_config.get('usage_sync_interval', 3600)
+        self.default_limit = translation_config.get('monthly_char_limit', 500000)
+        self.threshold = translation_config.get('budget_threshold', 0.9)
+        self.cutoff_window_days = translation_config.get('cutoff_window_days', 7)
+        self.cutoff_ttl = 300
+        self.lock = threading.Lock()
+        self.last_sync = 0
+        self.cutoff = (0, 0)  # (기준 점수, 계산 시각)
+
+    def _month(self):
+        return datetime.now(timezone.utc).strftime('%Y-%m')
+
+    def record(self, chars):
+        """번역 요청 문자 수 누적"""
+        self.db.add_translation_usage(self._month(), chars, self.default_limit)
+        self.maybe_sync()
+
+    def maybe_sync(self, force=False):
+        """마지막 동기화 후 sync_interval이 지났으면 DeepL 사용량으로 보정"""
+        if not self.client:
+            return
+        with self.lock:
+            if not force and time.time() - self.last_sync < self.sync_interval:
+                return
+            self.last_sync = time.time()
+        try:
+            usage = self.client.get_usage()
+            self.db.set_translation_usage(
+                self._month(), usage.character.count, usage.character.limit, time.time()
+            )
+            self.cutoff = (0, 0)
+        except Exception as e:
+            logger.error(f"DeepL 사용량 동기화 실패: {e}")
+
+    def usage(self):
+        """사용량 + 월말 예측 {'used', 'limit', 'remaining', 'projected', 'exhausts_at', 'score_cutoff', 'synced_at'}"""
+        row = self.db.get_translation_usage(self._month())
+        used, limit, synced_at = row if row else (0, self.default_limit, None)
+
+        now = datetime.now(timezone.utc)
+        month_start, month_end = _month_bounds(now)
+        elapsed = max(now.timestamp() - month_start, 3600)
+        rate = used / elapsed
+        projected = used + rate * (month_end - now.timestamp())
+
+        exhausts_at = None
+        if rate > 0 and used < limit and now.timestamp() + (limit - used) / rate < month_end:
+            exhausts_at = datetime.fromtimestamp(
+                now.timestamp() + (limit - used) / rate, timezone.utc
+            ).strftime('%Y-%m-%d %H:%M')
+
+        return {
+            'used': used,
+            'limit': limit,
+            'remaining': max(limit - used, 0),
+            'projected': int(projected),
+            'exhausts_at': exhausts_at,
+            'score_cutoff': self._cutoff(projected, limit),
+            'synced_at': synced_at,
+        }
+
+    def score_cutoff(self):
+        """번역할 최소 점수 (예측이 여유로우면 0)"""
+        return self.usage()['score_cutoff']
+
+    def _cutoff(self, projected, limit):
+        cutoff, computed_at = self.cutoff
+        if time.time() - computed_at < self.cutoff_ttl:
+            return cutoff
+
+        budget = limit * self.threshold
+        cutoff = 0
+        if projected > budget:
+            # 예상 초과 비율만큼 하위 점수 구간 제외
+            scores = sorted(self.db.get_recent_scores(self.cutoff_window_days))
+            if scores:
+                drop = 1 - budget / projected
+                cutoff = scores[min(int(len(scores) * drop), len(scores) - 1)]
+                logger.info(
+                    f"💸 DeepL 예상 사용량 {int(projected):,} > {int(budget):,}, "
+                    f"점수 {cutoff} 이상만 번역"
+                )
+        self.cutoff = (cutoff, time.time())
+        return cutoff
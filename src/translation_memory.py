@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""번역 메모리 (DeepL 호출 전 DB 캐시 확인)"""
+
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def memory_key(text, source_lang, target_lang):
+    """(원문, 원문 언어, 번역 언어) → 해시 키"""
+    data = f"{source_lang}\x00{target_lang}\x00{text}"
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """번역 결과를 영구 저장해 같은 문장은 다시 API로 보내지 않음"""
+
+    def __init__(self, db):
+        self.db = db
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'chars_saved': 0}
+
+    def lookup(self, texts, source_lang, target_lang):
+        """캐시된 번역 → {원문: 번역문}, 적중/미적중 통계 갱신 (중복 원문은 한 번만)"""
+        texts = list(dict.fromkeys(texts))
+        keys = {text: memory_key(text, source_lang, target_lang) for text in texts}
+        try:
+            stored = self.db.get_translation_memory(keys.values())
+        except Exception as e:
+            logger.error(f"번역 메모리 조회 오류: {e}")
+            stored = {}
+
+        found = {text: stored[key] for text, key in keys.items() if key in stored}
+        with self.lock:
+            for text in texts:
+                if text in found:
+                    self.stats['hits'] += 1
+                    self.stats['chars_saved'] += len(text)
+                else:
+                    self.stats['misses'] += 1
+        return found
+
+    def store(self, translations, source_lang, target_lang):
+        """새 번역 저장, translations: {원문: 번역문}"""
+        try:
+            self.db.save_translation_memory([
+                (memory_key(text, source_lang, target_lang), text, translated, source_lang, target_lang)
+                for text, translated in translations.items()
+            ])
+        except Exception as e:
+            logger.error(f"번역 메모리 저장 오류: {e}")
+
+    def hit_rate(self):
+        total = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / total if total else 0.0
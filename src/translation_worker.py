@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""백그라운드 번역 작업자 (title_ko가 빈 기사를 점수순으로 번역)"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationWorker:
+    """수집 주기와 분리해 밀린 번역을 배치로 처리 (실패분은 NULL로 남아 다음 배치에서 재시도)"""
+
+    def __init__(self, config, db, translator):
+        translation_config = config.get('translation', {})
+        self.db = db
+        self.translator = translator
+        self.batch_size = translation_config.get('worker_batch', 200)
+        self.summaries = translation_config.get('summaries', False)
+        self.idle_interval = translation_config.get('worker_idle_interval', 60)
+        self.pause_interval = translation_config.get('worker_pause_interval', 1800)
+        self.min_quota = translation_config.get('worker_min_quota', 20000)
+        self.wake = threading.Event()
+        self.failures = 0
+        self.failed_ids = set()  # 이번 순회에서 실패한 기사 (밀린 번역을 다 돈 뒤 재시도)
+        self.stats = {'translated': 0, 'summaries': 0, 'failed': 0, 'batches': 0, 'paused': False}
+        logger.info(f"번역 작업자 초기화: 배치 {self.batch_size}개")
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name='translation-worker', daemon=True)
+        thread.start()
+        return thread
+
+    def notify(self):
+        """새 기사 저장 후 호출 (대기 중이면 바로 깨움)"""
+        self.wake.set()
+
+    def _run(self):
+        while True:
+            try:
+                delay = self.run_once()
+            except Exception as e:
+                logger.error(f"번역 작업자 오류: {e}")
+                delay = self._backoff()
+            if delay:
+                self.wake.wait(delay)
+                self.wake.clear()
+
+    def run_once(self):
+        """배치 하나 처리 → 다음 실행까지 대기 시간 (0이면 바로 다음 배치)"""
+        if self._quota_low():
+            if not self.stats['paused']:
+                logger.warning(f"⏸️ DeepL 남은 할당량 부족, 번역 일시 중지 ({self.pause_interval}초 후 재확인)")
+            self.stats['paused'] = True
+            return self.pause_interval
+        self.stats['paused'] = False
+
+        # 월 할당량 예측이 빠듯하면 기준 점수 이상만
+        min_score = self.translator.score_cutoff()
+        rows = self.db.get_untranslated_articles(self.batch_size + len(self.failed_ids), min_score)
+        rows = [row for row in rows if row[0] not in self.failed_ids][:self.batch_size]
+        if not rows:
+            # 제목이 다 번역되면 요약
+            if self.summaries and self._translate_summaries(min_score):
+                return 0
+            if self.failed_ids:
+                self.failed_ids.clear()
+                return self._backoff()
+            return self.idle_interval
+
+        translated = self.translator.translate_many([title for _, title in rows])
+        updates = [
+            (translated[title], article_id, title)
+            for article_id, title in rows if title in translated
+        ]
+        self.db.update_translations_by_id(updates)
+        self.failed_ids.update(article_id for article_id, title in rows if title not in translated)
+
+        self.stats['batches'] += 1
+        self.stats['translated'] += len(updates)
+        self.stats['failed'] += len(rows) - len(updates)
+        logger.info(f"🌐 백그라운드 번역: {len(updates)}/{len(rows)}개")
+
+        # 하나도 못 했으면 (DeepL 장애 등) 남은 기사를 바로 이어 훑지 않고 대기
+        if not updates:
+            return self._backoff()
+        self.failures = 0
+        return 0
+
+    def _translate_summaries(self, min_score):
+        """요약 배치 하나 번역 → 번역된 수"""
+        rows = self.db.get_untranslated_summaries(self.batch_size + len(self.failed_ids), min_score)
+        rows = [row for row in rows if row[0] not in self.failed_ids][:self.batch_size]
+        if not rows:
+            return 0
+
+        translated = self.translator.translate_summaries([content for _, content in rows])
+        updates = [
+            (translated[content], article_id, content)
+            for article_id, content in rows if content in translated
+        ]
+        self.db.update_summary_translations(updates)
+        self.failed_ids.update(article_id for article_id, content in rows if content not in translated)
+
+        self.stats['summaries'] += len(updates)
+        self.stats['failed'] += len(rows) - len(updates)
+        stats = self.translator.stats
+        logger.info(
+            f"🌐 요약 번역: {len(updates)}/{len(rows)}개 "
+            f"(누적 요약당 전송 {stats['summary_chars_sent'] / max(stats['summaries'], 1):.0f}자"
+            f" / 원문 {stats['summary_chars'] / max(stats['summaries'], 1):.0f}자)"
+        )
+        return len(updates)
+
+    def _backoff(self):
+        """실패가 이어지면 재시도 대기 시간을 두 배씩 (최대 pause_interval)"""
+        self.failures += 1
+        return min(self.idle_interval * (2 ** (self.failures - 1)), self.pause_interval)
+
+    def _quota_low(self):
+        usage = self.translator.get_usage()
+        return usage is not None and usage['remaining'] < self.min_quota
@@ -3,28 +3,89 @@
 
 import deepl
 import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from translation_budget import TranslationBudget
+from translation_memory import TranslationMemory
 
 logger = logging.getLogger(__name__)
 
+SOURCE_LANG = "EN"
+TARGET_LANG = "KO"
+
+
+# 문장 경계 (마침표/물음표/느낌표[+닫는 따옴표] + 공백 + 대문자/숫자로 시작하는 다음 문장)
+SENTENCE_BOUNDARY = re.compile(
+    r'(?:(?<=[.!?])|(?<=[.!?]["\'”’)]))\s+(?=["\'“‘(\[]?[A-Z0-9])'
+)
+ABBREVIATIONS = {'U.S.', 'U.K.', 'U.N.', 'Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Gen.', 'Lt.', 'Col.',
+                 'Maj.', 'Capt.', 'Sgt.', 'Adm.', 'Cmdr.', 'Rep.', 'Sen.', 'Gov.', 'St.', 'No.'}
+
+
+def split_sentences(text):
+    """요약을 문장 단위로 분할 (약어 뒤에서는 나누지 않음)"""
+    sentences = []
+    for piece in SENTENCE_BOUNDARY.split(text.strip()):
+        if sentences and sentences[-1].rsplit(None, 1)[-1] in ABBREVIATIONS:
+            sentences[-1] += ' ' + piece
+        else:
+            sentences.append(piece)
+    return [s for s in sentences if s]
+
+
+def _retryable(error):
+    """429 / 5xx / 연결 오류만 재시도 (할당량 초과·인증 오류는 즉시 실패)"""
+    if isinstance(error, (deepl.TooManyRequestsException, deepl.ConnectionException)):
+        return True
+    status = getattr(error, 'http_status_code', None)
+    return status is not None and status >= 500
+
 
 class Translator:
     """DeepL API를 사용한 번역"""
     
-    def __init__(self, config):
+    def __init__(self, config, db=None):
+        # 번역 메모리 (DB가 있으면 같은 원문은 API 호출 없이 재사용)
+        self.memory = TranslationMemory(db) if db else None
+        
+        # 요청 분할 (DeepL 제한: 요청당 텍스트 50개, 본문 128KiB) / 동시 요청 / 재시도
+        translation_config = config.get('translation', {})
+        self.max_texts = translation_config.get('max_texts_per_request', 50)
+        self.max_bytes = translation_config.get('max_request_bytes', 100000)
+        self.max_concurrency = translation_config.get('max_concurrency', 4)
+        self.max_retries = translation_config.get('max_retries', 5)
+        self.backoff_base = translation_config.get('backoff_base', 1.0)
+        
+        # 실제 API로 보낸 문자 수 (요약 번역 효율 측정용)
+        self.lock = threading.Lock()
+        self.stats = {'chars_sent': 0, 'summaries': 0, 'summary_chars': 0, 'summary_chars_sent': 0}
+        
         api_key = config['api_keys'].get('deepl', '')
         if not api_key:
             logger.warning("⚠️ DeepL API 키가 없습니다. 번역 비활성화.")
             self.translator = None
         else:
+            # 클라이언트 자체 재시도(기본 5회)를 끄고 max_retries/backoff_base로만 재시도
+            deepl.http_client.max_network_retries = 0
             self.translator = deepl.Translator(api_key)
+        
+        # 문자 사용량 로컬 집계 (DB가 있을 때, 사용량 API는 가끔만 호출)
+        self.budget = TranslationBudget(config, db, self.translator) if db else None
+        if self.translator:
+            if self.budget:
+                self.budget.maybe_sync(force=True)
             self._check_usage()
     
     def _check_usage(self):
         """API 사용량 확인"""
         try:
-            usage = self.translator.get_usage()
-            used = usage.character.count
-            limit = usage.character.limit
+            usage = self.get_usage()
+            used = usage['used']
+            limit = usage['limit']
             percent = (used / limit) * 100
             logger.info(f"📊 DeepL 사용량: {used:,} / {limit:,} ({percent:.1f}%)")
         except Exception as e:
@@ -32,44 +93,126 @@ class Translator:
     
     def translate_title(self, title):
         """제목을 한글로 번역"""
-        if not self.translator:
-            return title
-        
-        try:
-            result = self.translator.translate_text(
-                title,
-                source_lang="EN",
-                target_lang="KO"
-            )
-            return result.text
-        except Exception as e:
-            logger.error(f"번역 실패: {e}")
-            return title
+        return self.translate_batch([title])[0]
     
     def translate_batch(self, titles):
-        """여러 제목을 한 번에 번역 (API 호출 최소화)"""
+        """여러 제목을 한 번에 번역 (API 호출 최소화), 실패한 제목은 원문 그대로"""
         if not self.translator:
             return titles
         
-        if not titles:
-            return []
+        translated = self.translate_many(titles)
+        return [translated.get(t, t) for t in titles]
+    
+    def translate_many(self, texts):
+        """번역 성공한 원문만 {원문: 번역문}으로 반환 (실패분은 다음에 재시도할 수 있도록 제외)"""
+        if not self.translator or not texts:
+            return {}
         
-        try:
-            results = self.translator.translate_text(
-                titles,
-                source_lang="EN",
-                target_lang="KO"
-            )
-            return [r.text for r in results]
-        except Exception as e:
-            logger.error(f"배치 번역 실패: {e}")
-            return titles
+        # 번역 메모리에 없는 원문만 (중복 제거 후) API로
+        translated = self.memory.lookup(texts, SOURCE_LANG, TARGET_LANG) if self.memory else {}
+        misses = list(dict.fromkeys(t for t in texts if t not in translated))
+        if not misses:
+            return translated
+        
+        chunks = list(self._chunks(misses))
+        failed = 0
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as pool:
+            futures = {pool.submit(self._translate_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    new = future.result()
+                except Exception as e:
+                    failed += len(futures[future])
+                    logger.error(f"번역 실패 ({len(futures[future])}개): {e}")
+                    continue
+                translated.update(new)
+                if self.memory:
+                    self.memory.store(new, SOURCE_LANG, TARGET_LANG)
+                chars = sum(len(text) for text in futures[future])
+                with self.lock:
+                    self.stats['chars_sent'] += chars
+                if self.budget:
+                    self.budget.record(chars)
+        
+        logger.debug(
+            f"번역: {len(misses)}개 API 요청 ({len(chunks)}개 요청으로 분할, 실패 {failed}개)"
+        )
+        return translated
+    
+    def _chunks(self, texts):
+        """요청당 텍스트 수/본문 크기 제한에 맞게 분할"""
+        chunk, size = [], 0
+        for text in texts:
+            length = len(text.encode('utf-8'))
+            if chunk and (len(chunk) >= self.max_texts or size + length > self.max_bytes):
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(text)
+            size += length
+        if chunk:
+            yield chunk
+    
+    def _translate_chunk(self, chunk):
+        """요청 하나 번역 (429/5xx는 지수 백오프 + 지터로 재시도)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                results = self.translator.translate_text(
+                    chunk,
+                    source_lang=SOURCE_LANG,
+                    target_lang=TARGET_LANG
+                )
+                return dict(zip(chunk, (r.text for r in results)))
+            except deepl.DeepLException as e:
+                if attempt == self.max_retries or not _retryable(e):
+                    raise
+                delay = self.backoff_base * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(f"⏳ DeepL 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {e}")
+                time.sleep(delay)
+    
+    def translate_summaries(self, summaries):
+        """요약 목록 번역 → {원문 요약: 번역 요약} (모든 문장이 번역된 요약만)
+        
+        문장 단위로 나눠 번역 메모리를 거치므로 반복되는 문장(구독 안내 등)은 한 번만 비용 발생
+        """
+        if not self.translator or not summaries:
+            return {}
+        
+        sentences = {summary: split_sentences(summary) for summary in summaries}
+        sent_before = self.stats['chars_sent']
+        translated = self.translate_many(
+            list(dict.fromkeys(s for parts in sentences.values() for s in parts))
+        )
+        
+        results = {
+            summary: ' '.join(translated[s] for s in parts)
+            for summary, parts in sentences.items()
+            if parts and all(s in translated for s in parts)
+        }
+        with self.lock:
+            self.stats['summaries'] += len(results)
+            self.stats['summary_chars'] += sum(len(summary) for summary in results)
+            self.stats['summary_chars_sent'] += self.stats['chars_sent'] - sent_before
+        return results
+    
+    def get_memory_stats(self):
+        """번역 메모리 적중 통계 (없으면 None)"""
+        if not self.memory:
+            return None
+        return dict(self.memory.stats, hit_rate=self.memory.hit_rate())
+    
+    def score_cutoff(self):
+        """할당량 예측에 따른 번역 최소 점수 (제한 없으면 0)"""
+        return self.budget.score_cutoff() if self.budget else 0
     
     def get_usage(self):
-        """현재 사용량 반환"""
+        """현재 사용량 반환 (로컬 집계가 있으면 네트워크 호출 없이)"""
         if not self.translator:
             return None
         
+        if self.budget:
+            self.budget.maybe_sync()
+            return self.budget.usage()
+        
         try:
             usage = self.translator.get_usage()
             return {
@@ -23,6 +23,11 @@ class WikipediaMonitor:
         }
         logger.info(f"Wikipedia 모니터 초기화: {len(self.target_pages)}개 페이지")
     
+    def set_pages(self, pages):
+        """감시 페이지 교체 (스트림 연결은 유지)"""
+        self.target_pages = {page['title']: page for page in pages}
+        logger.info(f"🔄 Wikipedia 감시 페이지 갱신: {len(self.target_pages)}개")
+    
     def start_realtime_monitoring(self):
         """실시간 모니터링 시작 (자동 재연결)"""
         logger.info("🔴 Wikipedia 실시간 모니터링 시작...")
@@ -56,12 +61,13 @@ class WikipediaMonitor:
                     title = data.get('title', '')
                     
                     # 관심 페이지인지 확인
-                    if title in self.target_pages:
-                        self.handle_page_change(data)
+                    page_info = self.target_pages.get(title)
+                    if page_info:
+                        self.handle_page_change(data, page_info)
         except Exception as e:
             logger.debug(f"이벤트 파싱 오류: {e}")
     
-    def handle_page_change(self, data):
+    def handle_page_change(self, data, page_info=None):
         """페이지 변경 처리"""
         title = data['title']
         revid = data.get('revision', {}).get('new')
@@ -70,7 +76,7 @@ class WikipediaMonitor:
         comment = data.get('comment', '')
         size_change = data.get('length', {}).get('new', 0) - data.get('length', {}).get('old', 0)
         
-        page_info = self.target_pages[title]
+        page_info = page_info or self.target_pages[title]
         
         # 로그 출력
         logger.info(f"\n🚨 [{title}] 업데이트 감지!")
@@ -86,13 +92,12 @@ class WikipediaMonitor:
     def save_change(self, title, revid, timestamp, user, comment, size_change):
         """변경사항 저장"""
         try:
-            cursor = self.db.conn.cursor()
-            cursor.execute('''
-                INSERT INTO wiki_changes 
-                (page_title, revision_id, timestamp, editor, comment, size_change)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (title, revid, timestamp, user, comment, size_change))
-            self.db.conn.commit()
+            with self.db.write() as cursor:
+                cursor.execute('''
+                    INSERT INTO wiki_changes 
+                    (page_title, revision_id, timestamp, editor, comment, size_change)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (title, revid, timestamp, user, comment, size_change))
             logger.info(f"   💾 DB 저장 완료")
         except Exception as e:
             logger.error(f"저장 오류: {e}")